@@ -1,6 +1,11 @@
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.forms import ModelMultipleChoiceField
+from django.forms.models import ModelChoiceIterator
+from django.utils import translation
 
 import xadmin
 from account.models import MyGroup, MyUser, MyPermission, WorkType, WageType, AttendanceShift, Position, DepartureType
@@ -18,7 +23,50 @@ def get_permission_name(p):
         return p.name
 
 
+# [(pk, 权限名称), ...] 按语言存放在 django 缓存中, 权限或模型类型变化时更新版本号;
+# 缓存不在进程间共享时 (LocMemCache), 其他进程最多在 PERMISSION_CHOICES_TIMEOUT 秒后更新
+PERMISSION_CHOICES_VERSION_KEY = 'account_permission_choices_version'
+PERMISSION_CHOICES_TIMEOUT = 300
+
+
+def get_permission_choices():
+    version = cache.get(PERMISSION_CHOICES_VERSION_KEY, 0)
+    key = 'account_permission_choices_%s_%s' % (version, translation.get_language())
+    choices = cache.get(key)
+    if choices is None:
+        choices = [(p.pk, get_permission_name(p)) for p in MyPermission.objects.select_related('content_type')]
+        cache.set(key, choices, PERMISSION_CHOICES_TIMEOUT)
+    return choices
+
+
+def clear_permission_choices(sender, **kwargs):
+    try:
+        cache.incr(PERMISSION_CHOICES_VERSION_KEY)
+    except ValueError:
+        cache.set(PERMISSION_CHOICES_VERSION_KEY, 1, None)
+
+
+for sender in (MyPermission, ContentType):
+    post_save.connect(clear_permission_choices, sender=sender, dispatch_uid='account_permission_choices_save')
+    post_delete.connect(clear_permission_choices, sender=sender, dispatch_uid='account_permission_choices_delete')
+
+
+class PermissionChoiceIterator(ModelChoiceIterator):
+
+    def __iter__(self):
+        # 没有过滤条件时使用缓存的 (pk, 名称) 列表, 不再逐个查询 content_type
+        if self.queryset.query.where or self.field.to_field_name:
+            for choice in super(PermissionChoiceIterator, self).__iter__():
+                yield choice
+            return
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for choice in get_permission_choices():
+            yield choice
+
+
 class PermissionModelMultipleChoiceField(ModelMultipleChoiceField):
+    iterator = PermissionChoiceIterator
 
     def label_from_instance(self, p):
         return get_permission_name(p)
@@ -40,11 +88,17 @@ class MyUserAdmin(object):
     search_fields = ('username', 'email', 'name')
     ordering = ('username',)
     style_fields = {
-        'user_permissions': 'm2m_transfer',
+        # 权限数量多, 可选项按页从服务器加载
+        'user_permissions': 'm2m_transfer_ajax',
         'groups': 'm2m_transfer',
     }
     model_icon = 'fa fa-user'
+    show_object_history = True
     relfield_style = 'fk-ajax'
+    # 表格编辑模式 (?_grid=1) 下可批量修改的列
+    list_grid_editable = ('position', 'gender', 'wage_type', 'attendance_shift')
+    # 关联字段的搜索框按姓名或用户名前缀查询
+    autocomplete_fields = ('name', 'username')
     readonly_fields = ('operator_time', 'operator_last_time', 'last_login', 'operator', 'operator_last',)
     EMPTY_CHANGELIST_VALUE = ''
 
@@ -52,6 +106,7 @@ class MyUserAdmin(object):
         attrs = super(MyUserAdmin, self).get_field_attrs(db_field, **kwargs)
         if db_field.name == 'user_permissions':
             attrs['form_class'] = PermissionModelMultipleChoiceField
+            attrs['queryset'] = MyPermission.objects.select_related('content_type')
 
         if db_field.name == 'groups':
             attrs['form_class'] = GroupModelMultipleChoiceField
@@ -116,10 +171,24 @@ class MyUserAdmin(object):
 
         obj.save()
 
+    def prepare_grid_obj(self, obj, fields):
+        """
+        表格编辑批量保存时同样记录最后操作者
+        """
+        obj.operator_last = self.user
+        return super(MyUserAdmin, self).prepare_grid_obj(obj, fields) + ['operator_last']
+
 
 class MyGroupAdmin(GroupAdmin):
     model_icon = 'fa fa-cog'
 
+    def get_field_attrs(self, db_field, **kwargs):
+        attrs = super(MyGroupAdmin, self).get_field_attrs(db_field, **kwargs)
+        if db_field.name == 'permissions':
+            attrs['form_class'] = PermissionModelMultipleChoiceField
+            attrs['queryset'] = MyPermission.objects.select_related('content_type')
+        return attrs
+
 
 class MyPermissionAdmin(PermissionAdmin):
     model_icon = 'fa fa-cog'
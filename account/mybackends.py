@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from rules.permissions import has_perm as rules_has_perm, perm_exists
 
 from account.models import MyPermission
 
@@ -8,6 +9,11 @@ UserModel = get_user_model()
 class MyModelBackend:
     """
     Authenticates against settings.AUTH_USER_MODEL.
+
+    Permissions are looked up in the cached permission set of the user
+    first; ``rules`` predicates are only evaluated for permissions that
+    have a rule, and their results are cached on the user object, which
+    lives as long as the request.
     """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
@@ -82,8 +88,24 @@ class MyModelBackend:
             }
         return user_obj._perm_cache
 
+    def has_rule_perm(self, user_obj, perm, obj=None):
+        """
+        Return the result of the ``rules`` predicate of `perm` for `obj`,
+        cached per (perm, object) on `user_obj`.
+        """
+        if not perm_exists(perm):
+            return False
+        if not hasattr(user_obj, '_rules_perm_cache'):
+            user_obj._rules_perm_cache = {}
+        key = (perm, None, None) if obj is None else (perm, obj.__class__, obj.pk)
+        if key not in user_obj._rules_perm_cache:
+            user_obj._rules_perm_cache[key] = rules_has_perm(perm, user_obj, obj)
+        return user_obj._rules_perm_cache[key]
+
     def has_perm(self, user_obj, perm, obj=None):
-        return user_obj.is_active and perm in self.get_all_permissions(user_obj, obj)
+        if user_obj.is_active and perm in self.get_all_permissions(user_obj, obj):
+            return True
+        return self.has_rule_perm(user_obj, perm, obj)
 
     def has_module_perms(self, user_obj, app_label):
         """
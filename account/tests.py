@@ -1,3 +1,265 @@
-from django.test import TestCase
+import datetime
+import functools
+import json
+import os
+import re
+import shutil
+import stat
+import tempfile
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from importlib import import_module
 
-# Create your tests here.
+import rules
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, TestCase
+from django.utils.html import escape
+
+from account.admin import PermissionModelMultipleChoiceField, clear_permission_choices, get_permission_name
+from account.models import MyGroup, MyPermission, MyUser, Position, WorkType
+from xadmin import archive, site
+from xadmin.models import Log, LogArchive
+from xadmin.plugins.themes import load_theme_catalog, refresh_theme_catalog
+from xadmin.views import ListAdminView
+
+
+class PermissionChoicesTests(TestCase):
+
+    def setUp(self):
+        clear_permission_choices(None)
+        content_type = ContentType.objects.get_for_model(MyGroup)
+        for codename in ('add_mygroup_x', 'change_mygroup_x', 'view_mygroup_x'):
+            MyPermission.objects.get_or_create(codename=codename, content_type=content_type,
+                                               defaults={'name': codename})
+
+    def test_choices_query_count(self):
+        field = PermissionModelMultipleChoiceField(MyPermission.objects.all())
+        with self.assertNumQueries(1):
+            choices = list(field.choices)
+        self.assertEqual(choices, [(p.pk, get_permission_name(p))
+                                   for p in MyPermission.objects.select_related('content_type')])
+        with self.assertNumQueries(0):
+            self.assertEqual(list(field.choices), choices)
+
+    def test_choices_invalidated(self):
+        field = PermissionModelMultipleChoiceField(MyPermission.objects.all())
+        list(field.choices)
+        permission = MyPermission.objects.create(
+            codename='delete_mygroup_x', name='delete', content_type=ContentType.objects.get_for_model(MyGroup))
+        with self.assertNumQueries(1):
+            self.assertIn((permission.pk, get_permission_name(permission)), list(field.choices))
+
+
+class ListActionTests(TestCase):
+
+    def setUp(self):
+        self.user = MyUser.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.user)
+
+    def test_delete_selected(self):
+        work_types = [WorkType.objects.create(name=name) for name in ('a', 'b', 'c')]
+        response = self.client.post('/admin/account/worktype/', {
+            'action': 'delete_selected',
+            '_selected_action': [work_types[0].pk, work_types[1].pk],
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(WorkType.objects.values_list('name', flat=True)), ['c'])
+
+
+@rules.predicate
+def is_unlocked(user, work_type):
+    return work_type is None or work_type.name != 'locked'
+
+
+class DeletePermissionTests(TestCase):
+    """
+    Object level delete rules are checked against the object being deleted.
+    """
+
+    def setUp(self):
+        rules.add_perm('account.view_worktype', rules.is_staff)
+        rules.add_perm('account.delete_worktype', rules.is_staff & is_unlocked)
+        self.addCleanup(rules.remove_perm, 'account.view_worktype')
+        self.addCleanup(rules.remove_perm, 'account.delete_worktype')
+        self.user = MyUser.objects.create_user('staff', password='password', is_staff=True)
+        self.client.force_login(self.user)
+
+    def test_rule_denies_delete(self):
+        locked = WorkType.objects.create(name='locked')
+        response = self.client.post('/admin/account/worktype/%s/delete/' % locked.pk, {'post': 'yes'})
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(WorkType.objects.filter(pk=locked.pk).exists())
+
+    def test_rule_allows_delete_selected(self):
+        WorkType.objects.create(name='locked')
+        other = WorkType.objects.create(name='other')
+        response = self.client.post('/admin/account/worktype/', {
+            'action': 'delete_selected',
+            '_selected_action': [other.pk],
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(list(WorkType.objects.values_list('name', flat=True)), ['locked'])
+
+
+def bold_username(obj):
+    return '<b>%s</b>' % escape(obj.username)
+bold_username.allow_tags = True
+bold_username.short_description = 'bold username'
+
+
+def plain_username(obj):
+    return '<b>%s</b>' % obj.username
+plain_username.short_description = 'plain username'
+
+
+class ResultRowsRendererTests(TestCase):
+    """
+    ``render_result_rows()`` (list_fast_renderer) renders the table body of
+    ``views/model_list.html``.
+    """
+    list_display = ('username', 'name', 'is_staff', 'gender', 'position', 'groups', 'birth',
+                    'operator_last_time', bold_username, plain_username)
+    list_editable = ('name', 'gender', 'position')
+
+    def setUp(self):
+        self.user = MyUser.objects.create_superuser('admin', 'admin@example.com', 'password')
+        position = Position.objects.create(name='<worker>')
+        group = MyGroup.objects.create(name='group & co')
+        MyUser.objects.create_user('empty')
+        full = MyUser.objects.create_user(
+            'full<&>', name='"quoted" <name>', is_staff=True, gender='F', position=position,
+            birth=datetime.date(1990, 1, 31))
+        full.groups.add(group)
+        MyUser.objects.create_user('male', gender='M', is_staff=False)
+
+    def render_table_body(self, fast_renderer):
+        view_class = site.get_view_class(ListAdminView, site._registry[MyUser])
+        view = type(view_class.__name__, (view_class,), {
+            'list_display': self.list_display, 'list_editable': self.list_editable,
+            'list_fast_renderer': fast_renderer}).as_view()
+        request = RequestFactory().get('/')
+        request.user = self.user
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        request._messages = FallbackStorage(request)
+        response = view(request)
+        response.render()
+        self.assertEqual(response.status_code, 200)
+        body = re.search(r'<tbody>(.*?)</tbody>', response.content.decode(response.charset), re.S).group(1)
+        # the renderers only differ by the whitespace between the tags.
+        return re.sub(r'\s*(<|>)\s*', r'\1', re.sub(r'\s+', ' ', body)).strip()
+
+    def test_fast_renderer_matches_template(self):
+        template_body = self.render_table_body(False)
+        fast_body = self.render_table_body(True)
+        self.assertEqual(fast_body, template_body)
+        self.assertEqual(template_body.count('<tr'), MyUser.objects.count())
+
+    def test_escaping(self):
+        fast_body = self.render_table_body(True)
+        self.assertIn('<b>full&lt;&amp;&gt;</b>', fast_body)
+        self.assertIn('&lt;b&gt;full&lt;&amp;&gt;&lt;/b&gt;', fast_body)
+        self.assertIn('&quot;quoted&quot; &lt;name&gt;', fast_body)
+        self.assertNotIn('<worker>', fast_body)
+        self.assertIn('editable-handler', fast_body)
+        self.assertIn('_selected_action', fast_body)
+
+
+class AjaxListCursorTests(TestCase):
+
+    def setUp(self):
+        self.user = MyUser.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.user)
+
+    def test_cursor_pages_sub_millisecond_timestamps(self):
+        # pairs of entries 100 microseconds apart, more than two pages of them.
+        base = datetime.datetime(2020, 1, 1, 12, 0, 0)
+        Log.objects.bulk_create([
+            Log(user=self.user, action_time=base + datetime.timedelta(microseconds=(i // 2) * 100),
+                object_repr='', action_flag='change') for i in range(120)])
+        expected = list(Log.objects.order_by('-action_time', '-pk').values_list('pk', flat=True))
+
+        params = {'_ajax': '1', '_values': '1', '_fields': 'id'}
+        ids = []
+        for page in range(10):
+            data = self.client.get('/admin/xadmin/log/', params).json()
+            ids.extend(o['id'] for o in data['objects'])
+            if 'next_cursor' not in data:
+                break
+            params['_cursor'] = data['next_cursor']
+        self.assertEqual(ids, expected)
+
+
+class LogArchiveRestoreTests(TestCase):
+
+    def setUp(self):
+        self.user = MyUser.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def create_logs(self, count):
+        return [Log.objects.create(user=self.user, action_time=datetime.datetime(2020, 1, 2 + i, 12, 0),
+                                   object_repr='', action_flag='change') for i in range(count)]
+
+    def test_restore_loads_each_entry_once(self):
+        logs = self.create_logs(3)
+        # a run that wrote the month file and failed before the delete.
+        archive._write_file('2020-01', logs, self.path)
+        self.assertEqual(archive.archive_logs(0, 'file', self.path), {'2020-01': 3})
+        self.assertEqual(archive.restore_month('2020-01', self.path), 3)
+        self.assertEqual(sorted(LogArchive.objects.values_list('log_id', flat=True)),
+                         sorted(log.pk for log in logs))
+
+        later = self.create_logs(1)[0]
+        archive.archive_logs(0, 'file', self.path)
+        self.assertEqual(archive.restore_month('2020-01', self.path), 1)
+        self.assertTrue(LogArchive.objects.filter(log_id=later.pk).exists())
+        self.assertEqual(archive.restore_month('2020-01', self.path), 0)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThemeCatalogTests(TestCase):
+    """
+    ``refresh_theme_catalog`` against a local server serving a bootswatch
+    style ``themes.json``.
+    """
+    themes = {'themes': [
+        {'name': 'Cerulean', 'description': 'A calm blue sky', 'cssMin': 'http://example.com/cerulean.min.css',
+         'thumbnail': 'http://example.com/cerulean.png', 'preview': 'http://example.com/cerulean/'},
+        {'name': 'Darkly', 'description': 'Flatly in night mode', 'cssMin': 'http://example.com/darkly.min.css',
+         'thumbnail': 'http://example.com/darkly.png', 'preview': 'http://example.com/darkly/'},
+    ]}
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        served = os.path.join(self.path, 'served')
+        os.mkdir(served)
+        with open(os.path.join(served, 'themes.json'), 'w') as f:
+            json.dump(self.themes, f)
+        server = HTTPServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=served))
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.url = 'http://127.0.0.1:%s/themes.json' % server.server_port
+
+    def test_refresh_writes_readable_catalog(self):
+        catalog = os.path.join(self.path, 'xadmin_themes.json')
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+
+        themes = refresh_theme_catalog(self.url, catalog, timeout=5)
+        self.assertEqual([t['name'] for t in themes], ['Cerulean', 'Darkly'])
+        self.assertEqual(themes[0]['css'], 'http://example.com/cerulean.min.css')
+        self.assertEqual(stat.S_IMODE(os.stat(catalog).st_mode), 0o644)
+        self.assertEqual(load_theme_catalog(catalog), themes)
+        self.assertEqual([name for name in os.listdir(self.path) if name.endswith('.tmp')], [])
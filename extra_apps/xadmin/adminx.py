@@ -5,9 +5,16 @@ from __future__ import absolute_import
 import xadmin
 from account.models import MyUser
 from xadmin.views import CommAdminView
-from .models import UserSettings, Log
+from xadmin.views.base import csrf_protect_m
+from .models import UserSettings, Log, LogArchive
+from xadmin import archive
 from xadmin.layout import *
 
+import os
+
+from django.http import HttpResponseRedirect
+from django.middleware.csrf import get_token
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import ugettext_lazy as _, ugettext
 
 
@@ -40,10 +47,69 @@ class LogAdmin(object):
     search_fields = ['ip_addr', 'message']
     model_icon = 'fa fa-cog'
 
+    def block_nav_btns(self, context, nodes):
+        months = archive.archived_months()
+        if not months:
+            return
+        archive_url = self.get_model_url(LogArchive, 'changelist')
+        nodes.append(format_html(
+            '<div class="btn-group"><a class="dropdown-toggle btn btn-default" data-toggle="dropdown" href="#">'
+            '<i class="fa fa-archive"></i> {0} <span class="caret"></span></a>'
+            '<ul class="dropdown-menu" role="menu">{1}</ul></div>',
+            ugettext('Archived Logs'),
+            format_html_join('', '<li><a href="{0}?_p_archive_month__exact={1}">{1}</a></li>',
+                             ((archive_url, month) for month in months))))
+
 
 xadmin.site.register(Log, LogAdmin)
 
 
+class LogArchiveAdmin(LogAdmin):
+    list_display = ('action_time', 'user', 'ip_addr', '__str__', 'link')
+    list_filter = ['archive_month', 'user', 'action_time']
+    search_fields = ['ip_addr', 'message']
+    model_icon = 'fa fa-archive'
+    hidden_menu = True
+
+    remove_permissions = ['add', 'change']
+
+    def get_restorable_month(self, month):
+        # a month kept as a file, loading it again adds the entries archived since.
+        if month and archive.get_storage() == 'file' and archive.MONTH_RE.match(month) and \
+                os.path.exists(archive.archive_path(month)):
+            return month
+        return None
+
+    @csrf_protect_m
+    def post(self, request, *args, **kwargs):
+        if '_restore_month' not in request.POST:
+            # the option class is merged into every view of the model, not all of them take posts.
+            post = getattr(super(LogArchiveAdmin, self), 'post', None)
+            if post is None:
+                return self.http_method_not_allowed(request, *args, **kwargs)
+            return post(request, *args, **kwargs)
+        month = self.get_restorable_month(request.POST['_restore_month'])
+        if month:
+            count = archive.restore_month(month)
+            self.message_user(ugettext('Loaded %(count)d archived log entries of %(month)s.') % {
+                'count': count, 'month': month}, 'success')
+        return HttpResponseRedirect(request.get_full_path())
+
+    def block_nav_btns(self, context, nodes):
+        month = self.get_restorable_month(self.request.GET.get('_p_archive_month__exact'))
+        if month:
+            nodes.append(format_html(
+                '<form method="post" class="btn-group" action="{0}">'
+                '<input type="hidden" name="csrfmiddlewaretoken" value="{1}"/>'
+                '<input type="hidden" name="_restore_month" value="{2}"/>'
+                '<button type="submit" class="btn btn-default"><i class="fa fa-archive"></i> {3}</button></form>',
+                self.request.get_full_path(), get_token(self.request), month,
+                ugettext('Load archived month %s') % month))
+
+
+xadmin.site.register(LogArchive, LogArchiveAdmin)
+
+
 class GlobalSettings(object):
     site_title = "后台管理系统"
     site_footer = "Copyright @2016-2017 后台管理系统 All Rights Reserved"
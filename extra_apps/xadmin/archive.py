@@ -0,0 +1,188 @@
+"""
+Retention for ``xadmin.models.Log``.
+
+Entries older than the retention window are moved out of the hot ``Log``
+table, month by month, either into the ``LogArchive`` table or into gzip
+compressed JSON-lines files (one ``log-YYYY-MM.jsonl.gz`` per month). File
+archived months can be loaded back into ``LogArchive`` with the load button
+of the archive list (a POST) or ``archive_logs --restore YYYY-MM``.
+
+A month file is appended to before the batch is deleted from the hot table,
+so a run that fails after the write leaves entries that the next run writes
+again. Loading a month skips the entries already in ``LogArchive`` (by the
+id they had in ``Log``), which also makes loading a month again pick up only
+the entries archived since.
+
+Settings:
+
+``XADMIN_LOG_RETENTION_MONTHS``
+    Number of full months kept in the hot table, default ``6``.
+``XADMIN_LOG_ARCHIVE_STORAGE``
+    ``'table'`` (default) or ``'file'``.
+``XADMIN_LOG_ARCHIVE_DIR``
+    Directory of the monthly files when the storage is ``'file'``.
+"""
+import datetime
+import gzip
+import json
+import os
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from xadmin.models import Log, LogArchive, make_object_ref
+
+LOG_FIELDS = ('id', 'action_time', 'user_id', 'ip_addr', 'content_type_id',
+              'object_id', 'object_ref', 'object_repr', 'action_flag', 'message')
+ARCHIVE_FILE_RE = re.compile(r'^log-(\d{4}-\d{2})\.jsonl\.gz$')
+MONTH_RE = re.compile(r'^\d{4}-\d{2}$')
+
+
+def get_retention_months():
+    return int(getattr(settings, 'XADMIN_LOG_RETENTION_MONTHS', 6))
+
+
+def get_storage():
+    return getattr(settings, 'XADMIN_LOG_ARCHIVE_STORAGE', 'table')
+
+
+def get_archive_dir():
+    return getattr(settings, 'XADMIN_LOG_ARCHIVE_DIR', None)
+
+
+def month_key(value):
+    return '%04d-%02d' % (value.year, value.month)
+
+
+def retention_cutoff(months, now=None):
+    """
+    First instant of the oldest month that is kept. Everything before it is
+    archived, so whole months always move together.
+    """
+    now = now or timezone.now()
+    index = now.year * 12 + now.month - 1 - months
+    cutoff = datetime.datetime(index // 12, index % 12 + 1, 1)
+    if settings.USE_TZ:
+        cutoff = timezone.make_aware(cutoff)
+    return cutoff
+
+
+def archive_path(month, path=None):
+    path = path or get_archive_dir()
+    if not path:
+        raise ImproperlyConfigured(
+            "XADMIN_LOG_ARCHIVE_DIR must be set to archive logs to files.")
+    return os.path.join(path, 'log-%s.jsonl.gz' % month)
+
+
+def archived_months(path=None):
+    """
+    Months available in the archive, newest first, from both the table and
+    the file storage.
+    """
+    months = set(LogArchive.objects.values_list('archive_month', flat=True).distinct())
+    path = path or get_archive_dir()
+    if path and os.path.isdir(path):
+        for name in os.listdir(path):
+            match = ARCHIVE_FILE_RE.match(name)
+            if match:
+                months.add(match.group(1))
+    return sorted(months, reverse=True)
+
+
+def _to_row(log):
+    row = dict((f, getattr(log, f)) for f in LOG_FIELDS)
+    row['action_time'] = row['action_time'].isoformat()
+    return row
+
+
+def _write_file(month, logs, path):
+    filename = archive_path(month, path)
+    if not os.path.isdir(os.path.dirname(filename)):
+        os.makedirs(os.path.dirname(filename))
+    # appending writes a new gzip member, which readers handle transparently.
+    with gzip.open(filename, 'at', encoding='utf-8') as f:
+        for log in logs:
+            f.write(json.dumps(_to_row(log), ensure_ascii=False))
+            f.write('\n')
+
+
+def _write_table(month, logs):
+    LogArchive.objects.bulk_create([
+        LogArchive(archive_month=month, log_id=log.id,
+                   **dict((f, getattr(log, f)) for f in LOG_FIELDS if f != 'id'))
+        for log in logs])
+
+
+def archive_logs(months=None, storage=None, path=None, batch_size=1000):
+    """
+    Move log entries older than ``months`` full months out of the hot table.
+    Returns a dict mapping each archived month to the number of entries moved.
+    """
+    months = get_retention_months() if months is None else months
+    storage = storage or get_storage()
+    if storage not in ('table', 'file'):
+        raise ImproperlyConfigured("Unknown log archive storage: %s" % storage)
+
+    cutoff = retention_cutoff(months)
+    moved = {}
+    while True:
+        with transaction.atomic():
+            logs = list(Log.objects.filter(action_time__lt=cutoff)
+                        .order_by('action_time', 'id')[:batch_size])
+            if not logs:
+                break
+            by_month = {}
+            for log in logs:
+                by_month.setdefault(month_key(log.action_time), []).append(log)
+            for month, items in sorted(by_month.items()):
+                if storage == 'file':
+                    _write_file(month, items, path)
+                else:
+                    _write_table(month, items)
+                moved[month] = moved.get(month, 0) + len(items)
+            Log.objects.filter(pk__in=[log.pk for log in logs]).delete()
+    return moved
+
+
+def restore_month(month, path=None, batch_size=1000):
+    """
+    Load the entries of a file archived month that are not in ``LogArchive``
+    yet, so they can be browsed from the admin. Returns the number of entries
+    loaded.
+    """
+    if not MONTH_RE.match(month or ''):
+        raise ValueError("Archive month must be formatted as YYYY-MM: %r" % month)
+    filename = archive_path(month, path)
+    if not os.path.exists(filename):
+        return 0
+
+    count = 0
+    with transaction.atomic():
+        loaded = set(LogArchive.objects.filter(archive_month=month, log_id__isnull=False)
+                     .values_list('log_id', flat=True))
+        batch = []
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                log_id = row.pop('id', None)
+                if log_id in loaded:
+                    continue
+                loaded.add(log_id)
+                row['action_time'] = parse_datetime(row['action_time'])
+                row['object_ref'] = make_object_ref(row.get('object_id'))
+                batch.append(LogArchive(archive_month=month, log_id=log_id, **row))
+                if len(batch) >= batch_size:
+                    LogArchive.objects.bulk_create(batch)
+                    count += len(batch)
+                    batch = []
+        if batch:
+            LogArchive.objects.bulk_create(batch)
+            count += len(batch)
+    return count
@@ -0,0 +1,229 @@
+"""
+Precomputed media bundles.
+
+Views assemble their ``Media`` from the plugins of the request, so a list
+page pulls a dozen separate files. ``build_media_bundles`` concatenates
+(and minifies, when ``rjsmin``/``rcssmin`` are installed) the local files of
+every recorded media combination into content-hashed bundles, and writes a
+manifest mapping each combination to its bundles. ``bundle_media`` swaps a
+view media for its bundled equivalent with one dict lookup.
+
+Settings:
+
+``XADMIN_MEDIA_BUNDLES``
+    Serve bundles, default: the manifest exists and ``DEBUG`` is off.
+``XADMIN_MEDIA_BUNDLE_MANIFEST``
+    Manifest file, default ``BASE_DIR/xadmin_bundles.json``.
+``XADMIN_MEDIA_BUNDLE_RECORD``
+    When set, every new media combination is appended to this file, which
+    is the input of ``build_media_bundles``.
+``XADMIN_MEDIA_BUNDLE_ROOT``
+    Directory the bundles are written to, default ``STATIC_ROOT``. Build
+    the bundles after ``collectstatic`` (``--clear`` removes them).
+
+Only the bundling is looked up: the view still assembles its media from the
+plugins first, since the media of a form depends on its widgets and not only
+on the view and plugin classes.
+"""
+import hashlib
+import os
+import posixpath
+import re
+import threading
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+from django.forms import Media
+
+from xadmin.util import json, static
+
+BUNDLE_DIR = 'xadmin/bundles'
+CSS_URL_RE = re.compile(r'''url\((['"]?)(?!data:|https?:|//|/|#)([^'")]+)\1\)''')
+
+_enabled = None
+_manifest = None
+_bundled = {}
+_recorded = set()
+_record_lock = threading.Lock()
+
+
+def get_manifest_path():
+    return getattr(settings, 'XADMIN_MEDIA_BUNDLE_MANIFEST',
+                   os.path.join(getattr(settings, 'BASE_DIR', ''), 'xadmin_bundles.json'))
+
+
+def get_record_path():
+    return getattr(settings, 'XADMIN_MEDIA_BUNDLE_RECORD', None)
+
+
+def get_bundle_root():
+    return getattr(settings, 'XADMIN_MEDIA_BUNDLE_ROOT', None) or settings.STATIC_ROOT
+
+
+def bundles_enabled():
+    global _enabled
+    if _enabled is None:
+        _enabled = getattr(settings, 'XADMIN_MEDIA_BUNDLES', None)
+        if _enabled is None:
+            _enabled = not settings.DEBUG and os.path.exists(get_manifest_path())
+    return _enabled
+
+
+def get_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(get_manifest_path(), 'rb') as f:
+                _manifest = json.loads(f.read().decode('utf-8'))
+        except (IOError, ValueError):
+            _manifest = {'js': {}, 'css': {}}
+    return _manifest
+
+
+def media_key(paths):
+    return '\n'.join(paths)
+
+
+def record_media(js, css):
+    path = get_record_path()
+    key = (tuple(js), tuple((medium, tuple(paths)) for medium, paths in sorted(css.items())))
+    if not path or key in _recorded:
+        return
+    with _record_lock:
+        if key in _recorded:
+            return
+        _recorded.add(key)
+        with open(path, 'a') as f:
+            f.write(json.dumps({'js': list(js), 'css': css}) + '\n')
+
+
+def _resolve(paths):
+    return [static(path) if path.startswith(BUNDLE_DIR + '/') else path for path in paths]
+
+
+def bundle_media(media):
+    """
+    Bundled equivalent of ``media``, or ``media`` itself for a combination
+    that has no bundle.
+    """
+    js, css = media._js, media._css
+    record_media(js, css)
+    if not bundles_enabled():
+        return media
+
+    key = (tuple(js), tuple((medium, tuple(paths)) for medium, paths in sorted(css.items())))
+    bundled = _bundled.get(key)
+    if bundled is None:
+        manifest = get_manifest()
+        bundled_js = manifest['js'].get(media_key(js))
+        bundled_css = dict((medium, manifest['css'].get(medium, {}).get(media_key(paths)))
+                           for medium, paths in css.items())
+        if bundled_js is None and not any(bundled_css.values()):
+            bundled = media
+        else:
+            bundled = Media(
+                js=_resolve(bundled_js) if bundled_js is not None else js,
+                css=dict((medium, _resolve(bundled_css[medium]) if bundled_css[medium] is not None else paths)
+                         for medium, paths in css.items()))
+        _bundled[key] = bundled
+    return bundled
+
+
+# build
+
+def find_static(url):
+    """
+    Local file of a static url, or None for files served from elsewhere.
+    """
+    if url.startswith(('http://', 'https://', '//')):
+        return None, None
+    if settings.STATIC_URL and url.startswith(settings.STATIC_URL):
+        url = url[len(settings.STATIC_URL):]
+    path = finders.find(url)
+    return (url, path) if path else (None, None)
+
+
+def _minifier(file_type):
+    try:
+        if file_type == 'js':
+            from rjsmin import jsmin
+            return jsmin
+        from rcssmin import cssmin
+        return cssmin
+    except ImportError:
+        return None
+
+
+def _rewrite_css_urls(content, name):
+    base = posixpath.dirname(name)
+
+    def rewrite(match):
+        quote, url = match.groups()
+        target = posixpath.normpath(posixpath.join(base, url))
+        return 'url(%s%s%s)' % (quote, posixpath.relpath(target, BUNDLE_DIR), quote)
+    return CSS_URL_RE.sub(rewrite, content)
+
+
+def _write_bundle(names, file_type, root):
+    parts = []
+    for name, path in names:
+        with open(path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        if file_type == 'css':
+            content = _rewrite_css_urls(content, name)
+        parts.append(content)
+    content = (';\n' if file_type == 'js' else '\n').join(parts)
+    minify = _minifier(file_type)
+    if minify is not None:
+        content = minify(content)
+    content = content.encode('utf-8')
+
+    bundle = '%s/%s.%s' % (BUNDLE_DIR, hashlib.sha1(content).hexdigest()[:16], file_type)
+    filename = os.path.join(root, *bundle.split('/'))
+    if not os.path.exists(filename):
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        with open(filename, 'wb') as f:
+            f.write(content)
+    return bundle
+
+
+def build_bundle(urls, file_type, root):
+    """
+    Bundle the consecutive local files of ``urls``. Returns the new list of
+    paths, external urls keep their place between the bundles.
+    """
+    output, run = [], []
+    for url in urls:
+        name, path = find_static(url)
+        if path is None:
+            if run:
+                output.append(_write_bundle(run, file_type, root))
+                run = []
+            output.append(url)
+        else:
+            run.append((name, path))
+    if run:
+        output.append(_write_bundle(run, file_type, root))
+    return output
+
+
+def build_bundles(combinations, root=None):
+    """
+    Build the bundles of ``combinations`` (dicts with ``js`` and ``css`` as
+    recorded by ``record_media``) and return the manifest.
+    """
+    root = root or get_bundle_root()
+    if not root:
+        raise ImproperlyConfigured("Set STATIC_ROOT or XADMIN_MEDIA_BUNDLE_ROOT to build the media bundles.")
+    manifest = {'js': {}, 'css': {}}
+    for combination in combinations:
+        js = combination.get('js') or []
+        if js and media_key(js) not in manifest['js']:
+            manifest['js'][media_key(js)] = build_bundle(js, 'js', root)
+        for medium, paths in (combination.get('css') or {}).items():
+            css_manifest = manifest['css'].setdefault(medium, {})
+            if paths and media_key(paths) not in css_manifest:
+                css_manifest[media_key(paths)] = build_bundle(paths, 'css', root)
+    return manifest
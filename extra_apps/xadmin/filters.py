@@ -4,7 +4,6 @@ from django.core.exceptions import ImproperlyConfigured
 from django.utils.encoding import smart_text
 from django.utils.translation import ugettext_lazy as _
 from django.utils import timezone
-from django.template.loader import get_template
 from django.template.context import Context
 from django.utils import six
 from django.utils.safestring import mark_safe
@@ -13,7 +12,7 @@ from django.utils.text import Truncator
 from django.core.cache import cache, caches
 
 from xadmin.views.list import EMPTY_CHANGELIST_VALUE
-from xadmin.util import is_related_field, is_related_field2
+from xadmin.util import is_related_field, is_related_field2, get_template
 import datetime
 
 FILTER_PREFIX = '_p_'
@@ -356,7 +355,7 @@ class RelatedFieldSearchFilter(FieldFilter):
         else:
             self.lookup_title = other_model._meta.verbose_name
         self.title = self.lookup_title
-        self.search_url = model_admin.get_admin_url('%s_%s_changelist' % (
+        self.search_url = model_admin.get_admin_url('%s_%s_autocomplete' % (
             other_model._meta.app_label, other_model._meta.model_name))
         self.label = self.label_for_value(other_model, rel_name, self.lookup_exact_val) if self.lookup_exact_val else ""
         self.choices = '?'
@@ -0,0 +1,214 @@
+"""
+Column formatters of the change list.
+
+``result_item`` used to resolve the field and dispatch on its type for every
+cell. A ``ColumnFormatter`` is picked once per ``list_display`` column and
+formats the values of the whole page in one pass; booleans, choices, dates
+and foreign keys have their own formatter:
+
+- booleans use the three icons rendered once,
+- choices use the choice dict built once,
+- dates and times are localized once per distinct value,
+- foreign keys are labelled once per distinct related pk, and rows pointing
+  to an already seen object reuse it instead of loading it again.
+
+The list view asks ``get_column_formatter(field_name)`` for the formatter of
+a column (a ``filter_hook``, so plugins can provide their own), and
+``ExportPlugin`` takes its values from the same formatters.
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.urls.base import NoReverseMatch
+from django.utils import formats
+from django.utils.encoding import force_text, smart_text
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from xadmin.util import boolean_icon, display_for_field, lookup_field, tz_localtime
+
+LOOKUP_ERRORS = (AttributeError, ObjectDoesNotExist, NoReverseMatch)
+
+
+def empty_value():
+    from xadmin.views.list import EMPTY_CHANGELIST_VALUE
+    return EMPTY_CHANGELIST_VALUE
+
+
+def empty_text():
+    return mark_safe("<span class='text-muted'>%s</span>" % empty_value())
+
+
+class FormattedCell(object):
+    __slots__ = ('field', 'attr', 'value', 'text', 'allow_tags')
+
+    def __init__(self, field, attr, value, text, allow_tags=False):
+        self.field = field
+        self.attr = attr
+        self.value = value
+        self.text = text
+        self.allow_tags = allow_tags
+
+
+class ColumnFormatter(object):
+    """
+    Formatter of a column that is not a model field: a callable, a method of
+    the admin, a model method or property, or a ``rel__field`` path.
+    """
+
+    def __init__(self, admin_view, field_name, field=None):
+        self.admin_view = admin_view
+        self.field_name = field_name
+        self.field = field
+        self._cells = {}
+
+    def lookup(self, obj):
+        return lookup_field(self.field_name, obj, self.admin_view)
+
+    def format_value(self, field, attr, value):
+        """
+        ``(text, allow_tags)`` of a looked up value.
+        """
+        if field is not None:
+            if isinstance(field.remote_field, models.ManyToOneRel):
+                if value is None:
+                    return empty_text(), False
+                return value, False
+            return display_for_field(value, field), False
+        if getattr(attr, 'boolean', False):
+            return boolean_icon(value), True
+        return smart_text(value), getattr(attr, 'allow_tags', False)
+
+    def format(self, obj):
+        try:
+            field, attr, value = self.lookup(obj)
+        except LOOKUP_ERRORS:
+            return FormattedCell(None, None, None, empty_text())
+        text, allow_tags = self.format_value(field, attr, value)
+        return FormattedCell(field, attr, value, text, allow_tags)
+
+    def format_column(self, objs):
+        """
+        Format the cells of ``objs`` in one pass, ``get()`` then returns them.
+        """
+        self._cells = dict((id(obj), self.format(obj)) for obj in objs)
+
+    def get(self, obj):
+        cell = self._cells.get(id(obj))
+        if cell is None:
+            cell = self.format(obj)
+        return cell
+
+    def export_value(self, item):
+        """
+        Value of a list cell in the exported files.
+        """
+        if (item.field is None and getattr(item.attr, 'boolean', False)) or \
+                isinstance(item.field, (models.BooleanField, models.NullBooleanField)):
+            return item.value
+        if item.text == empty_text():
+            return escape(empty_value())
+        return escape(str(item.text))
+
+
+class FieldFormatter(ColumnFormatter):
+    """
+    Formatter of a model field column.
+    """
+
+    def lookup(self, obj):
+        return self.field, None, getattr(obj, self.field_name)
+
+    def format_value(self, field, attr, value):
+        return display_for_field(value, field), False
+
+
+class BooleanFormatter(FieldFormatter):
+
+    def __init__(self, admin_view, field_name, field=None):
+        super(BooleanFormatter, self).__init__(admin_view, field_name, field)
+        self.icons = dict((value, boolean_icon(value)) for value in (True, False, None))
+
+    def format_value(self, field, attr, value):
+        return self.icons[value], False
+
+
+class ChoicesFormatter(FieldFormatter):
+
+    def __init__(self, admin_view, field_name, field=None):
+        super(ChoicesFormatter, self).__init__(admin_view, field_name, field)
+        self.choices = dict(field.flatchoices)
+
+    def format_value(self, field, attr, value):
+        return self.choices.get(value, empty_value()), False
+
+
+class DateFormatter(FieldFormatter):
+
+    def __init__(self, admin_view, field_name, field=None):
+        super(DateFormatter, self).__init__(admin_view, field_name, field)
+        self.localtime = isinstance(field, models.DateTimeField)
+        self._texts = {}
+
+    def format_value(self, field, attr, value):
+        if value is None:
+            return empty_value(), False
+        try:
+            return self._texts[value], False
+        except KeyError:
+            text = formats.localize(tz_localtime(value) if self.localtime else value)
+            self._texts[value] = text
+            return text, False
+
+
+class ForeignKeyFormatter(FieldFormatter):
+
+    def __init__(self, admin_view, field_name, field=None):
+        super(ForeignKeyFormatter, self).__init__(admin_view, field_name, field)
+        # related pk -> (related object, label)
+        self._related = {}
+
+    def lookup(self, obj):
+        pk = getattr(obj, self.field.attname)
+        if pk is None:
+            return self.field, None, None
+        if pk not in self._related:
+            rel_obj = getattr(obj, self.field_name)
+            self._related[pk] = (rel_obj, force_text(rel_obj))
+        return self.field, None, self._related[pk][0]
+
+    def format_value(self, field, attr, value):
+        if value is None:
+            return empty_text(), False
+        return self._related[value.pk][1], False
+
+
+def get_formatter_class(field):
+    if field is None:
+        return ColumnFormatter
+    if field.flatchoices:
+        return ChoicesFormatter
+    if isinstance(field, (models.BooleanField, models.NullBooleanField)):
+        return BooleanFormatter
+    if isinstance(field, (models.DateField, models.TimeField)):
+        return DateFormatter
+    if isinstance(field, models.ForeignKey) and field.target_field.attname == field.remote_field.model._meta.pk.attname:
+        return ForeignKeyFormatter
+    if isinstance(field.remote_field, models.ManyToOneRel):
+        return ColumnFormatter
+    return FieldFormatter
+
+
+def make_column_formatter(admin_view, field_name):
+    """
+    Formatter of the ``field_name`` column of ``admin_view``.
+    """
+    field = None
+    if not callable(field_name):
+        try:
+            field = admin_view.opts.get_field(field_name)
+        except models.FieldDoesNotExist:
+            pass
+    if field is not None and not field.concrete:
+        # many to many and reverse relations go through lookup_field().
+        return ColumnFormatter(admin_view, field_name, field)
+    return get_formatter_class(field)(admin_view, field_name, field)
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from xadmin import archive
+
+
+class Command(BaseCommand):
+    help = "Move xadmin log entries older than the retention window into the archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months', type=int, default=None,
+            help='Number of full months kept in the hot log table '
+                 '(default: XADMIN_LOG_RETENTION_MONTHS or 6).')
+        parser.add_argument(
+            '--storage', choices=('table', 'file'), default=None,
+            help='Archive into the LogArchive table or into monthly gzip JSONL files '
+                 '(default: XADMIN_LOG_ARCHIVE_STORAGE or table).')
+        parser.add_argument(
+            '--path', default=None,
+            help='Directory of the monthly files (default: XADMIN_LOG_ARCHIVE_DIR).')
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of entries moved per transaction.')
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Keep running and archive every INTERVAL seconds.')
+        parser.add_argument(
+            '--restore', metavar='YYYY-MM', default=None,
+            help='Load a file archived month into the LogArchive table and exit.')
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            try:
+                count = archive.restore_month(options['restore'], options['path'],
+                                              options['batch_size'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write("Restored %d entries for %s." % (count, options['restore']))
+            return
+
+        while True:
+            moved = archive.archive_logs(options['months'], options['storage'],
+                                         options['path'], options['batch_size'])
+            if moved:
+                for month, count in sorted(moved.items()):
+                    self.stdout.write("Archived %d entries for %s." % (count, month))
+            else:
+                self.stdout.write("Nothing to archive.")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F, Max
+from django.db.models.functions import Length
+
+from xadmin.models import Log, LogArchive, OBJECT_REF_LENGTH
+
+
+class Command(BaseCommand):
+    help = "Fill the indexed object_ref column of log entries written before it existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=10000,
+            help='Number of primary keys covered by each UPDATE statement.')
+
+    def backfill(self, model, batch_size):
+        last = model.objects.aggregate(last=Max('pk'))['last'] or 0
+        updated = 0
+        for start in range(0, last, batch_size):
+            updated += model.objects.annotate(object_id_length=Length('object_id')).filter(
+                pk__gt=start, pk__lte=start + batch_size,
+                object_ref__isnull=True, object_id__isnull=False,
+                object_id_length__gt=0, object_id_length__lte=OBJECT_REF_LENGTH,
+            ).update(object_ref=F('object_id'))
+        return updated
+
+    def handle(self, *args, **options):
+        for model in (Log, LogArchive):
+            updated = self.backfill(model, options['batch_size'])
+            self.stdout.write("%s: %d entries updated." % (model._meta.verbose_name_plural, updated))
@@ -0,0 +1,172 @@
+import re
+import time
+import tracemalloc
+from importlib import import_module
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.test import RequestFactory
+from django.test.utils import override_settings
+
+from xadmin import site, util
+from xadmin.views import ListAdminView
+
+RENDERERS = {'template': False, 'fast': True}
+TBODY_RE = re.compile(r'<tbody>(.*?)</tbody>', re.S)
+
+
+class Command(BaseCommand):
+    help = "Time the rendering of a model change list page."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            help='Model of the change list, as app_label.ModelName.')
+        parser.add_argument(
+            '--rows', type=int, default=200,
+            help='Rows per page.')
+        parser.add_argument(
+            '--repeat', type=int, default=10,
+            help='Number of timed renders.')
+        parser.add_argument(
+            '--user', default=None,
+            help='Username of the request user (default: the first superuser).')
+        parser.add_argument(
+            '--query', default='',
+            help='Query string of the change list, e.g. "o=-id".')
+        parser.add_argument(
+            '--memory', action='store_true', default=False,
+            help='Also trace the memory allocated by one render.')
+        parser.add_argument(
+            '--renderer', choices=['default', 'template', 'fast', 'compare'], default='default',
+            help='Results table renderer: the admin setting, the template, the fast renderer '
+                 '(list_fast_renderer), or both, checking that they render the same table.')
+        parser.add_argument(
+            '--template-cache', choices=['default', 'on', 'off', 'compare'], default='default',
+            help='Render with the xadmin template cache (XADMIN_TEMPLATE_CACHE) on, off, or both.')
+        parser.add_argument(
+            '--url-templates', choices=['default', 'on', 'off', 'compare'], default='default',
+            help='Build the admin urls from url templates (XADMIN_URL_TEMPLATES) or with reverse(), or both.')
+
+    def get_model(self, label):
+        try:
+            model = apps.get_model(label)
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        if model not in site._registry:
+            raise CommandError("%s is not registered in xadmin." % label)
+        return model
+
+    def get_user(self, username):
+        users = get_user_model()._default_manager
+        try:
+            if username:
+                return users.get_by_natural_key(username)
+            return users.filter(is_superuser=True, is_active=True).order_by('pk')[0]
+        except (IndexError, users.model.DoesNotExist):
+            raise CommandError("No user to run the change list as.")
+
+    def make_request(self, path, user):
+        request = RequestFactory().get(path)
+        request.user = user
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        request._messages = FallbackStorage(request)
+        return request
+
+    def render(self, view, path, user):
+        response = view(self.make_request(path, user))
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def trace_memory(self, view, path, user):
+        tracemalloc.start()
+        try:
+            self.render(view, path, user)
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        self.stdout.write("memory: peak %.1fKiB, retained %.1fKiB" % (peak / 1024.0, current / 1024.0))
+        for stat in snapshot.statistics('filename')[:10]:
+            self.stdout.write("  %8.1fKiB %7d blocks  %s" % (
+                stat.size / 1024.0, stat.count, stat.traceback[0].filename))
+
+    def get_view(self, model, rows, renderer):
+        view_class = site.get_view_class(ListAdminView, site._registry[model])
+        attrs = {'list_per_page': rows}
+        if renderer in RENDERERS:
+            attrs['list_fast_renderer'] = RENDERERS[renderer]
+        return type(view_class.__name__, (view_class,), attrs).as_view()
+
+    def get_table_body(self, response):
+        match = TBODY_RE.search(response.content.decode(response.charset))
+        if match is None:
+            raise CommandError("The change list has no results table.")
+        # the renderers only differ by the whitespace between the tags.
+        return re.sub(r'\s*(<|>)\s*', r'\1', re.sub(r'\s+', ' ', match.group(1))).strip()
+
+    def get_template_loaders(self):
+        loaders = []
+        for engine in engines.all():
+            for loader in getattr(getattr(engine, 'engine', None), 'template_loaders', []):
+                loaders.append(loader.__module__)
+        return loaders
+
+    def bench(self, model, view, path, user, options, renderer):
+        # the first render builds the view classes and url templates.
+        response = self.render(view, path, user)
+        if response.status_code != 200:
+            raise CommandError("The change list answered %s." % response.status_code)
+
+        timings = []
+        for i in range(max(options['repeat'], 1)):
+            start = time.time()
+            self.render(view, path, user)
+            timings.append(time.time() - start)
+
+        self.stdout.write("%s, %d rows per page, %s renderer%s, %d renders: min %.1fms, avg %.1fms, max %.1fms" % (
+            model._meta.label, options['rows'], renderer, self.settings_label, len(timings), min(timings) * 1000,
+            sum(timings) / len(timings) * 1000, max(timings) * 1000))
+
+        if options['memory']:
+            self.trace_memory(view, path, user)
+        return response
+
+    def handle(self, *args, **options):
+        model = self.get_model(options['model'])
+        user = self.get_user(options['user'])
+        path = '/?%s' % options['query'] if options['query'] else '/'
+
+        renderers = ['template', 'fast'] if options['renderer'] == 'compare' else [options['renderer']]
+        template_caches = ['off', 'on'] if options['template_cache'] == 'compare' else [options['template_cache']]
+        url_templates = ['off', 'on'] if options['url_templates'] == 'compare' else [options['url_templates']]
+        if options['template_cache'] != 'default':
+            self.stdout.write("template loaders: %s" % ', '.join(self.get_template_loaders()))
+
+        responses = []
+        for template_cache in template_caches:
+            for url_template in url_templates:
+                overrides, labels = {}, []
+                if template_cache != 'default':
+                    overrides['XADMIN_TEMPLATE_CACHE'] = template_cache == 'on'
+                    labels.append(', template cache %s' % template_cache)
+                if url_template != 'default':
+                    overrides['XADMIN_URL_TEMPLATES'] = url_template == 'on'
+                    labels.append(', url templates %s' % url_template)
+                self.settings_label = ''.join(labels)
+                util._template_cache.clear()
+                site._url_templates = {}
+                with override_settings(**overrides):
+                    responses = [self.bench(model, self.get_view(model, options['rows'], renderer), path, user,
+                                            options, renderer) for renderer in renderers]
+
+        if options['renderer'] == 'compare':
+            template_body, fast_body = [self.get_table_body(response) for response in responses]
+            if template_body != fast_body:
+                raise CommandError("The fast renderer output differs from views/model_list.html.")
+            self.stdout.write("The fast renderer output matches views/model_list.html.")
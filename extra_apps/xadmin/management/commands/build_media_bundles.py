@@ -0,0 +1,54 @@
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from xadmin import bundles
+from xadmin.util import json
+
+
+class Command(BaseCommand):
+    help = ("Concatenate the media combinations recorded with XADMIN_MEDIA_BUNDLE_RECORD "
+            "into content-hashed bundles and write the bundle manifest.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'records', nargs='*',
+            help='Recorded combination files (default: XADMIN_MEDIA_BUNDLE_RECORD).')
+        parser.add_argument(
+            '--manifest', default=None,
+            help='Manifest file to write (default: XADMIN_MEDIA_BUNDLE_MANIFEST).')
+        parser.add_argument(
+            '--root', default=None,
+            help='Directory the bundles are written to (default: XADMIN_MEDIA_BUNDLE_ROOT, or STATIC_ROOT).')
+        parser.add_argument(
+            '--min-hits', type=int, default=1,
+            help='Only bundle combinations recorded at least this many times.')
+
+    def handle(self, *args, **options):
+        records = options['records'] or [bundles.get_record_path()]
+        if not all(records):
+            raise CommandError("No record file given and XADMIN_MEDIA_BUNDLE_RECORD is not set.")
+        root = options['root'] or bundles.get_bundle_root()
+        if not root:
+            raise CommandError("No --root given and neither XADMIN_MEDIA_BUNDLE_ROOT nor STATIC_ROOT is set.")
+
+        counts = Counter()
+        combinations = {}
+        for record in records:
+            try:
+                with open(record) as f:
+                    for line in f:
+                        if line.strip():
+                            combination = json.loads(line)
+                            key = json.dumps(combination, sort_keys=True)
+                            counts[key] += 1
+                            combinations[key] = combination
+            except IOError as e:
+                raise CommandError(str(e))
+
+        common = [combinations[key] for key, hits in counts.most_common() if hits >= options['min_hits']]
+        manifest = bundles.build_bundles(common, root)
+        path = options['manifest'] or bundles.get_manifest_path()
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        self.stdout.write("%d media combinations bundled into %s." % (len(common), path))
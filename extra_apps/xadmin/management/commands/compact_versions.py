@@ -0,0 +1,85 @@
+from itertools import groupby
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from xadmin.versiondelta import DELTA_FORMAT, SNAPSHOT_FORMAT, apply_delta, delta_base, expand_delta, make_delta
+
+
+class Command(BaseCommand):
+    help = ("Convert the stored versions of delta storage models into periodic snapshots "
+            "plus field deltas, or back into full snapshots with --expand.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', action='append', dest='models', default=[], metavar='APP_LABEL.MODEL',
+            help='Model to compact, may be repeated (default: every admin with reversion_storage = "delta").')
+        parser.add_argument(
+            '--interval', type=int, default=None,
+            help='Versions per snapshot (default: the admin reversion_snapshot_interval or 10).')
+        parser.add_argument(
+            '--expand', action='store_true', default=False,
+            help='Rewrite every delta as a full snapshot.')
+
+    def get_models(self, options):
+        from xadmin.plugins import xversion
+
+        xversion.register_models()
+        if not options['models']:
+            return list(xversion._delta_models.items())
+        models = []
+        for label in options['models']:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            models.append((model, xversion._delta_models.get(model, 10)))
+        return models
+
+    def plan(self, rows, interval, expand):
+        """
+        Yields ``(pk, format, serialized_data)`` for every version of one
+        object whose stored form has to change.
+        """
+        full = {}
+        for pk, fmt, data in rows:
+            if fmt == DELTA_FORMAT:
+                base_pk = delta_base(data)
+                data = apply_delta(full[base_pk], data) if base_pk in full else expand_delta(data)
+            full[pk] = data
+
+        base_pk, base_data, count = None, None, 0
+        for pk, fmt, data in rows:
+            if fmt not in (SNAPSHOT_FORMAT, DELTA_FORMAT):
+                base_pk = None
+                continue
+            new_fmt, new_data = SNAPSHOT_FORMAT, full[pk]
+            if not expand and base_pk is not None and count < interval - 1:
+                delta = make_delta(base_pk, base_data, full[pk])
+                if delta is not None:
+                    new_fmt, new_data = DELTA_FORMAT, delta
+            if new_fmt == SNAPSHOT_FORMAT:
+                base_pk, base_data, count = pk, full[pk], 0
+            else:
+                count += 1
+            if (new_fmt, new_data) != (fmt, data):
+                yield pk, new_fmt, new_data
+
+    def handle(self, *args, **options):
+        from reversion.models import Version
+
+        for model, interval in self.get_models(options):
+            interval = options['interval'] or interval
+            versions = Version.objects.filter(
+                content_type=ContentType.objects.get_for_model(model)).order_by('db', 'object_id', 'pk')
+            updated = 0
+            rows = versions.values_list('db', 'object_id', 'pk', 'format', 'serialized_data').iterator()
+            for key, object_rows in groupby(rows, lambda row: row[:2]):
+                object_rows = [row[2:] for row in object_rows]
+                with transaction.atomic():
+                    for pk, fmt, data in list(self.plan(object_rows, interval, options['expand'])):
+                        Version.objects.filter(pk=pk).update(format=fmt, serialized_data=data)
+                        updated += 1
+            self.stdout.write("%s: %d versions rewritten." % (model._meta.label, updated))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max
+
+from xadmin.models import UserSettings
+
+
+class Command(BaseCommand):
+    help = ("Remove duplicated (user, key) user settings, keeping the latest row, "
+            "so the unique (user, key) index can be created.")
+
+    def handle(self, *args, **options):
+        duplicates = UserSettings.objects.values('user_id', 'key').annotate(
+            count=Count('id'), last=Max('id')).filter(count__gt=1)
+        removed = 0
+        for row in duplicates:
+            removed += UserSettings.objects.filter(user_id=row['user_id'], key=row['key']).exclude(
+                id=row['last']).delete()[0]
+        self.stdout.write("%d duplicated user settings removed." % removed)
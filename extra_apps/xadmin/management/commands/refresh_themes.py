@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from xadmin.plugins.themes import get_theme_catalog_path, refresh_theme_catalog
+
+
+class Command(BaseCommand):
+    help = "Download the bootswatch theme list into the local theme catalog used by ThemePlugin."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url', default=None,
+            help='Theme API url (default: XADMIN_THEME_CATALOG_URL or the bootswatch api).')
+        parser.add_argument(
+            '--path', default=None,
+            help='Catalog file (default: XADMIN_THEME_CATALOG or BASE_DIR/xadmin_themes.json).')
+        parser.add_argument(
+            '--timeout', type=int, default=30,
+            help='Network timeout in seconds.')
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Keep running and refresh every INTERVAL seconds.')
+
+    def handle(self, *args, **options):
+        path = options['path'] or get_theme_catalog_path()
+        while True:
+            try:
+                themes = refresh_theme_catalog(options['url'], path, options['timeout'])
+            except Exception as e:
+                if not options['interval']:
+                    raise CommandError("Refreshing the theme catalog failed: %s" % e)
+                self.stderr.write("Refreshing the theme catalog failed: %s" % e)
+            else:
+                self.stdout.write("%d themes written to %s." % (len(themes), path))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
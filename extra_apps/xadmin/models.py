@@ -10,7 +10,9 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.base import ModelBase
 from django.utils.encoding import python_2_unicode_compatible, smart_text
 
-from django.db.models.signals import post_migrate
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.contrib.auth.models import Permission
 
 import datetime
@@ -102,6 +104,76 @@ class UserSettings(models.Model):
     class Meta:
         verbose_name = _(u'User Setting')
         verbose_name_plural = _('User Settings')
+        unique_together = (('user', 'key'),)
+
+
+class UserSettingsStore(object):
+    """
+    All settings of one user, loaded with a single query and kept in the
+    cache between requests. Writes go to the database and drop the cached
+    copy, so the next request reads the settings of the database again.
+
+    A process local cache (``LocMemCache``, the default when ``CACHES`` is
+    not set) is not used: the other processes would not see the writes.
+    """
+    cache_timeout = getattr(settings, 'XADMIN_USER_SETTINGS_CACHE_TIMEOUT', 5 * 60)
+
+    def __init__(self, user):
+        self.user_id = user.pk
+        self._data = None
+
+    @staticmethod
+    def cache_key(user_id):
+        return 'xadmin.usersettings.%s' % user_id
+
+    @staticmethod
+    def use_cache():
+        return not isinstance(caches['default'], LocMemCache)
+
+    @property
+    def data(self):
+        if self._data is None:
+            data = cache.get(self.cache_key(self.user_id)) if self.use_cache() else None
+            if data is None:
+                data = dict(UserSettings.objects.filter(user_id=self.user_id).values_list('key', 'value'))
+                if self.use_cache():
+                    cache.set(self.cache_key(self.user_id), data, self.cache_timeout)
+            self._data = data
+        return self._data
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        UserSettings.objects.update_or_create(user_id=self.user_id, key=key, defaults={'value': value})
+        self.data[key] = value
+        cache.delete(self.cache_key(self.user_id))
+
+    def delete(self, key):
+        UserSettings.objects.filter(user_id=self.user_id, key=key).delete()
+        self.data.pop(key, None)
+        cache.delete(self.cache_key(self.user_id))
+
+
+def get_user_settings(user):
+    """
+    Settings store of ``user``, shared by everything that handles the same
+    user object during a request.
+    """
+    store = getattr(user, '_xadmin_settings', None)
+    if store is None:
+        store = UserSettingsStore(user)
+        if user.pk is not None:
+            user._xadmin_settings = store
+    return store
+
+
+def clear_user_settings_cache(sender, instance, **kwargs):
+    cache.delete(UserSettingsStore.cache_key(instance.user_id))
+
+
+post_save.connect(clear_user_settings_cache, sender=UserSettings)
+post_delete.connect(clear_user_settings_cache, sender=UserSettings)
 
 
 @python_2_unicode_compatible
@@ -124,13 +196,11 @@ class UserWidget(models.Model):
         created = self.pk is None
         super(UserWidget, self).save(*args, **kwargs)
         if created:
-            try:
-                portal_pos = UserSettings.objects.get(
-                    user=self.user, key="dashboard:%s:pos" % self.page_id)
-                portal_pos.value = "%s,%s" % (self.pk, portal_pos.value) if portal_pos.value else self.pk
-                portal_pos.save()
-            except Exception:
-                pass
+            store = get_user_settings(self.user)
+            key = "dashboard:%s:pos" % self.page_id
+            portal_pos = store.get(key)
+            if portal_pos is not None:
+                store.set(key, "%s,%s" % (self.pk, portal_pos) if portal_pos else str(self.pk))
 
     def __str__(self):
         return "%s %s widget" % (self.user, self.widget_type)
@@ -140,8 +210,24 @@ class UserWidget(models.Model):
         verbose_name_plural = _('User Widgets')
 
 
+OBJECT_REF_LENGTH = 64
+
+
+def make_object_ref(object_id):
+    """
+    Value of ``Log.object_ref`` for an object id, ``None`` when the id is
+    empty or too long to be indexed.
+    """
+    if object_id is None:
+        return None
+    object_id = smart_text(object_id)
+    if not object_id or len(object_id) > OBJECT_REF_LENGTH:
+        return None
+    return object_id
+
+
 @python_2_unicode_compatible
-class Log(models.Model):
+class BaseLog(models.Model):
     action_time = models.DateTimeField(
         _('action time'),
         default=timezone.now,
@@ -160,15 +246,21 @@ class Log(models.Model):
         blank=True, null=True,
     )
     object_id = models.TextField(_('object id'), blank=True, null=True)
+    # indexable copy of object_id, empty when the pk does not fit.
+    object_ref = models.CharField(_('object reference'), max_length=OBJECT_REF_LENGTH,
+                                  blank=True, null=True, editable=False)
     object_repr = models.CharField(_('object repr'), max_length=200)
     action_flag = models.CharField(_('action flag'), max_length=32)
     message = models.TextField(_('change message'), blank=True)
 
     class Meta:
-        verbose_name = _('log entry')
-        verbose_name_plural = _('log entries')
+        abstract = True
         ordering = ('-action_time',)
 
+    def save(self, *args, **kwargs):
+        self.object_ref = make_object_ref(self.object_id)
+        super(BaseLog, self).save(*args, **kwargs)
+
     def __repr__(self):
         return smart_text(self.action_time)
 
@@ -188,3 +280,56 @@ class Log(models.Model):
     def get_edited_object(self):
         "Returns the edited object represented by this log entry"
         return self.content_type.get_object_for_this_type(pk=self.object_id)
+
+
+class LogQuerySet(models.QuerySet):
+
+    def for_object(self, obj):
+        """
+        History of one object, served by the (content_type, object_ref,
+        action_time) index whenever the pk fits in ``object_ref``.
+        """
+        qs = self.filter(content_type=ContentType.objects.get_for_model(obj, for_concrete_model=False))
+        object_ref = make_object_ref(obj.pk)
+        if object_ref is None:
+            return qs.filter(object_id=smart_text(obj.pk))
+        return qs.filter(object_ref=object_ref)
+
+
+class Log(BaseLog):
+    """
+    The hot log table. Only recent entries live here, older months are moved
+    out by the ``archive_logs`` management command (see ``xadmin.archive``).
+    """
+    objects = LogQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _('log entry')
+        verbose_name_plural = _('log entries')
+        ordering = ('-action_time',)
+        indexes = [
+            models.Index(fields=['action_time', 'user'], name='xadmin_log_time_user_idx'),
+            models.Index(fields=['content_type', 'object_ref', 'action_time'], name='xadmin_log_object_idx'),
+        ]
+
+
+class LogArchive(BaseLog):
+    """
+    Log entries moved out of the hot table, partitioned by ``archive_month``
+    (``YYYY-MM``). Months kept as compressed files are loaded here on demand.
+    """
+    archive_month = models.CharField(_('archive month'), max_length=7, db_index=True)
+    # id of the entry in the hot table, a month file is loaded once per entry.
+    log_id = models.PositiveIntegerField(_('log id'), blank=True, null=True, editable=False)
+
+    objects = LogQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _('archived log entry')
+        verbose_name_plural = _('archived log entries')
+        ordering = ('-action_time',)
+        unique_together = (('archive_month', 'log_id'),)
+        indexes = [
+            models.Index(fields=['archive_month', 'action_time'], name='xadmin_logarc_month_time_idx'),
+            models.Index(fields=['content_type', 'object_ref', 'action_time'], name='xadmin_logarc_object_idx'),
+        ]
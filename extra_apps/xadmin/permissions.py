@@ -0,0 +1,56 @@
+"""
+Request scoped permission checks.
+
+A list page asks for the same permissions for every row, and with an
+object permission backend such as ``rules.permissions.ObjectPermissionBackend``
+in ``AUTHENTICATION_BACKENDS`` every ``user.has_perm()`` call runs through the
+backends again. ``PermissionOracle`` answers each permission once per
+request, and only asks again per object for permissions that have object
+level rules.
+"""
+try:
+    from rules.permissions import perm_exists
+except ImportError:
+    perm_exists = None
+
+
+def has_object_rules(perm):
+    """
+    Whether the answer for ``perm`` can depend on the object, which is the
+    case only for permissions that have a rule registered in ``rules``.
+    """
+    return perm_exists is not None and perm_exists(perm)
+
+
+class PermissionOracle(object):
+
+    def __init__(self, user):
+        self.user = user
+        self._perms = {}
+        self._object_perms = {}
+        self._object_rules = {}
+
+    def has_object_rules(self, perm):
+        if perm not in self._object_rules:
+            self._object_rules[perm] = has_object_rules(perm)
+        return self._object_rules[perm]
+
+    def has_perm(self, perm, obj=None):
+        if obj is not None and self.has_object_rules(perm):
+            key = (perm, obj.__class__, obj.pk)
+            if key not in self._object_perms:
+                self._object_perms[key] = self.user.has_perm(perm, obj)
+            return self._object_perms[key]
+        if perm not in self._perms:
+            self._perms[perm] = self.user.has_perm(perm)
+        return self._perms[perm]
+
+
+def get_permission_oracle(request):
+    """
+    The ``PermissionOracle`` of ``request.user`` for the current request.
+    """
+    oracle = getattr(request, '_xadmin_permission_oracle', None)
+    if oracle is None or oracle.user is not request.user:
+        oracle = request._xadmin_permission_oracle = PermissionOracle(request.user)
+    return oracle
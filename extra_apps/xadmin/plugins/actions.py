@@ -3,7 +3,6 @@ from django import forms, VERSION as django_version
 from django.core.exceptions import PermissionDenied
 from django.db import router
 from django.http import HttpResponse, HttpResponseRedirect
-from django.template import loader
 from django.template.response import TemplateResponse
 from django.utils import six
 from django.utils.encoding import force_text
@@ -15,7 +14,7 @@ from django.contrib.admin.utils import get_deleted_objects
 
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
-from xadmin.util import model_format_dict, model_ngettext
+from xadmin.util import model_format_dict, model_ngettext, render_to_string
 from xadmin.views import BaseAdminPlugin, ListAdminView
 from xadmin.views.base import filter_hook, ModelAdminView
 
@@ -92,15 +91,24 @@ class DeleteSelectedAction(BaseActionView):
 
         using = router.db_for_write(self.model)
 
-        if django_version > (2, 0):
-            setattr(self.admin_site._registry[self.model], 'has_delete_permission', self.has_delete_permission)
-
         # Populate deletable_objects, a data structure of all related objects that
         # will also be deleted.
 
         if django_version > (2, 0):
-            deletable_objects, model_count, perms_needed, protected = get_deleted_objects(
-                queryset, self.opts, self.admin_site)
+            # get_deleted_objects() asks the registered admin of the model for
+            # ``has_delete_permission(request, obj)``; answer it for this request
+            # only, the admin class is shared by the views of every request.
+            model_admin = self.admin_site._registry[self.model]
+            own_method = model_admin.__dict__.get('has_delete_permission')
+            model_admin.has_delete_permission = lambda request, obj=None: self.has_delete_permission(obj)
+            try:
+                deletable_objects, model_count, perms_needed, protected = get_deleted_objects(
+                    queryset, self.opts, self.admin_site)
+            finally:
+                if own_method is None:
+                    del model_admin.has_delete_permission
+                else:
+                    model_admin.has_delete_permission = own_method
         else:
             deletable_objects, model_count, perms_needed, protected = get_deleted_objects(
                 queryset, self.opts, self.user, self.admin_site, using)
@@ -305,8 +313,8 @@ class ActionPlugin(BaseAdminPlugin):
     # Block Views
     def block_results_bottom(self, context, nodes):
         if self.actions and self.admin_view.result_count:
-            nodes.append(loader.render_to_string('xadmin/blocks/model_list.results_bottom.actions.html',
-                                                 context=get_context_dict(context)))
+            nodes.append(render_to_string('xadmin/blocks/model_list.results_bottom.actions.html',
+                                          context=get_context_dict(context)))
 
 
 site.register_plugin(ActionPlugin, ListAdminView)
@@ -1,12 +1,78 @@
+"""
+Json answers of the list, form and detail views.
+
+``?_ajax=1&_fields=a,b`` answers the rows of a change list page, filtered,
+searched and ordered like the page, with the cells as escaped text.
+
+With ``_values=1`` the list is a read api: the ``_fields`` (model fields)
+are read with one ``values()`` query, without building the html cells, and
+answered as raw values. ``_cursor`` pages through the list by the ordering
+values of the last row instead of an offset, when the ordering columns can
+be compared (not null, not relations)::
+
+    {"headers": {...}, "objects": [...], "has_more": true, "next_cursor": "..."}
+"""
+import base64
+import datetime
 from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.db.models.sql.query import LOOKUP_SEP
 from django.forms.utils import ErrorDict
+from django.http import HttpResponseBadRequest
 from django.utils.html import escape
 from django.utils.encoding import force_text
+from django.utils.text import capfirst
 from xadmin.sites import site
+from xadmin.util import json, get_fields_from_path, label_for_field, NotRelationField
 from xadmin.views import BaseAdminPlugin, ListAdminView, ModelFormAdminView, DetailAdminView
 
 
 NON_FIELD_ERRORS = '__all__'
+VALUES_VAR = '_values'
+CURSOR_VAR = '_cursor'
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Datetimes and times at full precision, ``DjangoJSONEncoder`` cuts them to
+    milliseconds and the next page would skip the rows in between.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super(CursorJSONEncoder, self).default(o)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(
+        json.dumps(values, cls=CursorJSONEncoder).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (TypeError, ValueError, UnicodeError):
+        return None
+    return values if isinstance(values, list) else None
+
+
+def keyset_filter(ordering, values):
+    """
+    ``Q`` of the rows after the row with ``values`` in ``ordering``: greater
+    on the first column, or equal on it and greater on the next one, etc.
+    """
+    q = Q(pk__in=[])
+    equal = Q()
+    for name, value in zip(ordering, values):
+        field = name.lstrip('-')
+        lookup = '%s__%s' % (field, 'lt' if name.startswith('-') else 'gt')
+        q |= equal & Q(**{lookup: value})
+        equal &= Q(**{field: value})
+    return q
 
 
 class BaseAjaxPlugin(BaseAdminPlugin):
@@ -24,7 +90,96 @@ class AjaxListPlugin(BaseAjaxPlugin):
             return list_fields
         return list_display
 
-    def get_result_list(self, response):
+    def get_value_field_label(self, field_name):
+        if field_name == 'pk' or LOOKUP_SEP not in field_name:
+            return force_text(label_for_field(field_name, self.model, model_admin=self.admin_view))
+        return force_text(capfirst(get_fields_from_path(self.model, field_name)[-1].verbose_name))
+
+    def get_value_fields(self):
+        """
+        The ``_fields`` of the request when ``values()`` can read them all:
+        the concrete fields of the model, and relation paths the admin
+        already shows, filters or searches by. None otherwise.
+        """
+        fields = [f.strip() for f in self.request.GET.get('_fields', '').split(',') if f.strip()]
+        if not fields:
+            return None
+        av = self.admin_view
+        # the options of the admin, av.list_display is already the _fields.
+        exposed = set(f for f in list(type(av).list_display) + list(getattr(type(av), 'list_filter', ())) +
+                      list(av.search_fields) if isinstance(f, str))
+        for field_name in fields:
+            if field_name == 'pk':
+                continue
+            if LOOKUP_SEP in field_name and field_name not in exposed:
+                return None
+            try:
+                path = get_fields_from_path(self.model, field_name)
+            except (FieldDoesNotExist, NotRelationField):
+                return None
+            if any(not f.concrete or f.many_to_many for f in path):
+                return None
+        return fields
+
+    def get_keyset_ordering(self):
+        """
+        The ordering when a keyset filter can page through it: every column
+        is a field that is never null, through relations that are never
+        null, and not a relation itself, which ``order_by()`` would sort by
+        the ordering of the related model instead of the stored id.
+        """
+        ordering = self.admin_view.get_ordering()
+        for name in ordering:
+            if not isinstance(name, str) or name == '?':
+                return None
+            name = name.lstrip('-')
+            if name == 'pk':
+                continue
+            try:
+                path = get_fields_from_path(self.model, name)
+            except (FieldDoesNotExist, NotRelationField):
+                return None
+            if path[-1].is_relation or any(f.null or f.many_to_many or not f.concrete for f in path):
+                return None
+        return ordering
+
+    def get_values_result(self, fields):
+        av = self.admin_view
+        queryset = av.get_list_queryset()
+        ordering = self.get_keyset_ordering()
+        cursor = self.request.GET.get(CURSOR_VAR)
+        order_names = [o.lstrip('-') for o in ordering or ()]
+
+        result = {'headers': dict((f, self.get_value_field_label(f)) for f in fields)}
+        if cursor:
+            values = decode_cursor(cursor)
+            if ordering is None or values is None or len(values) != len(ordering):
+                return HttpResponseBadRequest()
+            queryset = queryset.filter(keyset_filter(ordering, values))
+            offset = 0
+        else:
+            offset = av.page_num * av.list_per_page
+            result['total_count'] = queryset.count()
+
+        rows = list(queryset.values(*OrderedDict.fromkeys(fields + order_names))
+                    [offset:offset + av.list_per_page + 1])
+        has_more = len(rows) > av.list_per_page
+        rows = rows[:av.list_per_page]
+
+        result['objects'] = [dict((f, row[f]) for f in fields) for row in rows]
+        result['has_more'] = has_more
+        if has_more and ordering is not None:
+            result['next_cursor'] = encode_cursor([rows[-1][name] for name in order_names])
+        return self.render_response(result)
+
+    def get_result_list(self, __):
+        if self.request.GET.get(VALUES_VAR) == '1':
+            fields = self.get_value_fields()
+            if fields is None:
+                return HttpResponseBadRequest()
+            return self.get_values_result(fields)
+
+        __()
         av = self.admin_view
         base_fields = self.get_list_display(av.base_list_display)
         headers = dict([(c.field_name, force_text(c.text)) for c in av.result_headers(
@@ -180,7 +180,7 @@ class ChangePasswordView(ModelAdminView):
 
     @csrf_protect_m
     def get(self, request, object_id):
-        if not self.has_change_permission(request):
+        if not self.has_change_permission():
             raise PermissionDenied
         self.obj = self.get_object(unquote(object_id))
         self.form = self.change_password_form(self.obj)
@@ -217,7 +217,7 @@ class ChangePasswordView(ModelAdminView):
     @method_decorator(sensitive_post_parameters())
     @csrf_protect_m
     def post(self, request, object_id):
-        if not self.has_change_permission(request):
+        if not self.has_change_permission():
             raise PermissionDenied
         self.obj = self.get_object(unquote(object_id))
         self.form = self.change_password_form(self.obj, request.POST)
@@ -3,7 +3,6 @@ import copy
 from django import forms
 from django.db import models
 from django.core.exceptions import PermissionDenied
-from django.forms.models import modelform_factory
 from django.template.response import TemplateResponse
 from django.utils.encoding import force_text
 from django.utils.safestring import mark_safe
@@ -68,6 +67,9 @@ class BatchChangeAction(BaseActionView):
 
     model_perm = 'change'
 
+    # versions of the changed objects are written as one bulk revision.
+    bulk_revision = True
+
     batch_fields = []
 
     def change_models(self, queryset, cleaned_data):
@@ -103,7 +105,7 @@ class BatchChangeAction(BaseActionView):
             "fields": fields,
             "formfield_callback": formfield_for_dbfield,
         }
-        return modelform_factory(self.model, **defaults)
+        return edit_view.model_form_factory(callback_key=('batch_change', is_post), **defaults)
 
     def do_action(self, queryset):
         if not self.has_change_permission():
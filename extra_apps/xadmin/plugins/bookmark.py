@@ -5,7 +5,6 @@ from django.db import transaction
 from django.db.models import Q
 from django.forms import ModelChoiceField
 from django.http import QueryDict
-from django.template import loader
 from django.utils.decorators import method_decorator
 from django.utils.encoding import smart_text
 from django.utils.translation import ugettext_lazy as _
@@ -20,6 +19,7 @@ from xadmin.views.list import COL_LIST_VAR, ORDER_VAR
 from xadmin.views.dashboard import widget_manager, BaseWidget, PartialBaseWidget
 
 from xadmin.models import Bookmark
+from xadmin.util import render_to_string
 
 csrf_protect_m = method_decorator(csrf_protect)
 
@@ -135,8 +135,8 @@ class BookmarkPlugin(BaseAdminPlugin):
     # Block Views
     def block_nav_menu(self, context, nodes):
         if self.show_bookmarks:
-            nodes.insert(0, loader.render_to_string('xadmin/blocks/model_list.nav_menu.bookmarks.html',
-                                                    context=get_context_dict(context)))
+            nodes.insert(0, render_to_string('xadmin/blocks/model_list.nav_menu.bookmarks.html',
+                                             context=get_context_dict(context)))
 
 
 class BookmarkView(ModelAdminView):
@@ -6,7 +6,6 @@ import decimal
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.http import HttpResponse, HttpResponseNotFound
-from django.template import loader
 from django.utils.http import urlencode
 from django.utils.encoding import force_text, smart_text
 from django.utils.translation import ugettext_lazy as _, ugettext
@@ -15,7 +14,7 @@ from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ListAdminView
 from xadmin.views.dashboard import ModelBaseWidget, widget_manager
-from xadmin.util import lookup_field, label_for_field, json
+from xadmin.util import lookup_field, label_for_field, json, render_to_string
 
 
 @widget_manager.register
@@ -98,8 +97,8 @@ class ChartsPlugin(BaseAdminPlugin):
         context.update({
             'charts': [{"name": name, "title": v['title'], 'url': self.get_chart_url(name, v)} for name, v in self.data_charts.items()],
         })
-        nodes.append(loader.render_to_string('xadmin/blocks/model_list.results_top.charts.html',
-                                             context=get_context_dict(context)))
+        nodes.append(render_to_string('xadmin/blocks/model_list.results_top.charts.html',
+                                      context=get_context_dict(context)))
 
 
 class ChartsView(ListAdminView):
@@ -1,7 +1,7 @@
 
 
 from django.utils.translation import ugettext as _
-from django.urls.base import reverse, NoReverseMatch
+from django.urls.base import NoReverseMatch
 from django.db import models
 
 from xadmin.sites import site
@@ -22,28 +22,24 @@ class DetailsPlugin(BaseAdminPlugin):
                 rel_obj = obj
 
             if rel_obj:
-                if rel_obj.__class__ in site._registry:
-                    try:
-                        model_admin = site._registry[rel_obj.__class__]
-                        has_view_perm = model_admin(self.admin_view.request).has_view_permission(rel_obj)
-                        has_change_perm = model_admin(self.admin_view.request).has_change_permission(rel_obj)
-                    except:
-                        has_view_perm = self.admin_view.has_model_perm(rel_obj.__class__, 'view')
-                        has_change_perm = self.has_model_perm(rel_obj.__class__, 'change')
-                else:
-                    has_view_perm = self.admin_view.has_model_perm(rel_obj.__class__, 'view')
-                    has_change_perm = self.has_model_perm(rel_obj.__class__, 'change')
+                # permissions are answered once per request, and per object
+                # only when there are object level rules for them.
+                remove_permissions = getattr(site._registry.get(rel_obj.__class__), 'remove_permissions', ())
+                has_view_perm = 'view' not in remove_permissions and \
+                    self.has_model_perm(rel_obj.__class__, 'view', obj=rel_obj)
+                has_change_perm = 'change' not in remove_permissions and \
+                    self.has_model_perm(rel_obj.__class__, 'change', obj=rel_obj)
 
             if rel_obj and has_view_perm:
                 opts = rel_obj._meta
                 try:
-                    item_res_uri = reverse(
+                    item_res_uri = self.admin_site.reverse(
                         '%s:%s_%s_detail' % (self.admin_site.app_name,
                                              opts.app_label, opts.model_name),
                         args=(getattr(rel_obj, opts.pk.attname),))
                     if item_res_uri:
                         if has_change_perm:
-                            edit_url = reverse(
+                            edit_url = self.admin_site.reverse(
                                 '%s:%s_%s_change' % (self.admin_site.app_name, opts.app_label, opts.model_name),
                                 args=(getattr(rel_obj, opts.pk.attname),))
                         else:
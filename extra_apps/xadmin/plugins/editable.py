@@ -1,16 +1,15 @@
-from django import template
-from django.core.exceptions import PermissionDenied, ObjectDoesNotExist
+from django import forms, template
+from django.core.exceptions import PermissionDenied, ObjectDoesNotExist, ValidationError
 from django.db import models, transaction
-from django.forms.models import modelform_factory
 from django.forms import Media
 from django.http import Http404, HttpResponse
 from django.utils.encoding import force_text, smart_text
 from django.utils.html import escape, conditional_escape
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext as _
-from xadmin.plugins.ajax import JsonErrorDict
+from xadmin.plugins.ajax import JsonErrorDict, NON_FIELD_ERRORS
 from xadmin.sites import site
-from xadmin.util import lookup_field, display_for_field, label_for_field, unquote, boolean_icon
+from xadmin.util import lookup_field, display_for_field, label_for_field, unquote, boolean_icon, get_auto_now_fields
 from xadmin.views import BaseAdminPlugin, ModelFormAdminView, ListAdminView
 from xadmin.views.base import csrf_protect_m, filter_hook
 from xadmin.views.edit import ModelFormAdminUtil
@@ -27,10 +26,7 @@ class EditablePlugin(BaseAdminPlugin):
         self.editable_need_fields = {}
 
     def init_request(self, *args, **kwargs):
-        active = bool(self.request.method == 'GET' and self.admin_view.has_change_permission() and self.list_editable)
-        if active:
-            self.model_form = self.get_model_view(ModelFormAdminUtil, self.model).form_obj
-        return active
+        return bool(self.request.method == 'GET' and self.admin_view.has_change_permission() and self.list_editable)
 
     def result_item(self, item, obj, field_name, row):
         if self.list_editable and item.field and item.field.editable and (field_name in self.list_editable):
@@ -53,9 +49,9 @@ class EditablePlugin(BaseAdminPlugin):
     # Media
     def get_media(self, media):
         if self.editable_need_fields:
-
+            # the form is only built for its media, when a cell of the page is editable.
             try:
-                m = self.model_form.media
+                m = self.get_model_view(ModelFormAdminUtil, self.model).form_obj.media
             except:
                 m = Media()
             media = media + m +\
@@ -119,7 +115,7 @@ class EditPatchView(ModelFormAdminView, ListAdminView):
             "fields": fields,
             "formfield_callback": self.formfield_for_dbfield,
         }
-        form_class = modelform_factory(self.model, **defaults)
+        form_class = self.model_form_factory(**defaults)
         form = form_class(instance=self.org_obj)
 
         helper = FormHelper()
@@ -145,9 +141,69 @@ class EditPatchView(ModelFormAdminView, ListAdminView):
             "fields": fields,
             "formfield_callback": self.formfield_for_dbfield,
         }
-        form_class = modelform_factory(self.model, **defaults)
+        form_class = self.model_form_factory(**defaults)
+        fields = [f for f in fields if f in form_class.base_fields]
+
+        if self.can_patch_fields(form_class, fields):
+            result = self.patch_fields(form_class, fields)
+        else:
+            result = self.patch_form(form_class, fields)
+        return self.render_response(result)
+
+    def can_patch_fields(self, form_class, fields):
+        """
+        Whether the fields can be cleaned by their form fields alone, that is
+        the form class adds no initialization or cleaning of its own.
+        """
+        return form_class.__init__ is forms.ModelForm.__init__ and \
+            form_class.clean is forms.ModelForm.clean and \
+            form_class._post_clean is forms.ModelForm._post_clean and \
+            not any(hasattr(form_class, 'clean_%s' % f) or
+                    isinstance(form_class.base_fields[f], forms.FileField) for f in fields)
+
+    def patch_fields(self, form_class, fields):
+        """
+        Clean the posted fields with their form fields and the model
+        validation of these fields only, then write them with one narrow
+        ``save(update_fields=...)``, which also lists the ``auto_now`` fields
+        so they change as with a whole save.
+        """
+        obj = self.org_obj
+        cleaned_data = {}
+        errors = {}
+        for f in fields:
+            formfield = form_class.base_fields[f]
+            try:
+                cleaned_data[f] = formfield.clean(
+                    formfield.widget.value_from_datadict(self.request.POST, self.request.FILES, f))
+            except ValidationError as e:
+                errors[f] = e.messages
+
+        if not errors:
+            for f, value in cleaned_data.items():
+                self.opts.get_field(f).save_form_data(obj, value)
+            try:
+                obj.full_clean(exclude=[f.name for f in self.opts.fields if f.name not in cleaned_data])
+            except ValidationError as e:
+                errors = e.message_dict
+
+        if errors:
+            return {'result': 'error', 'errors': [
+                {'id': 'id_%s' % f if f != NON_FIELD_ERRORS else NON_FIELD_ERRORS, 'name': f, 'errors': messages}
+                for f, messages in errors.items()]}
+
+        if cleaned_data:
+            obj.save(update_fields=list(cleaned_data) + [
+                f for f in get_auto_now_fields(self.opts) if f not in cleaned_data])
+        return {
+            'result': 'success',
+            'new_data': cleaned_data,
+            'new_html': dict([(f, self.get_new_field_html(f)) for f in fields]),
+        }
+
+    def patch_form(self, form_class, fields):
         form = form_class(
-            instance=self.org_obj, data=request.POST, files=request.FILES)
+            instance=self.org_obj, data=self.request.POST, files=self.request.FILES)
 
         result = {}
         if form.is_valid():
@@ -159,8 +215,7 @@ class EditPatchView(ModelFormAdminView, ListAdminView):
         else:
             result['result'] = 'error'
             result['errors'] = JsonErrorDict(form.errors, form).as_json()
-
-        return self.render_response(result)
+        return result
 
 
 site.register_plugin(EditablePlugin, ListAdminView)
@@ -4,18 +4,15 @@ import sys
 from future.utils import iteritems
 
 from django.http import HttpResponse
-from django.template import loader
 from django.utils import six
 from django.utils.encoding import force_text, smart_text
-from django.utils.html import escape
 from django.utils.translation import ugettext as _
 from django.utils.xmlutils import SimplerXMLGenerator
-from django.db.models import BooleanField, NullBooleanField
 
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ListAdminView
-from xadmin.util import json
+from xadmin.util import json, render_to_string
 from xadmin.views.list import ALL_VAR
 
 try:
@@ -49,8 +46,8 @@ class ExportMenuPlugin(BaseAdminPlugin):
                 'form_params': self.admin_view.get_form_params({'_do_': 'export'}, ('export_type',)),
                 'export_types': [{'type': et, 'name': self.export_names[et]} for et in self.list_export],
             })
-            nodes.append(loader.render_to_string('xadmin/blocks/model_list.top_toolbar.exports.html',
-                                                 context=get_context_dict(context)))
+            nodes.append(render_to_string('xadmin/blocks/model_list.top_toolbar.exports.html',
+                                          context=get_context_dict(context)))
 
 
 class ExportPlugin(BaseAdminPlugin):
@@ -63,14 +60,7 @@ class ExportPlugin(BaseAdminPlugin):
         return self.request.GET.get('_do_') == 'export'
 
     def _format_value(self, o):
-        if (o.field is None and getattr(o.attr, 'boolean', False)) or \
-           (o.field and isinstance(o.field, (BooleanField, NullBooleanField))):
-                value = o.value
-        elif str(o.text).startswith("<span class='text-muted'>"):
-            value = escape(str(o.text)[25:-7])
-        else:
-            value = escape(str(o.text))
-        return value
+        return self.admin_view.get_column_formatter(o.field_name).export_value(o)
 
     def _get_objects(self, context):
         headers = [c for c in context['result_headers'].cells if c.export]
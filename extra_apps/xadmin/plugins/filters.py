@@ -9,7 +9,6 @@ from django.db import models
 from django.db.models.fields import FieldDoesNotExist
 from django.db.models.constants import LOOKUP_SEP
 # from django.db.models.sql.constants import QUERY_TERMS
-from django.template import loader
 from django.utils import six
 from django.utils.encoding import smart_str
 from django.utils.translation import ugettext as _
@@ -18,7 +17,7 @@ from xadmin.filters import manager as filter_manager, FILTER_PREFIX, SEARCH_VAR,
     RelatedFieldSearchFilter
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ListAdminView
-from xadmin.util import is_related_field
+from xadmin.util import is_related_field, render_to_string
 from functools import reduce
 
 
@@ -225,8 +224,8 @@ class FilterPlugin(BaseAdminPlugin):
     # Block Views
     def block_nav_menu(self, context, nodes):
         if self.has_filters:
-            nodes.append(loader.render_to_string('xadmin/blocks/model_list.nav_menu.filters.html',
-                                                 context=get_context_dict(context)))
+            nodes.append(render_to_string('xadmin/blocks/model_list.nav_menu.filters.html',
+                                          context=get_context_dict(context)))
 
     def block_nav_form(self, context, nodes):
         if self.search_fields:
@@ -237,7 +236,7 @@ class FilterPlugin(BaseAdminPlugin):
                 'search_form_params': self.admin_view.get_form_params(remove=[SEARCH_VAR])
             })
             nodes.append(
-                loader.render_to_string(
+                render_to_string(
                     'xadmin/blocks/model_list.nav_form.search_form.html',
                     context=context)
             )
@@ -0,0 +1,229 @@
+# coding: utf-8
+"""
+Spreadsheet like editing of a list page. With ``?_grid=1`` the cells of
+``list_grid_editable`` become inputs, the changes of many rows are kept in
+the page and saved at once by ``GridSaveView``.
+"""
+from __future__ import unicode_literals
+
+import json
+
+from django import forms
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.http import HttpResponseBadRequest
+from django.utils.encoding import force_text
+from django.utils.html import conditional_escape, escape
+from django.utils.safestring import mark_safe
+from django.utils.text import get_text_list
+from django.utils.translation import ugettext as _
+
+from xadmin.plugins.ajax import NON_FIELD_ERRORS
+from xadmin.plugins.utils import get_context_dict
+from xadmin.sites import site
+from xadmin.util import get_auto_now_fields, render_to_string
+from xadmin.views import BaseAdminPlugin, ListAdminView, ModelFormAdminView
+from xadmin.views.base import csrf_protect_m
+
+GRID_VAR = '_grid'
+# widgets the grid can edit with a single input, multi widgets (such as the
+# split date time) and search widgets are not editable in the grid.
+GRID_WIDGETS = (forms.TextInput, forms.NumberInput, forms.DateInput, forms.TimeInput,
+                forms.Textarea, forms.CheckboxInput, forms.Select)
+
+
+def get_grid_widget(formfield):
+    widget = formfield.widget
+    # RelatedFieldWidgetWrapper of the quick add buttons
+    widget = getattr(widget, 'widget', widget)
+    if isinstance(widget, GRID_WIDGETS) and not isinstance(widget, (forms.MultiWidget, forms.SelectMultiple)):
+        return widget
+    return None
+
+
+def get_grid_value(formfield, obj, field_name):
+    """
+    Value of a cell in the format of its grid input.
+    """
+    value = obj._meta.get_field(field_name).value_from_object(obj)
+    widget = get_grid_widget(formfield)
+    if isinstance(widget, forms.CheckboxInput):
+        return 'true' if value else 'false'
+    value = widget.format_value(formfield.prepare_value(value))
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    return '' if value is None else force_text(value)
+
+
+class GridEditPlugin(BaseAdminPlugin):
+
+    list_grid_editable = []
+
+    def init_request(self, *args, **kwargs):
+        if not (self.list_grid_editable and self.admin_view.has_change_permission()):
+            return False
+        self.grid_mode = self.request.method == 'GET' and self.request.GET.get(GRID_VAR) == '1'
+        return True
+
+    @property
+    def grid_view(self):
+        if not hasattr(self, '_grid_view'):
+            self._grid_view = self.get_model_view(GridSaveView, self.model)
+        return self._grid_view
+
+    @property
+    def grid_fields(self):
+        if not hasattr(self, '_grid_fields'):
+            self._grid_fields = dict((f, self.grid_view.get_grid_formfield(f))
+                                     for f in self.grid_view.get_grid_fields()
+                                     if f in self.admin_view.list_display)
+        return self._grid_fields
+
+    def result_item(self, item, obj, field_name, row):
+        if self.grid_mode and field_name in self.grid_fields:
+            item.classes.append('grid-cell')
+            item.tag_attrs.append('data-grid-pk="%s" data-grid-field="%s" data-grid-value="%s"' % (
+                escape(obj.pk), escape(field_name),
+                escape(get_grid_value(self.grid_fields[field_name], obj, field_name))))
+        return item
+
+    def get_media(self, media):
+        if self.grid_mode:
+            media = media + self.vendor('xadmin.plugin.gridedit.js')
+        return media
+
+    def block_top_toolbar(self, context, nodes):
+        context.update({
+            'grid_mode': self.grid_mode,
+            'grid_url': self.admin_view.get_query_string({GRID_VAR: '1'}),
+            'clean_grid_url': self.admin_view.get_query_string(remove=(GRID_VAR,)),
+            'grid_save_url': self.get_model_url(self.model, 'grid_save'),
+        })
+        nodes.append(render_to_string('xadmin/blocks/model_list.top_toolbar.gridedit.html',
+                                      get_context_dict(context)))
+
+    def block_extrabody(self, context, nodes):
+        # one input per column, copied by the script into the cells.
+        if self.grid_mode and self.grid_fields:
+            editors = []
+            for field_name, formfield in self.grid_fields.items():
+                widget = get_grid_widget(formfield)
+                attrs = {'id': 'grid_editor_%s' % field_name}
+                if not isinstance(widget, forms.CheckboxInput):
+                    attrs['class'] = 'form-control input-sm'
+                editors.append('<div data-grid-field="%s">%s</div>' % (
+                    escape(field_name), widget.render('', None, attrs=attrs)))
+            nodes.append('<div id="grid-editors" class="hide">%s</div>' % ''.join(editors))
+
+
+class GridSaveView(ModelFormAdminView, ListAdminView):
+    """
+    Saves the changes of the grid edit mode, posted as json::
+
+        {"rows": {"<pk>": {"<field>": "<value>", ...}, ...}}
+
+    Each row is validated by the admin form of its changed fields, then the
+    rows are written in one transaction, with one ``bulk_update()`` per set
+    of changed fields, and logged. When a row is invalid nothing is saved,
+    and the answer lists the errors of each row.
+    """
+
+    def init_request(self, *args, **kwargs):
+        if not self.has_change_permission():
+            raise PermissionDenied
+
+    def get_grid_form_class(self, fields):
+        return self.model_form_factory(form=self.form, fields=list(fields),
+                                       formfield_callback=self.formfield_for_dbfield)
+
+    def get_grid_formfield(self, field_name):
+        return self.get_grid_form_class([field_name]).base_fields[field_name]
+
+    def get_grid_fields(self):
+        """
+        The fields of ``list_grid_editable`` that have a form field the grid
+        can edit.
+        """
+        model_fields = set(f.name for f in self.opts.fields if f.editable and not f.primary_key)
+        fields = [f for f in self.list_grid_editable if f in model_fields]
+        form_class = self.get_grid_form_class(fields)
+        return [f for f in fields if f in form_class.base_fields
+                and get_grid_widget(form_class.base_fields[f]) is not None]
+
+    def get_new_html(self, obj, field_name):
+        item = self.result_item(obj, field_name, {'is_display_first': False, 'object': obj})
+        return mark_safe(item.text) if item.allow_tags else conditional_escape(item.text)
+
+    def prepare_grid_obj(self, obj, fields):
+        """
+        Set the values a whole save would also set on ``obj`` and return the
+        fields to write. ``bulk_update()`` runs neither ``pre_save()`` nor
+        ``save_models``, so the ``auto_now`` fields are set here, and admins
+        that set fields in ``save_models`` override this method to set them
+        too.
+        """
+        auto_now_fields = [f for f in get_auto_now_fields(self.opts) if f not in fields]
+        for f in auto_now_fields:
+            self.opts.get_field(f).pre_save(obj, False)
+        return list(fields) + auto_now_fields
+
+    def save_grid(self, objs, fields):
+        manager = self.model._default_manager
+        if hasattr(manager, 'bulk_update'):
+            manager.bulk_update(objs, fields)
+        else:
+            # bulk_update() is new in django 2.2
+            for obj in objs:
+                obj.save(update_fields=fields)
+
+    @csrf_protect_m
+    def post(self, request, *args, **kwargs):
+        try:
+            rows = json.loads(request.body.decode('utf-8'))['rows']
+            rows = dict((force_text(pk), dict(data)) for pk, data in rows.items())
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return HttpResponseBadRequest()
+
+        grid_fields = set(self.get_grid_fields())
+        objs = dict((force_text(pk), obj) for pk, obj in self.queryset().in_bulk(list(rows)).items())
+        changed = []
+        errors = {}
+        for pk, data in rows.items():
+            obj = objs.get(pk)
+            if obj is None or not self.has_change_permission(obj):
+                errors[pk] = [{'name': NON_FIELD_ERRORS,
+                               'errors': [_('The object does not exist or cannot be changed.')]}]
+                continue
+            fields = sorted(f for f in data if f in grid_fields)
+            if not fields:
+                continue
+            form = self.get_grid_form_class(fields)(instance=obj, data=data)
+            if form.is_valid():
+                changed.append((pk, form, fields))
+            else:
+                errors[pk] = [{'name': name, 'errors': messages} for name, messages in form.errors.items()]
+
+        if errors:
+            return self.render_response({'result': 'error', 'errors': errors})
+
+        # one bulk_update() per set of changed fields, a row only writes the
+        # fields changed in it.
+        groups = {}
+        for pk, form, fields in changed:
+            update_fields = tuple(self.prepare_grid_obj(form.instance, fields))
+            groups.setdefault(update_fields, []).append(form.instance)
+        with transaction.atomic():
+            for update_fields, group in groups.items():
+                self.save_grid(group, list(update_fields))
+            for pk, form, fields in changed:
+                self.log('change', _('Changed %s.') % get_text_list(form.changed_data or fields, _('and')),
+                         form.instance)
+        return self.render_response({
+            'result': 'success',
+            'count': len(changed),
+            'new_html': dict((pk, dict((f, self.get_new_html(form.instance, f)) for f in fields))
+                             for pk, form, fields in changed),
+        })
+
+site.register_plugin(GridEditPlugin, ListAdminView)
+site.register_modelview(r'^grid-save/$', GridSaveView, name='%s_%s_grid_save')
@@ -0,0 +1,39 @@
+from django.utils.translation import ugettext as _
+
+from xadmin.models import Log
+from xadmin.plugins.utils import get_context_dict
+from xadmin.sites import site
+from xadmin.views import BaseAdminPlugin, DetailAdminView, UpdateAdminView
+from xadmin.util import render_to_string
+
+
+class ObjectHistoryPlugin(BaseAdminPlugin):
+    """
+    Shows the latest log entries of the current object under its fields.
+    Enable with ``show_object_history = True`` on the model admin.
+    """
+
+    show_object_history = False
+    object_history_limit = 10
+
+    def init_request(self, *args, **kwargs):
+        return bool(self.show_object_history) and self.has_request_perm('xadmin.view_log')
+
+    def get_history_object(self):
+        return getattr(self.admin_view, 'org_obj', None) or getattr(self.admin_view, 'obj', None)
+
+    def block_after_fieldsets(self, context, nodes):
+        obj = self.get_history_object()
+        if obj is None or obj.pk is None:
+            return
+        entries = list(Log.objects.for_object(obj).select_related('user')[:self.object_history_limit])
+        context.update({
+            'history_title': _('History'),
+            'history_entries': entries,
+        })
+        nodes.append(render_to_string('xadmin/blocks/model_form.after_fieldsets.history.html',
+                                      context=get_context_dict(context)))
+
+
+site.register_plugin(ObjectHistoryPlugin, DetailAdminView)
+site.register_plugin(ObjectHistoryPlugin, UpdateAdminView)
@@ -65,6 +65,12 @@ class ModelDetailPlugin(BaseAdminPlugin):
             self.include_image = True
         return attrs
 
+    def get_model_form(self, form_class, **kwargs):
+        # a cached form class is built without calling get_field_attrs().
+        if any(isinstance(f, AdminImageField) for f in form_class.base_fields.values()):
+            self.include_image = True
+        return form_class
+
     def get_field_result(self, result, field_name):
         if isinstance(result.field, models.ImageField):
             if result.value:
@@ -39,11 +39,11 @@ class FooAdmin(object):
 More info about django-import-export please refer https://github.com/django-import-export/django-import-export
 """
 from datetime import datetime
-from django.template import loader
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ListAdminView, ModelAdminView
 from xadmin.views.base import csrf_protect_m, filter_hook
+from xadmin.util import render_to_string
 from django.db import transaction
 from import_export.admin import DEFAULT_FORMATS, SKIP_ADMIN_LOG, TMP_STORAGE_CLASS
 from import_export.resources import modelresource_factory
@@ -84,8 +84,8 @@ class ImportMenuPlugin(BaseAdminPlugin):
             context.update({
                 'import_url': import_url,
             })
-            nodes.append(loader.render_to_string('xadmin/blocks/model_list.top_toolbar.importexport.import.html',
-                                                 context=context))
+            nodes.append(render_to_string('xadmin/blocks/model_list.top_toolbar.importexport.import.html',
+                                          context=context))
 
 
 class ImportBaseView(ModelAdminView):
@@ -419,8 +419,8 @@ class ExportMenuPlugin(ExportMixin, BaseAdminPlugin):
             'opts': self.opts,
             'form_params': self.admin_view.get_form_params({'_action_': 'export'}),
         })
-        nodes.append(loader.render_to_string('xadmin/blocks/model_list.top_toolbar.importexport.export.html',
-                                             context=context))
+        nodes.append(render_to_string('xadmin/blocks/model_list.top_toolbar.importexport.export.html',
+                                      context=context))
 
 
 class ExportPlugin(ExportMixin, BaseAdminPlugin):
@@ -4,8 +4,6 @@ from django import forms
 from django.forms.formsets import all_valid, DELETION_FIELD_NAME
 from django.forms.models import inlineformset_factory, BaseInlineFormSet, modelform_defines_fields
 from django.contrib.contenttypes.forms import BaseGenericInlineFormSet, generic_inlineformset_factory
-from django.template import loader
-from django.template.loader import render_to_string
 from django.contrib.auth import get_permission_codename
 from django.utils import six
 from django.utils.encoding import smart_text
@@ -15,6 +13,7 @@ from xadmin.layout import FormHelper, Layout, flatatt, Container, Column, Field,
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ModelFormAdminView, DetailAdminView, filter_hook
+from xadmin.util import render_to_string
 
 
 class ShowField(Field):
@@ -32,7 +31,7 @@ class ShowField(Field):
         for field in self.fields:
             if not isinstance(form.fields[field].widget, forms.HiddenInput):
                 result = detail.get_field_result(field)
-                html += loader.render_to_string(
+                html += render_to_string(
                     self.template, context={'field': form[field], 'result': result})
         return html
 
@@ -263,7 +262,7 @@ class InlineModelAdmin(ModelFormAdminView):
             return self.has_change_permission()
 
         codename = get_permission_codename('add', self.opts)
-        return self.user.has_perm("%s.%s" % (self.opts.app_label, codename))
+        return self.has_request_perm("%s.%s" % (self.opts.app_label, codename))
 
     def has_change_permission(self):
         opts = self.opts
@@ -274,14 +273,14 @@ class InlineModelAdmin(ModelFormAdminView):
                     break
 
         codename = get_permission_codename('change', opts)
-        return self.user.has_perm("%s.%s" % (opts.app_label, codename))
+        return self.has_request_perm("%s.%s" % (opts.app_label, codename))
 
     def has_delete_permission(self):
         if self.opts.auto_created:
             return self.has_change_permission()
 
         codename = get_permission_codename('delete', self.opts)
-        return self.user.has_perm("%s.%s" % (self.opts.app_label, codename))
+        return self.has_request_perm("%s.%s" % (self.opts.app_label, codename))
 
 
 class GenericInlineModelAdmin(InlineModelAdmin):
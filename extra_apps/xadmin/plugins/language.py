@@ -1,10 +1,10 @@
 
 from django.conf import settings
-from django.template import loader
 from django.views.i18n import set_language
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, CommAdminView, BaseAdminView
+from xadmin.util import render_to_string
 
 
 class SetLangNavPlugin(BaseAdminPlugin):
@@ -12,7 +12,7 @@ class SetLangNavPlugin(BaseAdminPlugin):
     def block_top_navmenu(self, context, nodes):
         context = get_context_dict(context)
         context['redirect_to'] = self.request.get_full_path()
-        nodes.append(loader.render_to_string('xadmin/blocks/comm.top.setlang.html', context=context))
+        nodes.append(render_to_string('xadmin/blocks/comm.top.setlang.html', context=context))
 
 
 class SetLangView(BaseAdminView):
@@ -1,17 +1,25 @@
 # coding:utf-8
+import hashlib
 from itertools import chain
 
 import xadmin
 from django import forms
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.db.models import ManyToManyField
+from django.db.models.signals import post_delete, post_save
 from django.forms.utils import flatatt
-from django.template import loader
+from django.http import Http404
+from django.utils import translation
 from django.utils.encoding import force_text
 from django.utils.html import escape, conditional_escape
 from django.utils.safestring import mark_safe
-from xadmin.util import vendor
+from xadmin.util import vendor, render_to_string
 from xadmin.views import BaseAdminPlugin, ModelFormAdminView
 
+# related models whose saves and deletes expire their cached transfer choices
+_transfer_models = set()
+
 
 class SelectMultipleTransfer(forms.SelectMultiple):
 
@@ -29,21 +37,14 @@ class SelectMultipleTransfer(forms.SelectMultiple):
         return u'<option value="%s">%s</option>' % (
             escape(option_value), conditional_escape(force_text(option_label))), bool(option_value in selected_choices)
 
-    def render(self, name, value, attrs=None, choices=()):
-        if attrs is None:
-            attrs = {}
-        attrs['class'] = ''
-        if self.is_stacked:
-            attrs['class'] += 'stacked'
-        if value is None:
-            value = []
-        final_attrs = self.build_attrs(attrs, extra_attrs={'name': name})
-
-        selected_choices = set(force_text(v) for v in value)
+    def render_options(self, selected_choices, choices):
+        """
+        ``(available, chosen)`` option tags of ``choices``.
+        """
         available_output = []
         chosen_output = []
 
-        for option_value, option_label in chain(self.choices, choices):
+        for option_value, option_label in choices:
             if isinstance(option_label, (list, tuple)):
                 available_output.append(u'<optgroup label="%s">' %
                                         escape(force_text(option_value)))
@@ -62,6 +63,20 @@ class SelectMultipleTransfer(forms.SelectMultiple):
                     chosen_output.append(output)
                 else:
                     available_output.append(output)
+        return available_output, chosen_output
+
+    def render(self, name, value, attrs=None, choices=()):
+        if attrs is None:
+            attrs = {}
+        attrs['class'] = ''
+        if self.is_stacked:
+            attrs['class'] += 'stacked'
+        if value is None:
+            value = []
+        final_attrs = self.build_attrs(attrs, extra_attrs={'name': name})
+
+        selected_choices = set(force_text(v) for v in value)
+        available_output, chosen_output = self.render_options(selected_choices, chain(self.choices, choices))
 
         context = {
             'verbose_name': self.verbose_name,
@@ -70,8 +85,37 @@ class SelectMultipleTransfer(forms.SelectMultiple):
             'flatatts': flatatt(final_attrs),
             'available_options': u'\n'.join(available_output),
             'chosen_options': u'\n'.join(chosen_output),
+            'choices_url': getattr(self, 'choices_url', None),
         }
-        return mark_safe(loader.render_to_string('xadmin/forms/transfer.html', context))
+        return mark_safe(render_to_string('xadmin/forms/transfer.html', context))
+
+
+class SelectMultipleTransferAjax(SelectMultipleTransfer):
+    """
+    Transfer widget of the ``m2m_transfer_ajax`` style: only the chosen
+    options are rendered, the available ones are searched and loaded in
+    pages from ``choices_url`` (see ``TransferChoicesView``).
+    """
+
+    def __init__(self, verbose_name, is_stacked, choices_url, attrs=None, choices=()):
+        self.choices_url = choices_url
+        super(SelectMultipleTransferAjax, self).__init__(verbose_name, is_stacked, attrs, choices)
+
+    def get_chosen_choices(self, selected_choices):
+        queryset = getattr(self.choices, 'queryset', None)
+        if queryset is None:
+            return [(v, l) for v, l in self.choices if force_text(v) in selected_choices]
+        if not selected_choices:
+            return []
+        key = self.choices.field.to_field_name or 'pk'
+        try:
+            return [self.choices.choice(obj) for obj in queryset.filter(**{'%s__in' % key: selected_choices})]
+        except (ValueError, ValidationError):
+            return []
+
+    def render_options(self, selected_choices, choices):
+        return [], [self.render_opt(selected_choices, value, label)[0]
+                    for value, label in self.get_chosen_choices(selected_choices)]
 
 
 class SelectMultipleDropdown(forms.SelectMultiple):
@@ -93,15 +137,96 @@ class M2MSelectPlugin(BaseAdminPlugin):
         return hasattr(self.admin_view, 'style_fields') and \
             (
                 'm2m_transfer' in self.admin_view.style_fields.values() or
+                'm2m_transfer_ajax' in self.admin_view.style_fields.values() or
                 'm2m_dropdown' in self.admin_view.style_fields.values()
         )
 
     def get_field_style(self, attrs, db_field, style, **kwargs):
         if style == 'm2m_transfer' and isinstance(db_field, ManyToManyField):
             return {'widget': SelectMultipleTransfer(db_field.verbose_name, False), 'help_text': ''}
+        if style == 'm2m_transfer_ajax' and isinstance(db_field, ManyToManyField):
+            choices_url = '%s?field=%s' % (self.admin_view.model_admin_url('transfer'), db_field.name)
+            return {'widget': SelectMultipleTransferAjax(db_field.verbose_name, False, choices_url), 'help_text': ''}
         if style == 'm2m_dropdown' and isinstance(db_field, ManyToManyField):
             return {'widget': SelectMultipleDropdown, 'help_text': ''}
         return attrs
 
 
+def transfer_choices_version_key(model):
+    return 'xadmin_transfer_choices_version_%s' % model._meta.label_lower
+
+
+def clear_transfer_choices(sender, **kwargs):
+    # the cached choices of the model are left to expire, under the old version.
+    try:
+        cache.incr(transfer_choices_version_key(sender))
+    except ValueError:
+        cache.set(transfer_choices_version_key(sender), 1, None)
+
+
+def get_transfer_choices(admin_view, field_name, formfield):
+    """
+    ``(value, label, lower case label)`` of every choice of ``formfield``,
+    kept in the django cache until an object of the related model is saved
+    or deleted, and at most ``transfer_cache_timeout`` seconds, as a
+    process local cache does not see the saves of the other processes.
+    """
+    model = formfield.queryset.model
+    if model not in _transfer_models:
+        post_save.connect(clear_transfer_choices, sender=model, weak=False,
+                          dispatch_uid='xadmin_transfer_choices_save')
+        post_delete.connect(clear_transfer_choices, sender=model, weak=False,
+                            dispatch_uid='xadmin_transfer_choices_delete')
+        _transfer_models.add(model)
+    version = cache.get(transfer_choices_version_key(model), 0)
+    key = repr((admin_view.__class__.__name__, field_name, translation.get_language()))
+    key = 'xadmin_transfer_choices_%s_%s_%s' % (
+        model._meta.label_lower, version, hashlib.md5(key.encode('utf-8')).hexdigest())
+    choices = cache.get(key)
+    if choices is None:
+        choices = []
+        for value, label in formfield.choices:
+            label = force_text(label)
+            choices.append((force_text(value), label, label.lower()))
+        cache.set(key, choices, admin_view.transfer_cache_timeout)
+    return choices
+
+
+class TransferChoicesView(ModelFormAdminView):
+    """
+    Available choices of a ``m2m_transfer_ajax`` field, searched with the
+    ``q`` words and paged with ``p``::
+
+        {"choices": [[value, label], ...], "more": true}
+    """
+    transfer_page_size = 100
+    transfer_cache_timeout = 300
+
+    def init_request(self, *args, **kwargs):
+        if not (self.has_add_permission() or self.has_change_permission()):
+            raise PermissionDenied
+        self.field_name = self.request.GET.get('field')
+        if self.style_fields.get(self.field_name) != 'm2m_transfer_ajax':
+            raise Http404
+
+    def get(self, request, *args, **kwargs):
+        formfield = self.formfield_for_dbfield(self.opts.get_field(self.field_name))
+        choices = get_transfer_choices(self, self.field_name, formfield)
+
+        words = request.GET.get('q', '').lower().split()
+        if words:
+            choices = [c for c in choices if all(w in c[2] for w in words)]
+        try:
+            page = max(int(request.GET.get('p', 0)), 0)
+        except ValueError:
+            page = 0
+        start = page * self.transfer_page_size
+        end = start + self.transfer_page_size
+        return self.render_response({
+            'choices': [c[:2] for c in choices[start:end]],
+            'more': len(choices) > end,
+        })
+
+
 xadmin.site.register_plugin(M2MSelectPlugin, ModelFormAdminView)
+xadmin.site.register_modelview(r'^transfer/$', TransferChoicesView, name='%s_%s_transfer')
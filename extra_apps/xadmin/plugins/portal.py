@@ -1,6 +1,6 @@
 #coding:utf-8
 from xadmin.sites import site
-from xadmin.models import UserSettings
+from xadmin.models import get_user_settings
 from xadmin.views import BaseAdminPlugin, ModelFormAdminView, DetailAdminView
 from xadmin.layout import Fieldset, Column
 
@@ -42,17 +42,17 @@ class ModelFormPlugin(BasePortalPlugin):
                 f.css_id = 'box-%d' % i
             fs_map[f.css_id] = f
 
-        try:
-            layout_pos = UserSettings.objects.get(
-                user=self.user, key=self._portal_key()).value
-            layout_cs = layout_pos.split('|')
-            for i, c in enumerate(cs):
-                c.fields = [fs_map.pop(j) for j in layout_cs[i].split(
-                    ',') if j in fs_map] if len(layout_cs) > i else []
-            if fs_map and cs:
-                cs[0].fields.extend(fs_map.values())
-        except Exception:
-            pass
+        layout_pos = get_user_settings(self.user).get(self._portal_key())
+        if layout_pos is not None:
+            try:
+                layout_cs = layout_pos.split('|')
+                for i, c in enumerate(cs):
+                    c.fields = [fs_map.pop(j) for j in layout_cs[i].split(
+                        ',') if j in fs_map] if len(layout_cs) > i else []
+                if fs_map and cs:
+                    cs[0].fields.extend(fs_map.values())
+            except Exception:
+                pass
 
         return helper
 
@@ -8,7 +8,7 @@ from django.utils import six
 from django.utils.translation import ugettext_lazy as _
 from xadmin.filters import manager, MultiSelectFieldListFilter
 from xadmin.plugins.filters import *
-from xadmin.util import is_related_field
+from xadmin.util import is_related_field, render_to_string
 
 
 @manager.register
@@ -162,7 +162,7 @@ class QuickFilterPlugin(BaseAdminPlugin):
             return queryset
 
     def block_left_navbar(self, context, nodes):
-        nodes.append(loader.render_to_string('xadmin/blocks/modal_list.left_navbar.quickfilter.html',
-                                             get_context_dict(context)))
+        nodes.append(render_to_string('xadmin/blocks/modal_list.left_navbar.quickfilter.html',
+                                      get_context_dict(context)))
 
 site.register_plugin(QuickFilterPlugin, ListAdminView)
@@ -2,7 +2,6 @@ from django.db import models
 from django import forms
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext as _
-from django.forms.models import modelform_factory
 import copy
 from xadmin.sites import site
 from xadmin.util import get_model_from_relation, vendor
@@ -26,7 +25,7 @@ class QuickFormPlugin(BaseAdminPlugin):
                 "fields": self.request.GET['_field'].split(','),
                 "formfield_callback": self.admin_view.formfield_for_dbfield,
             }
-            return modelform_factory(self.model, **defaults)
+            return self.admin_view.model_form_factory(**defaults)
         return __()
 
     def get_form_layout(self, __):
@@ -106,5 +105,13 @@ class QuickAddBtnPlugin(BaseAdminPlugin):
                     formfield.widget, db_field.remote_field, add_url, self.get_model_url(self.model, 'add'))
         return formfield
 
+    def get_model_form_cache_key(self, key, callback_key, **defaults):
+        # the add buttons are only shown for the related models the user can add.
+        if key is None:
+            return None
+        return key + (tuple(self.has_model_perm(get_model_from_relation(f), 'add')
+                            for f in self.opts.fields + self.opts.many_to_many
+                            if isinstance(f, (models.ForeignKey, models.ManyToManyField))),)
+
 site.register_plugin(QuickFormPlugin, ModelFormAdminView)
 site.register_plugin(QuickAddBtnPlugin, ModelFormAdminView)
@@ -1,9 +1,9 @@
 # coding=utf-8
-from django.template import loader
 
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ListAdminView
+from xadmin.util import render_to_string
 
 REFRESH_VAR = '_refresh'
 
@@ -32,8 +32,8 @@ class RefreshPlugin(BaseAdminPlugin):
                     'selected': str(r) == current_refresh,
                 } for r in self.refresh_times],
             })
-            nodes.append(loader.render_to_string('xadmin/blocks/model_list.top_toolbar.refresh.html',
-                                                 get_context_dict(context)))
+            nodes.append(render_to_string('xadmin/blocks/model_list.top_toolbar.refresh.html',
+                                          get_context_dict(context)))
 
 
 site.register_plugin(RefreshPlugin, ListAdminView)
@@ -1,7 +1,6 @@
 # coding=UTF-8
 from itertools import chain
 
-from django.urls.base import reverse
 from django.db.models.options import PROXY_PARENTS
 from django.utils import six
 from django.utils.encoding import force_text
@@ -62,19 +61,20 @@ class RelateMenuPlugin(BaseAdminPlugin):
             if not (has_view_perm or has_add_perm):
                 continue
 
-            _related_acts.append((rel, has_view_perm, has_add_perm))
+            # the menu links only differ by the instance pk, resolve them once.
+            list_url = self.get_model_url(rel.related_model, 'changelist') if has_view_perm else None
+            add_url = self.get_model_url(rel.related_model, 'add') if has_add_perm else None
+
+            _related_acts.append((rel, has_view_perm, has_add_perm, list_url, add_url))
 
         self._related_acts = _related_acts
         return self._related_acts
 
     def related_link(self, instance):
         links = []
-        for rel, view_perm, add_perm in self.get_related_list():
+        for rel, view_perm, add_perm, list_url, add_url in self.get_related_list():
             opts = rel.related_model._meta
 
-            label = opts.app_label
-            model_name = opts.model_name
-
             field = rel.field
             rel_name = rel.get_related_field().name
 
@@ -85,15 +85,13 @@ class RelateMenuPlugin(BaseAdminPlugin):
 
                             '<a href="%s?%s=%s" title="%s"><i class="icon fa fa-th-list"></i> %s</a>' %
                             (
-                                reverse('%s:%s_%s_changelist' % (
-                                    self.admin_site.app_name, label, model_name)),
+                                list_url,
                                 RELATE_PREFIX + lookup_name, str(instance.pk), verbose_name, verbose_name) if view_perm else
                             '<a><span class="text-muted"><i class="icon fa fa-blank"></i> %s</span></a>' % verbose_name,
 
                             '<a class="add_link dropdown-menu-btn" href="%s?%s=%s"><i class="icon fa fa-plus pull-right"></i></a>' %
                             (
-                                reverse('%s:%s_%s_add' % (
-                                    self.admin_site.app_name, label, model_name)),
+                                add_url,
                                 RELATE_PREFIX + lookup_name, str(
                                     instance.pk)) if add_perm else "",
 
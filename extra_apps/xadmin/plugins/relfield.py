@@ -1,12 +1,23 @@
+import hashlib
+import operator
+from functools import reduce
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import PermissionDenied
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 from django.forms.utils import flatatt
+from django.utils.encoding import force_text
 from django.utils.html import escape, format_html
 from django.utils.safestring import mark_safe
 from django.utils.text import Truncator
 from django.utils.translation import ugettext as _
 from django import forms
+from xadmin.filters import FILTER_PREFIX, SEARCH_VAR
 from xadmin.sites import site
-from xadmin.views import BaseAdminPlugin, ModelFormAdminView
+from xadmin.views import BaseAdminPlugin, ModelAdminView, ModelFormAdminView
+from xadmin.views.base import filter_hook
 from xadmin.util import vendor
 
 
@@ -14,7 +25,8 @@ class ForeignKeySearchWidget(forms.Widget):
 
     def __init__(self, rel, admin_view, attrs=None, using=None):
         self.rel = rel
-        self.admin_view = admin_view
+        # the widget may live in a cached form class, it keeps the site and not the view of a request.
+        self.admin_site = admin_view.admin_site
         self.db = using
         super(ForeignKeySearchWidget, self).__init__(attrs)
 
@@ -24,8 +36,8 @@ class ForeignKeySearchWidget(forms.Widget):
             attrs['class'] = 'select-search'
         else:
             attrs['class'] = attrs['class'] + ' select-search'
-        attrs['data-search-url'] = self.admin_view.get_admin_url(
-            '%s_%s_changelist' % (to_opts.app_label, to_opts.model_name))
+        attrs['data-search-url'] = self.admin_site.reverse(
+            '%s:%s_%s_autocomplete' % (self.admin_site.app_name, to_opts.app_label, to_opts.model_name))
         attrs['data-placeholder'] = _('Search %s') % to_opts.verbose_name
         attrs['data-choices'] = '?'
         if self.rel.limit_choices_to:
@@ -81,4 +93,128 @@ class RelateFieldPlugin(BaseAdminPlugin):
                             widget=(style == 'fk-ajax' and ForeignKeySearchWidget or ForeignKeySelectWidget)(db_field.remote_field, self.admin_view, using=db))
         return attrs
 
+    def get_model_form_cache_key(self, key, callback_key, **defaults):
+        # the search widgets are only used for the related models the user can view.
+        if key is None:
+            return None
+        return key + (tuple(self.has_model_perm(f.remote_field.to, 'view') for f in self.opts.fields
+                            if isinstance(f, models.ForeignKey)
+                            and f.remote_field.to in self.admin_view.admin_site._registry),)
+
 site.register_plugin(RelateFieldPlugin, ModelFormAdminView)
+
+
+# models whose saves and deletes expire their cached autocomplete answers
+_autocomplete_models = set()
+
+
+def autocomplete_version_key(model):
+    return 'xadmin_autocomplete_version_%s' % model._meta.label_lower
+
+
+def clear_autocomplete_cache(sender, **kwargs):
+    # the cached answers of the model are left to expire, under the old version.
+    cache = caches[AutocompleteView.autocomplete_cache_config['cache']]
+    try:
+        cache.incr(autocomplete_version_key(sender))
+    except ValueError:
+        cache.set(autocomplete_version_key(sender), 1, None)
+
+
+class AutocompleteView(ModelAdminView):
+    """
+    Objects whose ``autocomplete_fields`` start with the ``_q_`` words, for
+    the search widgets of ``fk-ajax``/``fk-select`` fields and filters. One
+    query of at most ``autocomplete_limit`` rows, no list view plugins, in
+    the format of the change list ajax answer::
+
+        {"objects": [{"id": 1, "__str__": "..."}, ...], "has_more": false}
+
+    The labels are ``str(obj)``, as in the initial value of the widgets and
+    filters.
+
+    When ``autocomplete_cache_config['enabled']``, the answers of short (hot)
+    prefixes are cached per user until an object of the model is saved or
+    deleted. The version of the answers is kept in the cache, so the cache
+    must be shared by all the server processes: a process local cache
+    (``LocMemCache``, the default when ``CACHES`` is not set) is not used.
+    """
+    search_fields = ()
+    # fields matched with istartswith, default: the search_fields.
+    autocomplete_fields = None
+    autocomplete_limit = 20
+    autocomplete_cache_config = {'enabled': False, 'cache': 'default', 'timeout': 600, 'prefix_length': 2}
+
+    def init_request(self, *args, **kwargs):
+        if not self.has_view_permission():
+            raise PermissionDenied
+
+    def get_autocomplete_fields(self):
+        if self.autocomplete_fields is not None:
+            return list(self.autocomplete_fields)
+        return [str(f).lstrip('^=@') for f in self.search_fields]
+
+    def get_lookup_params(self):
+        """
+        ``limit_choices_to`` lookups of the relations to the model, the only
+        filters the search widgets send.
+        """
+        allowed = set()
+        for lookups in self.opts.related_fkey_lookups:
+            if isinstance(lookups, dict):
+                allowed.update((k, '%s' % v) for k, v in lookups.items())
+        params = []
+        for key, value in self.request.GET.items():
+            if key.startswith(FILTER_PREFIX) and (key[len(FILTER_PREFIX):], value) in allowed:
+                params.append((key[len(FILTER_PREFIX):], {'True': True, 'False': False}.get(value, value)))
+        return sorted(params)
+
+    @filter_hook
+    def get_autocomplete_cache_key(self, words, params):
+        """
+        Cache key of the answer, or None when it is not cached.
+        """
+        config = self.autocomplete_cache_config
+        if not config['enabled'] or len(''.join(words)) > config['prefix_length'] or \
+                isinstance(caches[config['cache']], LocMemCache):
+            return None
+        if self.model not in _autocomplete_models:
+            post_save.connect(clear_autocomplete_cache, sender=self.model, dispatch_uid='xadmin_autocomplete_save')
+            post_delete.connect(clear_autocomplete_cache, sender=self.model, dispatch_uid='xadmin_autocomplete_delete')
+            _autocomplete_models.add(self.model)
+        version = caches[config['cache']].get(autocomplete_version_key(self.model), 0)
+        # the queryset of the admin may depend on the user.
+        key = repr((self.__class__.__name__, self.user.pk, words, params))
+        return 'xadmin_autocomplete_%s_%s_%s' % (
+            self.opts.label_lower, version, hashlib.md5(key.encode('utf-8')).hexdigest())
+
+    def get_results(self, words, params):
+        queryset = self.queryset().filter(**dict(params))
+        ordering = self.get_ordering()
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        fields = self.get_autocomplete_fields()
+        limit = self.autocomplete_limit
+
+        if fields:
+            for word in words:
+                queryset = queryset.filter(reduce(operator.or_, [
+                    models.Q(**{'%s__istartswith' % field: word}) for field in fields]))
+        objects = [{'id': obj.pk, '__str__': force_text(obj)} for obj in queryset[:limit + 1]]
+        return {'objects': objects[:limit], 'has_more': len(objects) > limit}
+
+    def get(self, request, *args, **kwargs):
+        words = tuple(request.GET.get(SEARCH_VAR, '').split())
+        params = self.get_lookup_params()
+
+        key = self.get_autocomplete_cache_key(words, params)
+        cache = caches[self.autocomplete_cache_config['cache']]
+        result = cache.get(key) if key is not None else None
+        if result is None:
+            result = self.get_results(words, params)
+            if key is not None:
+                cache.set(key, result, self.autocomplete_cache_config['timeout'])
+        return self.render_response(result)
+
+
+site.register_modelview(r'^autocomplete/$', AutocompleteView, name='%s_%s_autocomplete')
@@ -7,15 +7,38 @@ of only for display.
 
 from __future__ import unicode_literals
 
-from django.template.loader import render_to_string
-from django.urls.base import reverse
+import hashlib
+import operator
+from functools import reduce
+
+from django.core.exceptions import PermissionDenied
 from django.db import transaction
+from django.db.models import Case, Q, Value, When
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext as _
 
 from xadmin.views import (
     BaseAdminPlugin, ModelAdminView, ListAdminView
 )
+from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views.base import csrf_protect_m
+from xadmin.util import render_to_string
+
+
+class StaleOrder(Exception):
+    pass
+
+
+def get_order_version(positions):
+    """
+    Token of the ``(pk, order value)`` pairs of a list page. It is posted
+    back with the new order, to reject it when the rows were reordered
+    in the meantime.
+    """
+    data = ','.join('%s:%s' % item for item in sorted((force_text(pk), force_text(value))
+                                                      for pk, value in positions))
+    return hashlib.md5(data.encode('utf-8')).hexdigest()
 
 
 class SortableListPlugin(BaseAdminPlugin):
@@ -43,11 +66,13 @@ class SortableListPlugin(BaseAdminPlugin):
 
     def get_context(self, context):
         context['save_order_url'] = self.get_model_url(self.admin_view.model, 'save_order')
+        context['order_version'] = get_order_version(
+            (obj.pk, getattr(obj, self.list_order_field)) for obj in self.admin_view.result_list)
         return context
 
     def block_top_toolbar(self, context, nodes):
         save_node = render_to_string(
-            'xadmin/blocks/model_list.top_toolbar.saveorder.html', context_instance=context
+            'xadmin/blocks/model_list.top_toolbar.saveorder.html', context=get_context_dict(context)
         )
         nodes.append(save_node)
 
@@ -60,21 +85,47 @@ class SortableListPlugin(BaseAdminPlugin):
 class SaveOrderView(ModelAdminView):
 
     @csrf_protect_m
-    @transaction.atomic
     def post(self, request):
-        order_objs = request.POST.getlist("order[]")
-        for order_value, pk in enumerate(order_objs, start=1):
-            self.save_order(pk, order_value)
+        if not self.has_change_permission():
+            raise PermissionDenied
+        try:
+            with transaction.atomic():
+                self.save_order(request.POST.getlist("order[]"), request.POST.get("version"))
+        except StaleOrder:
+            response = self.render_response({
+                'result': 'conflict',
+                'message': _('The list was reordered in the meantime, reload it and try again.')})
+            response.status_code = 409
+            return response
         return self.render_response({})
 
-    def save_order(self, pk, order_value):
-        obj = self.model.objects.get(pk=pk)
+    def save_order(self, pks, version=None):
+        """
+        Give the objects of ``pks`` the order values 1, 2, ... with one
+        select of their current values and one update of the changed ones.
+        """
         order_field = self.list_order_field
-        is_order_changed = lambda x: getattr(x, order_field) != order_value
-
-        if is_order_changed(obj):
-            setattr(obj, order_field, order_value)
-            obj.save()
+        queryset = self.model._default_manager.all()
+        positions = dict((force_text(pk), value) for pk, value in
+                         queryset.filter(pk__in=pks).values_list('pk', order_field))
+        if len(positions) != len(set(pks)):
+            # objects were deleted meanwhile.
+            raise StaleOrder
+        if version is not None and version != get_order_version(positions.items()):
+            raise StaleOrder
+
+        changed = [(pk, order_value) for order_value, pk in enumerate(pks, start=1)
+                   if positions[pk] != order_value]
+        if not changed:
+            return
+        # only the rows still holding the values read above are updated.
+        updated = queryset.filter(reduce(operator.or_, [
+            Q(pk=pk, **{order_field: positions[pk]}) for pk, order_value in changed])
+        ).update(**{order_field: Case(
+            *[When(pk=pk, then=Value(order_value)) for pk, order_value in changed],
+            output_field=self.opts.get_field(order_field))})
+        if updated != len(changed):
+            raise StaleOrder
 
 
 site.register_plugin(SortableListPlugin, ListAdminView)
@@ -1,21 +1,87 @@
 # coding:utf-8
 from __future__ import print_function
+import os
+import tempfile
+
 import httplib2
-from django.template import loader
-from django.core.cache import cache
+from django.conf import settings
 from django.utils import six
 from django.utils.translation import ugettext as _
 from xadmin.sites import site
-from xadmin.models import UserSettings
+from xadmin.models import get_user_settings
 from xadmin.views import BaseAdminPlugin, BaseAdminView
-from xadmin.util import static, json
+from xadmin.util import static, json, render_to_string
 import six
 if six.PY2:
     import urllib
 else:
     import urllib.parse
 
-THEME_CACHE_KEY = 'xadmin_themes'
+THEME_CATALOG_URL = 'https://bootswatch.com/api/3.json'
+
+_theme_catalog = {}
+
+
+def get_theme_catalog_path():
+    return getattr(settings, 'XADMIN_THEME_CATALOG',
+                   os.path.join(getattr(settings, 'BASE_DIR', ''), 'xadmin_themes.json'))
+
+
+def load_theme_catalog(path=None):
+    """
+    Themes of the local catalog file written by the ``refresh_themes``
+    command. The file is parsed again only when it changes, and rendering
+    never goes to the network: a missing catalog is an empty one.
+    """
+    path = path or get_theme_catalog_path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return []
+    cached = _theme_catalog.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            with open(path, 'rb') as f:
+                themes = json.loads(f.read().decode('utf-8'))
+        except (IOError, ValueError):
+            themes = []
+        cached = _theme_catalog[path] = (mtime, themes)
+    return cached[1]
+
+
+def fetch_bootswatch_themes(url=None, timeout=30):
+    url = url or getattr(settings, 'XADMIN_THEME_CATALOG_URL', THEME_CATALOG_URL)
+    h = httplib2.Http(timeout=timeout)
+    resp, content = h.request(url, 'GET', headers={"Accept": "application/json", "User-Agent": "xadmin"})
+    if resp.status != 200:
+        raise IOError("Theme catalog request to %s failed with status %s" % (url, resp.status))
+    if six.PY3:
+        content = content.decode()
+    return [{'name': t['name'], 'description': t['description'],
+             'css': t['cssMin'], 'thumbnail': t['thumbnail']}
+            for t in json.loads(content)['themes']]
+
+
+def refresh_theme_catalog(url=None, path=None, timeout=30):
+    """
+    Download the bootswatch themes and replace the local catalog file.
+    The file is swapped atomically, so readers never see a partial catalog.
+    """
+    path = path or get_theme_catalog_path()
+    themes = fetch_bootswatch_themes(url, timeout)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(themes, ensure_ascii=False, indent=2).encode('utf-8'))
+        # mkstemp creates the file as 0600, give it the mode of a new file.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o644 & ~umask)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    return themes
 
 
 class ThemePlugin(BaseAdminPlugin):
@@ -32,10 +98,9 @@ class ThemePlugin(BaseAdminPlugin):
 
     def _get_theme(self):
         if self.user:
-            try:
-                return UserSettings.objects.get(user=self.user, key="site-theme").value
-            except Exception:
-                pass
+            theme = get_user_settings(self.user).get("site-theme")
+            if theme:
+                return theme
         if '_theme' in self.request.COOKIES:
             if six.PY2:
                 func = urllib.unquote
@@ -65,29 +130,9 @@ class ThemePlugin(BaseAdminPlugin):
             themes.extend(self.user_themes)
 
         if self.use_bootswatch:
-            ex_themes = cache.get(THEME_CACHE_KEY)
-            if ex_themes:
-                themes.extend(json.loads(ex_themes))
-            else:
-                ex_themes = []
-                try:
-                    h = httplib2.Http()
-                    resp, content = h.request("https://bootswatch.com/api/3.json", 'GET', '',
-                                              headers={"Accept": "application/json", "User-Agent": self.request.META['HTTP_USER_AGENT']})
-                    if six.PY3:
-                        content = content.decode()
-                    watch_themes = json.loads(content)['themes']
-                    ex_themes.extend([
-                        {'name': t['name'], 'description': t['description'],
-                            'css': t['cssMin'], 'thumbnail': t['thumbnail']}
-                        for t in watch_themes])
-                except Exception as e:
-                    print(e)
-
-                cache.set(THEME_CACHE_KEY, json.dumps(ex_themes), 24 * 3600)
-                themes.extend(ex_themes)
-
-        nodes.append(loader.render_to_string('xadmin/blocks/comm.top.theme.html', {'themes': themes, 'select_css': select_css}))
+            themes.extend(load_theme_catalog())
+
+        nodes.append(render_to_string('xadmin/blocks/comm.top.theme.html', {'themes': themes, 'select_css': select_css}))
 
 
 site.register_plugin(ThemePlugin, BaseAdminView)
@@ -1,5 +1,4 @@
 
-from django.template import loader
 from django.utils.text import capfirst
 from django.urls.base import reverse, NoReverseMatch
 from django.utils.translation import ugettext as _
@@ -7,6 +6,7 @@ from django.utils.translation import ugettext as _
 from xadmin.sites import site
 from xadmin.filters import SEARCH_VAR
 from xadmin.views import BaseAdminPlugin, CommAdminView
+from xadmin.util import render_to_string
 
 
 class TopNavPlugin(BaseAdminPlugin):
@@ -41,7 +41,7 @@ class TopNavPlugin(BaseAdminPlugin):
                         })
                     except NoReverseMatch:
                         pass
-        return nodes.append(loader.render_to_string('xadmin/blocks/comm.top.topnav.html', {'search_models': search_models, 'search_name': SEARCH_VAR}))
+        return nodes.append(render_to_string('xadmin/blocks/comm.top.topnav.html', {'search_models': search_models, 'search_name': SEARCH_VAR}))
 
     def block_top_navmenu(self, context, nodes):
         add_models = []
@@ -67,7 +67,7 @@ class TopNavPlugin(BaseAdminPlugin):
                     pass
 
         nodes.append(
-            loader.render_to_string('xadmin/blocks/comm.top.topnav.html', {'add_models': add_models}))
+            render_to_string('xadmin/blocks/comm.top.topnav.html', {'add_models': add_models}))
 
 
 site.register_plugin(TopNavPlugin, CommAdminView)
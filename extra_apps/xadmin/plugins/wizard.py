@@ -2,7 +2,6 @@ import re
 from collections import OrderedDict
 from django import forms
 from django.db import models
-from django.template import loader
 try:
     from formtools.wizard.storage import get_storage
     from formtools.wizard.forms import ManagementForm
@@ -21,6 +20,7 @@ from django.forms.models import modelform_factory
 
 from xadmin.sites import site
 from xadmin.views import BaseAdminPlugin, ModelFormAdminView
+from xadmin.util import render_to_string
 
 
 def normalize_name(name):
@@ -330,7 +330,7 @@ class WizardFormPlugin(BaseAdminPlugin):
                 'current_step': self.steps.current,
             }),
         }
-        nodes.append(loader.render_to_string('xadmin/blocks/model_form.before_fieldsets.wizard.html', context))
+        nodes.append(render_to_string('xadmin/blocks/model_form.before_fieldsets.wizard.html', context))
 
     def block_submit_line(self, context, nodes):
         context = context.update(dict(self.storage.extra_data))
@@ -338,6 +338,6 @@ class WizardFormPlugin(BaseAdminPlugin):
             'steps': self.steps
         }
 
-        nodes.append(loader.render_to_string('xadmin/blocks/model_form.submit_line.wizard.html', context))
+        nodes.append(render_to_string('xadmin/blocks/model_form.submit_line.wizard.html', context))
 
 site.register_plugin(WizardFormPlugin, ModelFormAdminView)
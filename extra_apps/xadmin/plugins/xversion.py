@@ -1,8 +1,11 @@
 from crispy_forms.utils import TEMPLATE_PACK
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
 from django.core.exceptions import PermissionDenied
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, router, transaction
+from django.db.models.signals import post_save, pre_delete, m2m_changed
 from django.db.models.query import QuerySet
 from django.forms.models import model_to_dict
 from django.http import HttpResponseRedirect
@@ -22,10 +25,17 @@ from xadmin.util import unquote, quote, model_format_dict, is_related_field2
 from xadmin.views import BaseAdminPlugin, ModelAdminView, CreateAdminView, UpdateAdminView, DetailAdminView, ModelFormAdminView, DeleteAdminView, ListAdminView
 from xadmin.views.base import csrf_protect_m, filter_hook
 from xadmin.views.detail import DetailAdminUtil
+from xadmin.versiondelta import DELTA_FORMAT, SNAPSHOT_FORMAT, apply_delta, delta_base, make_delta
 from reversion.models import Revision, Version
 from reversion.revisions import is_active, register, is_registered, set_comment, create_revision, set_user
+# private helpers of reversion.revisions (2.0 to 5.x, see requirements.txt), used to
+# serialize bulk revisions with the registered fields, format and follows.
+from reversion.revisions import _follow_relations, _get_options
+from reversion.signals import pre_revision_commit, post_revision_commit
 from contextlib import contextmanager
 from functools import partial
+from threading import local
+import json
 
 
 def _autoregister(admin, model, follow=None):
@@ -40,9 +50,18 @@ def _autoregister(admin, model, follow=None):
         register(model, follow=follow, format=admin.reversion_format)
 
 
+# models stored as snapshots plus deltas, mapped to their snapshot interval.
+_delta_models = {}
+
+serializers.register_serializer(DELTA_FORMAT, 'xadmin.versiondelta')
+
+
 def _register_model(admin, model):
     if not hasattr(admin, 'reversion_format'):
         admin.reversion_format = 'json'
+    if getattr(admin, 'reversion_storage', 'full') == 'delta' and admin.reversion_format == SNAPSHOT_FORMAT:
+        _delta_models[model] = getattr(admin, 'reversion_snapshot_interval', 10)
+        pre_delete.connect(rebase_deltas, sender=Version, dispatch_uid='xadmin_version_rebase_deltas')
 
     if not is_registered(model):
         inline_fields = []
@@ -80,6 +99,83 @@ def register_models(admin_site=None):
             _register_model(admin, model)
 
 
+def compress_version(version, snapshot_interval):
+    """
+    Replace a freshly saved ``json`` version by a delta against the latest
+    snapshot of its object, unless ``snapshot_interval`` versions have passed
+    since that snapshot. Returns True when the version was compressed.
+    """
+    if version.format != SNAPSHOT_FORMAT or snapshot_interval <= 1:
+        return False
+    versions = Version.objects.using(version._state.db)
+    previous = versions.filter(
+        content_type_id=version.content_type_id, object_id=version.object_id,
+        db=version.db, pk__lt=version.pk).order_by('-pk')
+
+    base_pk = None
+    for pk, fmt in previous.values_list('pk', 'format')[:snapshot_interval - 1]:
+        if fmt == SNAPSHOT_FORMAT:
+            base_pk = pk
+            break
+        if fmt != DELTA_FORMAT:
+            return False
+    if base_pk is None:
+        return False
+
+    base_data = versions.values_list('serialized_data', flat=True).get(pk=base_pk)
+    delta = make_delta(base_pk, base_data, version.serialized_data)
+    if delta is None:
+        return False
+    versions.filter(pk=version.pk).update(format=DELTA_FORMAT, serialized_data=delta)
+    version.format, version.serialized_data = DELTA_FORMAT, delta
+    return True
+
+
+def compress_revision(sender, revision, versions, **kwargs):
+    if not _delta_models:
+        return
+    for version in versions:
+        snapshot_interval = _delta_models.get(version._model)
+        if snapshot_interval:
+            compress_version(version, snapshot_interval)
+
+post_revision_commit.connect(compress_revision)
+
+
+def rebase_deltas(sender, instance, using, **kwargs):
+    """
+    Keep the deltas of a snapshot readable when the snapshot is deleted (by
+    itself, or with its revision as by ``deleterevisions``): the oldest
+    delta based on it becomes a full snapshot and the other ones are made
+    again against it. The rows are read again, as a delta deleted in the
+    same batch may have been turned into a snapshot meanwhile.
+    """
+    versions = Version.objects.using(using)
+    with transaction.atomic(using=using):
+        try:
+            fmt, base_data = versions.values_list('format', 'serialized_data').get(pk=instance.pk)
+        except Version.DoesNotExist:
+            return
+        if fmt != SNAPSHOT_FORMAT:
+            return
+        deltas = [(pk, data) for pk, data in versions.filter(
+            content_type_id=instance.content_type_id, object_id=instance.object_id, db=instance.db,
+            format=DELTA_FORMAT, pk__gt=instance.pk).order_by('pk').values_list('pk', 'serialized_data')
+            if delta_base(data) == instance.pk]
+        if not deltas:
+            return
+
+        snapshot_pk, snapshot_data = deltas[0][0], apply_delta(base_data, deltas[0][1])
+        versions.filter(pk=snapshot_pk).update(format=SNAPSHOT_FORMAT, serialized_data=snapshot_data)
+        for pk, data in deltas[1:]:
+            full_data = apply_delta(base_data, data)
+            delta = make_delta(snapshot_pk, snapshot_data, full_data)
+            if delta is None:
+                versions.filter(pk=pk).update(format=SNAPSHOT_FORMAT, serialized_data=full_data)
+            else:
+                versions.filter(pk=pk).update(serialized_data=delta)
+
+
 @contextmanager
 def do_create_revision(request):
     with create_revision():
@@ -87,6 +183,123 @@ def do_create_revision(request):
         yield
 
 
+class BulkRevision(object):
+    """
+    Collects the registered objects saved while it is active and writes them
+    as one ``Revision``. Objects are serialized in batches when the revision
+    is committed and their ``Version`` rows are inserted with ``bulk_create``,
+    instead of one serialization and one INSERT per save.
+    """
+    batch_size = 500
+
+    def __init__(self, user=None, comment='', using=None, batch_size=None):
+        self.user = user
+        self.comment = comment
+        self.using = using or router.db_for_write(Revision)
+        self.batch_size = batch_size or self.batch_size
+        self.objects = {}
+
+    def add(self, obj):
+        if obj.pk is None or not is_registered(obj.__class__):
+            return
+        key = (obj.__class__, force_text(obj.pk))
+        if key in self.objects:
+            return
+        self.objects[key] = obj
+        for follow_obj in _follow_relations(obj):
+            self.add(follow_obj)
+
+    def _existing(self, objects):
+        by_model = {}
+        for (model, pk), obj in objects:
+            by_model.setdefault((model, router.db_for_write(model, instance=obj)), []).append(obj)
+        for (model, db), objs in by_model.items():
+            existing = set(force_text(pk) for pk in model._base_manager.using(db).filter(
+                pk__in=[obj.pk for obj in objs]).values_list('pk', flat=True))
+            yield model, db, [obj for obj in objs if force_text(obj.pk) in existing]
+
+    def _serialize(self, model, objs):
+        options = _get_options(model)
+        if options.format != 'json':
+            return [serializers.serialize(options.format, (obj,), fields=options.fields) for obj in objs]
+        return [json.dumps([data], cls=DjangoJSONEncoder)
+                for data in json.loads(serializers.serialize('json', objs, fields=options.fields))]
+
+    def get_versions(self):
+        versions = []
+        for model, db, objs in self._existing(self.objects.items()):
+            options = _get_options(model)
+            content_type = ContentType.objects.db_manager(self.using).get_for_model(
+                model, for_concrete_model=options.for_concrete_model)
+            for start in range(0, len(objs), self.batch_size):
+                batch = objs[start:start + self.batch_size]
+                for obj, data in zip(batch, self._serialize(model, batch)):
+                    versions.append(Version(
+                        content_type=content_type,
+                        object_id=force_text(obj.pk),
+                        db=db,
+                        format=options.format,
+                        serialized_data=data,
+                        object_repr=force_text(obj),
+                    ))
+        return versions
+
+    def commit(self):
+        versions = self.get_versions()
+        if not versions:
+            return None
+        with transaction.atomic(using=self.using):
+            revision = Revision(user=self.user, comment=self.comment)
+            pre_revision_commit.send(sender=create_revision, revision=revision, versions=versions)
+            revision.save(using=self.using)
+            for version in versions:
+                version.revision = revision
+            Version.objects.using(self.using).bulk_create(versions, batch_size=self.batch_size)
+            if any(version.pk is None for version in versions):
+                # backends that do not return pks from bulk inserts.
+                versions = list(Version.objects.using(self.using).filter(revision=revision).order_by('pk'))
+            post_revision_commit.send(sender=create_revision, revision=revision, versions=versions)
+        return revision
+
+
+_bulk_revisions = local()
+
+
+def _active_bulk_revision():
+    stack = getattr(_bulk_revisions, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def _bulk_post_save_receiver(sender, instance, **kwargs):
+    bulk_revision = _active_bulk_revision()
+    if bulk_revision is not None and not kwargs.get('raw'):
+        bulk_revision.add(instance)
+
+
+def _bulk_m2m_changed_receiver(sender, instance, action, **kwargs):
+    bulk_revision = _active_bulk_revision()
+    if bulk_revision is not None and action in ('post_add', 'post_remove', 'post_clear'):
+        bulk_revision.add(instance)
+
+post_save.connect(_bulk_post_save_receiver)
+m2m_changed.connect(_bulk_m2m_changed_receiver)
+
+
+@contextmanager
+def do_bulk_revision(request, comment=''):
+    """
+    Like ``do_create_revision``, for bulk operations: everything saved inside
+    the block goes into one revision written with batched inserts.
+    """
+    bulk_revision = BulkRevision(user=request.user, comment=comment)
+    _bulk_revisions.stack = getattr(_bulk_revisions, 'stack', ()) + (bulk_revision,)
+    try:
+        yield bulk_revision
+    finally:
+        _bulk_revisions.stack = _bulk_revisions.stack[:-1]
+    bulk_revision.commit()
+
+
 class ReversionPlugin(BaseAdminPlugin):
 
     # The serialization format to use when registering models with reversion.
@@ -95,6 +308,11 @@ class ReversionPlugin(BaseAdminPlugin):
     # Whether to ignore duplicate revision data.
     ignore_duplicate_revisions = False
 
+    # 'full' stores every version as a snapshot, 'delta' stores one snapshot
+    # every ``reversion_snapshot_interval`` versions and field deltas between.
+    reversion_storage = 'full'
+    reversion_snapshot_interval = 10
+
     reversion_enable = False
 
     def init_request(self, *args, **kwargs):
@@ -156,10 +374,26 @@ class ActionRevisionPlugin(BaseAdminPlugin):
         return self.reversion_enable
 
     def do_action(self, __, queryset):
+        # actions flagged with ``bulk_revision`` save many objects at once.
+        if getattr(self.admin_view, 'bulk_revision', False):
+            with do_bulk_revision(self.request, force_text(self.admin_view.description) % model_format_dict(self.opts)):
+                return __()
         with do_create_revision(self.request):
             return __()
 
 
+class ImportRevisionPlugin(BaseAdminPlugin):
+
+    reversion_enable = False
+
+    def init_request(self, *args, **kwargs):
+        return self.reversion_enable
+
+    def post(self, __, request, *args, **kwargs):
+        with do_bulk_revision(request, _(u"Import version.")):
+            return __()
+
+
 class BaseReversionView(ModelAdminView):
 
     # The serialization format to use when registering models with reversion.
@@ -616,3 +850,10 @@ site.register_plugin(ReversionPlugin, DeleteAdminView)
 
 site.register_plugin(InlineRevisionPlugin, InlineModelAdmin)
 site.register_plugin(ActionRevisionPlugin, BaseActionView)
+
+try:
+    from xadmin.plugins.importexport import ImportProcessView
+except ImportError:
+    pass
+else:
+    site.register_plugin(ImportRevisionPlugin, ImportProcessView)
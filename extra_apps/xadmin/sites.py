@@ -1,3 +1,4 @@
+import re
 import sys
 from functools import update_wrapper
 from future.utils import iteritems
@@ -7,8 +8,21 @@ from django.db.models.base import ModelBase
 from django.utils import six
 from django.views.decorators.cache import never_cache
 from django.template.engine import Engine
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.encoding import force_text
+from django.utils.http import RFC3986_SUBDELIMS
 import inspect
 
+try:
+    from urllib.parse import quote as url_quote
+except ImportError:
+    from urllib import quote as url_quote
+
+URL_ARG_PLACEHOLDER = 'xadminurlarg%dx'
+URL_ARG_RE = re.compile(r'xadminurlarg(\d+)x')
+# argument values substituted into url templates, anything else goes through reverse().
+URL_TEMPLATE_ARG_RE = re.compile(r'^[\w-]+$', re.UNICODE)
+
 if six.PY2 and sys.getdefaultencoding() == 'ascii':
     import imp
     imp.reload(sys)
@@ -45,6 +59,10 @@ class AdminSite(object):
         self._registry_plugins = {}  # view_class class -> plugin_class class
 
         self._admin_view_cache = {}
+        # option class -> its public non callable attributes
+        self._option_attrs_cache = {}
+        # (script prefix, urlconf, url name, args count, current app) -> url template
+        self._url_templates = {}
 
         # self.check_dependencies()
 
@@ -210,9 +228,16 @@ class AdminSite(object):
             inner = never_cache(inner)
         return update_wrapper(inner, view)
 
+    def _get_option_attrs(self, option_class):
+        if option_class not in self._option_attrs_cache:
+            self._option_attrs_cache[option_class] = [
+                (name, getattr(option_class, name)) for name in dir(option_class)
+                if name[0] != '_' and not callable(getattr(option_class, name))]
+        return self._option_attrs_cache[option_class]
+
     def _get_merge_attrs(self, option_class, plugin_class):
-        return dict([(name, getattr(option_class, name)) for name in dir(option_class)
-                     if name[0] != '_' and not callable(getattr(option_class, name)) and hasattr(plugin_class, name)])
+        return dict([(name, value) for name, value in self._get_option_attrs(option_class)
+                     if hasattr(plugin_class, name)])
 
     def _get_settings_class(self, admin_view_class):
         name = admin_view_class.__name__.lower()
@@ -288,10 +313,66 @@ class AdminSite(object):
     def create_model_admin_view(self, admin_view_class, model, option_class):
         return self.get_view_class(admin_view_class, option_class).as_view()
 
+    def warm_up(self):
+        """
+        Build the admin view classes of every registered model and fill
+        their per-class introspection caches, so the first requests do not
+        pay for them. Called by the server process (the wsgi module), not by
+        the management commands.
+        """
+        for model, admin_class in iteritems(self._registry):
+            for path, clz, name in self._registry_modelviews:
+                view_class = self.get_view_class(clz, admin_class)
+                if hasattr(view_class, 'warm_class_cache'):
+                    view_class.warm_class_cache()
+
+    def get_url_template(self, name, nargs, current_app=None):
+        """
+        ``(parts, arg_indexes)`` of the url named ``name``, made by reversing
+        it once with placeholder arguments, or None when the url can not be
+        reversed that way.
+        """
+        key = (get_script_prefix(), get_urlconf(), name, nargs, current_app)
+        try:
+            return self._url_templates[key]
+        except KeyError:
+            pass
+        try:
+            url = reverse(name, args=[URL_ARG_PLACEHOLDER % i for i in range(nargs)], current_app=current_app)
+        except NoReverseMatch:
+            template = None
+        else:
+            pieces = URL_ARG_RE.split(url)
+            template = (pieces[0::2], [int(i) for i in pieces[1::2]])
+        self._url_templates[key] = template
+        return template
+
+    def reverse(self, name, args=(), kwargs=None, current_app=None):
+        """
+        Same as django ``reverse()`` for admin urls, but positional arguments
+        are substituted into a url template built on first use, so rendering
+        a link per row does not resolve the url patterns again. The
+        ``XADMIN_URL_TEMPLATES`` setting (default True) turns it off.
+        """
+        if not kwargs and getattr(settings, 'XADMIN_URL_TEMPLATES', True):
+            template = self.get_url_template(name, len(args), current_app)
+            if template is not None:
+                values = [force_text(arg) for arg in args]
+                if all(URL_TEMPLATE_ARG_RE.match(value) for value in values):
+                    parts, indexes = template
+                    url = [parts[0]]
+                    for index, part in zip(indexes, parts[1:]):
+                        url.append(url_quote(values[index].encode('utf-8'), safe=RFC3986_SUBDELIMS + '/~:@'))
+                        url.append(part)
+                    return ''.join(url)
+        return reverse(name, args=args, kwargs=kwargs, current_app=current_app)
+
     def get_urls(self):
         from django.urls import include, path, re_path
         from xadmin.views.base import BaseAdminView
 
+        self._url_templates = {}
+
         if settings.DEBUG:
             self.check_dependencies()
 
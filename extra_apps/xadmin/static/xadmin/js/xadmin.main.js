@@ -77,12 +77,10 @@
     });
 
   // dashboard widget
-  $('.widget-form').each(function(e){
-    var el = $(this);
-    el.find('.btn-remove').click(function(){
-      el.find('input[name=_delete]').val('on');
-      el.submit();
-    });
+  $(document).on('click', '.widget-form .btn-remove', function(){
+    var el = $(this).parents('.widget-form:first');
+    el.find('input[name=_delete]').val('on');
+    el.submit();
   });
 
   // g-search
@@ -75,4 +75,41 @@ jQuery(function() {
   $('.btn-quick-form').on('post-success', function(e){
     window.location.reload();
   });
-});
\ No newline at end of file
+
+  // lazy widgets, loaded with their media once the page is ready.
+  var loaded_media = {};
+  $('script[src]').each(function(){ loaded_media[$(this).attr('src')] = true; });
+  $('link[rel=stylesheet][href]').each(function(){ loaded_media[$(this).attr('href')] = true; });
+
+  var load_scripts = function(urls, callback){
+    var url = urls.shift();
+    if(url === undefined){ return callback(); }
+    if(loaded_media[url]){ return load_scripts(urls, callback); }
+    loaded_media[url] = true;
+    $.ajax({url: url, dataType: 'script', cache: true}).always(function(){
+      load_scripts(urls, callback);
+    });
+  };
+
+  $('.widget-lazy').each(function(){
+    var placeholder = $(this);
+    $.getJSON(placeholder.data('widget-url'), function(data){
+      $.each(data.css || {}, function(medium, urls){
+        $.each(urls, function(i, url){
+          if(!loaded_media[url]){
+            loaded_media[url] = true;
+            $('head').append('<link href="' + url + '" type="text/css" media="' + medium + '" rel="stylesheet" />');
+          }
+        });
+      });
+      var widget = $(data.html);
+      placeholder.replaceWith(widget);
+      load_scripts(data.js.slice(0), function(){
+        widget.find('.exform:not(.rended)').exform();
+        widget.trigger('widget.loaded');
+      });
+    }).fail(function(){
+      placeholder.find('.widget-loading').text(gettext('Load widget failed.'));
+    });
+  });
+});
@@ -47,7 +47,7 @@ $(document).ready(function(){
       })
     }
 
-    $('.chart-tab a').click(function(e){
+    $(document).on('click', '.chart-tab a', function(e){
       e.preventDefault();
       $(this).tab('show');
 
@@ -55,4 +55,9 @@ $(document).ready(function(){
     });
     $('.chart-tab a:first').click();
     $('.chart.init').chart();
+
+    $(document).on('widget.loaded', function(e){
+      $(e.target).find('.chart-tab a:first').click();
+      $(e.target).find('.chart.init').chart();
+    });
 });
\ No newline at end of file
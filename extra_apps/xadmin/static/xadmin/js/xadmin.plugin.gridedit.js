@@ -0,0 +1,100 @@
+(function($) {
+    $(function() {
+        var $save = $('#grid-save');
+        // pk -> {field: value} of the changed cells
+        var changes = {};
+
+        var getCookie = function(name) {
+            var cookies = document.cookie ? document.cookie.split(';') : [];
+            for (var i = 0; i < cookies.length; i++) {
+                var cookie = $.trim(cookies[i]);
+                if (cookie.substring(0, name.length + 1) == (name + '=')) {
+                    return decodeURIComponent(cookie.substring(name.length + 1));
+                }
+            }
+            return null;
+        };
+
+        var countChanges = function() {
+            var count = 0;
+            $.each(changes, function(pk, fields) { count += Object.keys(fields).length; });
+            $save.toggleClass('disabled', count == 0).find('.badge').text(count || '');
+            return count;
+        };
+
+        var inputValue = function($input) {
+            if ($input.is(':checkbox')) {
+                return $input.prop('checked') ? 'true' : 'false';
+            }
+            return $input.val() === null ? '' : String($input.val());
+        };
+
+        $('td.grid-cell').each(function() {
+            var $cell = $(this);
+            var pk = String($cell.data('grid-pk')), field = $cell.data('grid-field');
+            var original = String($cell.attr('data-grid-value'));
+            // widgets such as the date input are wrapped in an input group
+            var $editor = $('#grid-editors [data-grid-field="' + field + '"]').children().first().clone();
+            var $input = $editor.is(':input') ? $editor : $editor.find(':input').first();
+
+            $editor.find('[id]').addBack().removeAttr('id');
+            $input.removeAttr('name');
+            if ($input.is(':checkbox')) {
+                $input.prop('checked', original == 'true');
+            } else {
+                $input.val(original);
+            }
+            $cell.empty().append($editor);
+
+            $input.on('change keyup', function() {
+                var value = inputValue($input);
+                changes[pk] = changes[pk] || {};
+                if (value == original) {
+                    delete changes[pk][field];
+                    if ($.isEmptyObject(changes[pk])) {
+                        delete changes[pk];
+                    }
+                } else {
+                    changes[pk][field] = value;
+                }
+                $cell.toggleClass('warning', value != original);
+                countChanges();
+            });
+        });
+
+        $save.on('click', function(e) {
+            e.preventDefault();
+            if (!countChanges()) {
+                return;
+            }
+            $save.addClass('disabled');
+            $('tr.grid-item').removeClass('danger').find('.grid-errors').remove();
+            $.ajax({
+                url: $save.data('save-url'),
+                method: 'POST',
+                contentType: 'application/json',
+                dataType: 'json',
+                data: JSON.stringify({rows: changes}),
+                headers: {'X-CSRFToken': getCookie('csrftoken')}
+            }).done(function(data) {
+                if (data.result == 'success') {
+                    location.reload();
+                    return;
+                }
+                // errors of each row, under the row
+                $.each(data.errors, function(pk, errors) {
+                    var $row = $('td.grid-cell[data-grid-pk="' + pk + '"]').first().closest('tr');
+                    var messages = $.map(errors, function(error) {
+                        var label = error.name == '__all__' ? '' : error.name + ': ';
+                        return $('<div/>').text(label + error.errors.join(' ')).html();
+                    });
+                    $row.addClass('danger').find('td:last').append(
+                        '<div class="grid-errors text-danger">' + messages.join('<br/>') + '</div>');
+                });
+                countChanges();
+            }).fail(function() {
+                countChanges();
+            });
+        });
+    });
+})(jQuery);
@@ -1,7 +1,7 @@
 
 ;(function($){
 
-  $('form.widget-form').on('post-success', function(e, data){
+  $(document).on('post-success', 'form.widget-form', function(e, data){
     $(this).data('ajaxform').clean()
     $('.alert-success #change-link').attr('href', data['change_url'])
     $('.alert-success').show()
@@ -31,16 +31,23 @@
             opacity: 0.8,
             update: function(event, ui) {
                 var $rows = $(this);
-                $("#save-order").on("click", function(e) {
+                $("#save-order").off("click").on("click", function(e) {
+                    var data = $rows.sortable('serialize', {
+                        attribute: 'order-key',
+                        expression: (/(.+)_(.+)/),
+                    });
                     $.ajax({
                         url: $(this).attr('post-url'),
                         method: 'POST',
-                        data: $rows.sortable('serialize', {
-                            attribute: 'order-key',
-                            expression: (/(.+)_(.+)/),
-                        })
+                        data: data + '&version=' + encodeURIComponent($(this).data('order-version'))
+                    }).fail(function(xhr) {
+                        if (xhr.status == 409 && xhr.responseJSON) {
+                            alert(xhr.responseJSON.message);
+                        }
+                    }).always(function() {
+                        location.reload();
                     });
-                    location.reload();
+                    return false;
                 }).show();
             }
         });
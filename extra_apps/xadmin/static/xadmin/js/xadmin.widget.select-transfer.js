@@ -56,6 +56,13 @@
     }
     this.to_box.data('cache', to_cache);
 
+    // available choices loaded in pages from the server
+    this.choices_url = this.from_box.data('choices-url');
+    if (this.choices_url) {
+      this.from_box.on('scroll', $.proxy(this.scroll, this));
+      this.load('', 0);
+    }
+
     this.refresh_icons();
   }
 
@@ -72,7 +79,47 @@
           }
       }
     },
+    load: function(text, page) {
+      var that = this;
+      this.query = text;
+      this.page = page;
+      this.more = false;
+      if (this.request) {
+        this.request.abort();
+      }
+      this.request = $.getJSON(this.choices_url, {q: text, p: page}, function(data){
+        that.request = null;
+        var cache = page == 0 ? [] : that.from_box.data('cache');
+        for (var i = 0; i < data.choices.length; i++) {
+          var value = String(data.choices[i][0]);
+          if (!that.cache_contains(that.to_box, value)) {
+            cache.push({value: value, text: data.choices[i][1], displayed: 1});
+          }
+        }
+        that.from_box.data('cache', cache);
+        that.more = data.more;
+        that.redisplay(that.from_box);
+        that.refresh_icons();
+      });
+    },
+    scroll: function() {
+      var select = this.from_box[0];
+      if (this.more && !this.request && select.scrollTop + select.clientHeight >= select.scrollHeight - 20) {
+        this.load(this.query, this.page + 1);
+      }
+    },
     filter: function(text) {
+      if (this.choices_url) {
+        // search on the server, once the user stops typing
+        var that = this;
+        clearTimeout(this.filter_timer);
+        this.filter_timer = setTimeout(function(){
+          if (text != that.query) {
+            that.load(text, 0);
+          }
+        }, 300);
+        return;
+      }
       // Redisplay the HTML select box, displaying only the choices containing ALL
       // the words in text. (It's an AND search.)
       var tokens = text.toLowerCase().split(/\s+/);
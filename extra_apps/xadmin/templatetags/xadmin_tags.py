@@ -1,4 +1,8 @@
+import logging
+import time
+
 from django import template
+from django.conf import settings
 from django.template import Library
 from django.utils import six
 from django.utils.safestring import mark_safe
@@ -7,6 +11,16 @@ from django.utils.html import escape
 from xadmin.util import static, vendor as util_vendor
 
 register = Library()
+logger = logging.getLogger('xadmin.profile')
+
+
+def get_block_funcs(admin_view, block_name):
+    table = getattr(admin_view, 'block_table', None)
+    if table is not None:
+        return table.get(block_name)
+    method_name = 'block_%s' % block_name
+    return [getattr(view, method_name) for view in [admin_view] + admin_view.plugins
+            if hasattr(view, method_name) and callable(getattr(view, method_name))]
 
 
 @register.simple_tag(takes_context=True)
@@ -15,16 +29,29 @@ def view_block(context, block_name, *args, **kwargs):
         return ""
 
     admin_view = context['admin_view']
-    nodes = []
-    method_name = 'block_%s' % block_name
+    block_funcs = get_block_funcs(admin_view, block_name)
+    if not block_funcs:
+        return ""
+
+    profile = getattr(settings, 'XADMIN_PROFILE_BLOCKS', False)
+    if profile:
+        start = time.time()
 
+    nodes = []
     cls_str = str if six.PY3 else basestring
-    for view in [admin_view] + admin_view.plugins:
-        if hasattr(view, method_name) and callable(getattr(view, method_name)):
-            block_func = getattr(view, method_name)
-            result = block_func(context, nodes, *args, **kwargs)
-            if result and isinstance(result, cls_str):
-                nodes.append(result)
+    for block_func in block_funcs:
+        result = block_func(context, nodes, *args, **kwargs)
+        if result and isinstance(result, cls_str):
+            nodes.append(result)
+
+    if profile:
+        elapsed = time.time() - start
+        timings = admin_view.__dict__.setdefault('block_timings', {})
+        calls, total = timings.get(block_name, (0, 0.0))
+        timings[block_name] = (calls + 1, total + elapsed)
+        logger.debug("view_block %s of %s: %.2fms (%s)", block_name, admin_view.__class__.__name__, elapsed * 1000,
+                     ', '.join(getattr(func, '__self__', admin_view).__class__.__name__ for func in block_funcs))
+
     if nodes:
         return mark_safe(''.join(nodes))
     else:
@@ -19,6 +19,7 @@ from django.contrib.admin.utils import label_for_field, help_text_for_field
 from django import VERSION as version
 import datetime
 import decimal
+import os
 
 if 'django.contrib.staticfiles' in settings.INSTALLED_APPS:
     from django.contrib.staticfiles.templatetags.staticfiles import static
@@ -30,65 +31,167 @@ try:
 except ImportError:
     from django.utils import simplejson as json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from django.utils.timezone import template_localtime as tz_localtime
 except ImportError:
     from django.utils.timezone import localtime as tz_localtime
 
 
-def xstatic(*tags):
+# resolved files of every (tag, language, mode), vendors.py never changes at runtime.
+_xstatic_cache = {}
+_vendor_cache = {}
+
+
+def get_class_cache(cls, name):
+    """
+    Dict of cached introspection results that belongs to ``cls`` itself,
+    subclasses (and merged admin view classes) get their own.
+    """
+    attr = '_xadmin_%s_cache' % name
+    cache = cls.__dict__.get(attr)
+    if cache is None:
+        cache = {}
+        setattr(cls, attr, cache)
+    return cache
+
+
+def _static_mode():
+    if settings.DEBUG:
+        return 'dev'
+    return getattr(settings, 'STATIC_USE_CDN', False) and 'cdn' or 'production'
+
+
+def _xstatic_tag(tag, lang, mode):
     from .vendors import vendors
     node = vendors
 
-    fs = []
-    lang = get_language()
-
     cls_str = str if six.PY3 else basestring
-    for tag in tags:
-        try:
-            for p in tag.split('.'):
-                node = node[p]
-        except Exception as e:
-            if tag.startswith('xadmin'):
-                file_type = tag.split('.')[-1]
-                if file_type in ('css', 'js'):
-                    node = "xadmin/%s/%s" % (file_type, tag)
-                else:
-                    raise e
+    try:
+        for p in tag.split('.'):
+            node = node[p]
+    except Exception as e:
+        if tag.startswith('xadmin'):
+            file_type = tag.split('.')[-1]
+            if file_type in ('css', 'js'):
+                node = "xadmin/%s/%s" % (file_type, tag)
             else:
                 raise e
-
-        if isinstance(node, cls_str):
-            files = node
         else:
+            raise e
+
+    if isinstance(node, cls_str):
+        files = node
+    else:
+        if mode == 'cdn' and mode not in node:
+            mode = 'production'
+        if mode == 'production' and mode not in node:
             mode = 'dev'
-            if not settings.DEBUG:
-                mode = getattr(settings, 'STATIC_USE_CDN',
-                               False) and 'cdn' or 'production'
+        files = node[mode]
 
-            if mode == 'cdn' and mode not in node:
-                mode = 'production'
-            if mode == 'production' and mode not in node:
-                mode = 'dev'
-            files = node[mode]
+    files = type(files) in (list, tuple) and files or [files, ]
+    files = [f % {'lang': lang.replace('_', '-')} for f in files]
+    return tuple(f.startswith('http://') and f or static(f) for f in files)
 
-        files = type(files) in (list, tuple) and files or [files, ]
-        fs.extend([f % {'lang': lang.replace('_', '-')} for f in files])
 
-    return [f.startswith('http://') and f or static(f) for f in fs]
+def xstatic(*tags):
+    lang = get_language() or settings.LANGUAGE_CODE
+    mode = _static_mode()
+
+    fs = []
+    for tag in tags:
+        key = (tag, lang, mode)
+        files = _xstatic_cache.get(key)
+        if files is None:
+            files = _xstatic_cache[key] = _xstatic_tag(tag, lang, mode)
+        fs.extend(files)
+    return fs
 
 
 def vendor(*tags):
-    css = {'screen': []}
-    js = []
-    for tag in tags:
-        file_type = tag.split('.')[-1]
-        files = xstatic(tag)
-        if file_type == 'js':
-            js.extend(files)
-        elif file_type == 'css':
-            css['screen'] += files
-    return Media(css=css, js=js)
+    key = (tags, get_language() or settings.LANGUAGE_CODE, _static_mode())
+    media = _vendor_cache.get(key)
+    if media is None:
+        css = {'screen': []}
+        js = []
+        for tag in tags:
+            file_type = tag.split('.')[-1]
+            files = xstatic(tag)
+            if file_type == 'js':
+                js.extend(files)
+            elif file_type == 'css':
+                css['screen'] += files
+        media = _vendor_cache[key] = Media(css=css, js=js)
+    return media
+
+
+# (template names, view class) -> (template, file, mtime)
+_template_cache = {}
+
+
+def _template_file(template):
+    origin = getattr(getattr(template, 'template', template), 'origin', None)
+    name = getattr(origin, 'name', None)
+    if name and os.path.isfile(name):
+        return name, os.path.getmtime(name)
+    return None, None
+
+
+def get_template(template_name, view_class=None):
+    """
+    Compiled template of ``template_name``, a template name or a list of
+    names tried in order, cached per (names, view class) so a block does not
+    go through the template loaders each time it renders.
+
+    ``XADMIN_TEMPLATE_CACHE = False`` turns the cache off. With
+    ``XADMIN_TEMPLATE_RELOAD`` (default: ``DEBUG``) a template is compiled
+    again when its file changes.
+
+    Only these direct lookups are cached: the ``{% extends %}`` and
+    ``{% include %}`` of a template still go through the engine loaders.
+    Django caches them with its cached loader, enabled by default when
+    ``DEBUG`` is off and no ``loaders`` are set; with ``DEBUG`` on they are
+    loaded again on every render.
+    """
+    from django.template import loader
+
+    if not isinstance(template_name, six.string_types + (list, tuple)):
+        return template_name
+    if isinstance(template_name, six.string_types):
+        names, resolve = (template_name,), loader.get_template
+    else:
+        names, resolve = tuple(template_name), loader.select_template
+    if not getattr(settings, 'XADMIN_TEMPLATE_CACHE', True):
+        return resolve(template_name)
+
+    key = (names, view_class)
+    cached = _template_cache.get(key)
+    if cached is not None:
+        template, filename, mtime = cached
+        if filename is None or not getattr(settings, 'XADMIN_TEMPLATE_RELOAD', settings.DEBUG):
+            return template
+        try:
+            if os.path.getmtime(filename) == mtime:
+                return template
+        except OSError:
+            pass
+
+    template = resolve(template_name)
+    filename, mtime = _template_file(template)
+    _template_cache[key] = (template, filename, mtime)
+    return template
+
+
+def render_to_string(template_name, context=None, request=None, view_class=None):
+    """
+    ``django.template.loader.render_to_string`` through the template cache of
+    ``get_template``.
+    """
+    return get_template(template_name, view_class).render(context, request)
 
 
 def lookup_needs_distinct(opts, lookup_path):
@@ -479,3 +582,11 @@ def is_related_field(field):
 
 def is_related_field2(field):
     return (hasattr(field, 'remote_field') and field.remote_field != None) or is_related_field(field)
+
+
+def get_auto_now_fields(opts):
+    """
+    Names of the ``auto_now`` fields of a model, which ``save(update_fields=...)``
+    only writes when they are listed.
+    """
+    return [f.name for f in opts.concrete_fields if getattr(f, 'auto_now', False)]
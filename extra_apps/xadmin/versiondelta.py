@@ -0,0 +1,97 @@
+"""
+Delta storage for django-reversion versions.
+
+A delta version keeps only the fields that differ from the latest full
+``json`` snapshot of the same object, with ``format`` set to ``xdelta``::
+
+    {"base": <snapshot version pk>, "model": "app.model", "pk": 1, "fields": {...}}
+
+This module is also a Django serializer for that format: deserializing a
+delta loads its snapshot and applies the fields, so ``Version.field_dict``,
+``Version.revert()`` and the rest of reversion keep working on delta rows.
+It is registered by ``xadmin.plugins.xversion``; processes that read
+versions without loading xadmin plugins can add it to
+``SERIALIZATION_MODULES = {'xdelta': 'xadmin.versiondelta'}``.
+
+Deleting a snapshot does not lose its deltas: ``xadmin.plugins.xversion``
+turns the oldest delta into a snapshot and rebases the others on it first.
+"""
+import json
+
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import Deserializer as JSONDeserializer, Serializer as JSONSerializer
+
+DELTA_FORMAT = 'xdelta'
+SNAPSHOT_FORMAT = 'json'
+
+
+class Serializer(JSONSerializer):
+    """
+    Objects are always serialized as full ``json`` snapshots, deltas are only
+    made from stored versions by ``make_delta``.
+    """
+
+
+def make_delta(base_pk, base_data, data):
+    """
+    Delta of the ``json`` serialized ``data`` against the snapshot
+    ``base_data``, or ``None`` when the delta would not be smaller.
+    """
+    base = json.loads(base_data)[0]
+    current = json.loads(data)[0]
+    if base.get('model') != current.get('model'):
+        return None
+    base_fields = base.get('fields', {})
+    fields = dict((k, v) for k, v in current.get('fields', {}).items()
+                  if k not in base_fields or base_fields[k] != v)
+    delta = json.dumps({'base': base_pk, 'model': current['model'],
+                        'pk': current.get('pk'), 'fields': fields},
+                       ensure_ascii=False, sort_keys=True)
+    if len(delta) >= len(data):
+        return None
+    return delta
+
+
+def delta_base(data):
+    return json.loads(data)['base']
+
+
+def apply_delta(base_data, data):
+    """
+    Full ``json`` serialization of the delta ``data`` over the snapshot
+    ``base_data``.
+    """
+    delta = json.loads(data)
+    obj = json.loads(base_data)[0]
+    obj['pk'] = delta.get('pk', obj.get('pk'))
+    obj.setdefault('fields', {}).update(delta['fields'])
+    return json.dumps([obj], ensure_ascii=False)
+
+
+def expand_delta(data, using=None):
+    """
+    Full ``json`` serialization of a delta, read from its snapshot.
+    """
+    from reversion.models import Version
+
+    base_pk = delta_base(data)
+    versions = Version.objects.using(using) if using else Version.objects
+    try:
+        base_format, base_data = versions.values_list('format', 'serialized_data').get(pk=base_pk)
+    except Version.DoesNotExist:
+        raise DeserializationError("Snapshot version %s of the delta does not exist." % base_pk)
+    if base_format != SNAPSHOT_FORMAT:
+        raise DeserializationError("Snapshot version %s is not a %s version." % (base_pk, SNAPSHOT_FORMAT))
+    return apply_delta(base_data, data)
+
+
+def Deserializer(stream_or_string, **options):
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        data = expand_delta(stream_or_string)
+    except (ValueError, KeyError, TypeError) as e:
+        raise DeserializationError(e)
+    yield from JSONDeserializer(data, **options)
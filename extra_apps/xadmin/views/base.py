@@ -28,9 +28,11 @@ from django.utils.translation import ugettext as _
 from django.views.decorators.csrf import csrf_protect
 from django.views.generic import View
 from collections import OrderedDict
-from xadmin.util import static, json, vendor, sortkeypicker
+from xadmin.util import static, json, orjson, vendor, sortkeypicker, get_class_cache, get_template
 
+from xadmin.bundles import bundle_media
 from xadmin.models import Log
+from xadmin.permissions import get_permission_oracle
 
 csrf_protect_m = method_decorator(csrf_protect)
 
@@ -83,19 +85,30 @@ def filter_hook(func):
     return method
 
 
+def get_block_names(cls):
+    """
+    Names of the blocks a view or plugin class implements (its ``block_*``
+    methods), found once per class.
+    """
+    cache = get_class_cache(cls, 'blocks')
+    if 'names' not in cache:
+        cache['names'] = [name[6:] for name in dir(cls)
+                          if name.startswith('block_') and callable(getattr(cls, name, None))]
+    return cache['names']
+
+
 def inclusion_tag(file_name, context_class=Context, takes_context=False):
     def wrap(func):
         @functools.wraps(func)
         def method(self, context, nodes, *arg, **kwargs):
             _dict = func(self, context, nodes, *arg, **kwargs)
-            from django.template.loader import get_template, select_template
             cls_str = str if six.PY3 else basestring
             if isinstance(file_name, Template):
                 t = file_name
             elif not isinstance(file_name, cls_str) and is_iterable(file_name):
-                t = select_template(file_name)
+                t = get_template(list(file_name), self.__class__)
             else:
-                t = get_template(file_name)
+                t = get_template(file_name, self.__class__)
 
             _dict['autoescape'] = context.autoescape
             _dict['use_l10n'] = context.use_l10n
@@ -129,6 +142,20 @@ class JSONEncoder(DjangoJSONEncoder):
                 return smart_text(o)
 
 
+def dump_json(content):
+    """
+    ``content`` as json, serialized by ``orjson`` when it is installed, with
+    the same output as ``JSONEncoder``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=JSONEncoder().default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(content, cls=JSONEncoder, ensure_ascii=False)
+
+
 class BaseAdminObject(object):
 
     def get_view(self, view_class, option_class=None, *args, **kwargs):
@@ -139,10 +166,10 @@ class BaseAdminObject(object):
         return self.get_view(view_class, self.admin_site._registry.get(model), *args, **kwargs)
 
     def get_admin_url(self, name, *args, **kwargs):
-        return reverse('%s:%s' % (self.admin_site.app_name, name), args=args, kwargs=kwargs)
+        return self.admin_site.reverse('%s:%s' % (self.admin_site.app_name, name), args=args, kwargs=kwargs)
 
     def get_model_url(self, model, name, *args, **kwargs):
-        return reverse(
+        return self.admin_site.reverse(
             '%s:%s_%s_%s' % (self.admin_site.app_name, model._meta.app_label,
                              model._meta.model_name, name),
             args=args, kwargs=kwargs, current_app=self.admin_site.name)
@@ -150,9 +177,19 @@ class BaseAdminObject(object):
     def get_model_perm(self, model, name):
         return '%s.%s_%s' % (model._meta.app_label, name, model._meta.model_name)
 
-    def has_model_perm(self, model, name, user=None):
-        user = user or self.user
-        return user.has_perm(self.get_model_perm(model, name)) or (name == 'view' and self.has_model_perm(model, 'change', user))
+    def has_request_perm(self, perm, obj=None):
+        """
+        ``user.has_perm()`` for the request user, answered once per request
+        (and per object, for permissions with object level rules).
+        """
+        return get_permission_oracle(self.request).has_perm(perm, obj)
+
+    def has_model_perm(self, model, name, user=None, obj=None):
+        if user is not None and user is not self.user:
+            return user.has_perm(self.get_model_perm(model, name), obj) or \
+                (name == 'view' and self.has_model_perm(model, 'change', user, obj))
+        return self.has_request_perm(self.get_model_perm(model, name), obj) or \
+            (name == 'view' and self.has_model_perm(model, 'change', obj=obj))
 
     def get_query_string(self, new_params=None, remove=None):
         if new_params is None:
@@ -196,8 +233,7 @@ class BaseAdminObject(object):
     def render_response(self, content, response_type='json'):
         if response_type == 'json':
             response = HttpResponse(content_type="application/json; charset=UTF-8")
-            response.write(
-                json.dumps(content, cls=JSONEncoder, ensure_ascii=False))
+            response.write(dump_json(content))
             return response
         return HttpResponse(content)
 
@@ -301,6 +337,18 @@ class BaseAdminView(BaseAdminObject, View):
             if result is not False:
                 plugins.append(p)
         self.plugins = plugins
+        self.block_table = self.get_block_table()
+
+    def get_block_table(self):
+        """
+        ``block name -> [bound block methods]`` of the view and its active
+        plugins, in the order ``view_block`` calls them.
+        """
+        table = {}
+        for view in [self] + self.plugins:
+            for name in get_block_names(view.__class__):
+                table.setdefault(name, []).append(getattr(view, 'block_%s' % name))
+        return table
 
     @filter_hook
     def get_context(self):
@@ -308,7 +356,7 @@ class BaseAdminView(BaseAdminObject, View):
 
     @property
     def media(self):
-        return self.get_media()
+        return bundle_media(self.get_media())
 
     @filter_hook
     def get_media(self):
@@ -418,7 +466,7 @@ class CommAdminView(BaseAdminView):
                 elif need_perm == 'super':
                     return self.user.is_superuser
                 else:
-                    return self.user.has_perm(need_perm)
+                    return self.has_request_perm(need_perm)
 
             def filter_item(item):
                 if 'menus' in item:
@@ -543,7 +591,7 @@ class ModelAdminView(CommAdminView):
             return None
 
     def model_admin_url(self, name, *args, **kwargs):
-        return reverse(
+        return self.admin_site.reverse(
             "%s:%s_%s_%s" % (self.admin_site.app_name, self.opts.app_label,
                              self.model_name, name), args=args, kwargs=kwargs)
 
@@ -587,17 +635,17 @@ class ModelAdminView(CommAdminView):
         view_codename = get_permission_codename('view', self.opts)
         change_codename = get_permission_codename('change', self.opts)
 
-        return ('view' not in self.remove_permissions) and (self.user.has_perm('%s.%s' % (self.app_label, view_codename)) or
-                                                            self.user.has_perm('%s.%s' % (self.app_label, change_codename)))
+        return ('view' not in self.remove_permissions) and (self.has_request_perm('%s.%s' % (self.app_label, view_codename), obj) or
+                                                            self.has_request_perm('%s.%s' % (self.app_label, change_codename), obj))
 
     def has_add_permission(self):
         codename = get_permission_codename('add', self.opts)
-        return ('add' not in self.remove_permissions) and self.user.has_perm('%s.%s' % (self.app_label, codename))
+        return ('add' not in self.remove_permissions) and self.has_request_perm('%s.%s' % (self.app_label, codename))
 
     def has_change_permission(self, obj=None):
         codename = get_permission_codename('change', self.opts)
-        return ('change' not in self.remove_permissions) and self.user.has_perm('%s.%s' % (self.app_label, codename))
+        return ('change' not in self.remove_permissions) and self.has_request_perm('%s.%s' % (self.app_label, codename), obj)
 
-    def has_delete_permission(self, request=None, obj=None):
+    def has_delete_permission(self, obj=None):
         codename = get_permission_codename('delete', self.opts)
-        return ('delete' not in self.remove_permissions) and self.user.has_perm('%s.%s' % (self.app_label, codename))
+        return ('delete' not in self.remove_permissions) and self.has_request_perm('%s.%s' % (self.app_label, codename), obj)
@@ -1,31 +1,37 @@
+import hashlib
+import logging
+
 from django import forms
 from django.apps import apps
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.urls.base import reverse, NoReverseMatch
 from django.template.context_processors import csrf
 from django.db.models.base import ModelBase
 from django.forms.forms import DeclarativeFieldsMetaclass
 from django.forms.utils import flatatt
-from django.template import loader
-from django.http import Http404
+from django.http import Http404, HttpResponse
 from django.test.client import RequestFactory
 from django.utils.encoding import force_text, smart_text
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
+from django.utils import translation
 from django.utils.translation import ugettext as _
 from django.utils.http import urlencode, urlquote
 from django.views.decorators.cache import never_cache
 from xadmin import widgets as exwidgets
 from xadmin.layout import FormHelper
-from xadmin.models import UserSettings, UserWidget
+from xadmin.models import UserWidget, get_user_settings
 from xadmin.plugins.utils import get_context_dict
 from xadmin.sites import site
 from xadmin.views.base import CommAdminView, ModelAdminView, filter_hook, csrf_protect_m
 from xadmin.views.edit import CreateAdminView
 from xadmin.views.list import ListAdminView
-from xadmin.util import unquote
+from xadmin.util import unquote, json, render_to_string
 import copy
 
+logger = logging.getLogger('xadmin.dashboard')
+
 
 class WidgetTypeSelect(forms.Widget):
 
@@ -77,6 +83,8 @@ class UserWidgetAdmin(object):
     list_display_links = ('widget_type',)
     user_fields = ['user']
     hidden_menu = True
+    # the widget type field depends on the page of the request.
+    cache_model_form = False
 
     wizard_form_list = (
         (_(u"Widget Type"), ('page_id', 'widget_type')),
@@ -124,15 +132,14 @@ class UserWidgetAdmin(object):
         return UserWidget.objects.filter(user=self.user)
 
     def update_dashboard(self, obj):
-        try:
-            portal_pos = UserSettings.objects.get(
-                user=obj.user, key="dashboard:%s:pos" % obj.page_id)
-        except UserSettings.DoesNotExist:
+        store = get_user_settings(obj.user)
+        key = "dashboard:%s:pos" % obj.page_id
+        portal_pos = store.get(key)
+        if portal_pos is None:
             return
         pos = [[w for w in col.split(',') if w != str(
-            obj.id)] for col in portal_pos.value.split('|')]
-        portal_pos.value = '|'.join([','.join(col) for col in pos])
-        portal_pos.save()
+            obj.id)] for col in portal_pos.split('|')]
+        store.set(key, '|'.join([','.join(col) for col in pos]))
 
     def delete_model(self):
         self.update_dashboard(self.obj)
@@ -217,7 +224,7 @@ class BaseWidget(forms.Form):
                    'widget_type': self.widget_type, 'form': self, 'widget': self}
         context.update(csrf(self.request))
         self.context(context)
-        return loader.render_to_string(self.template, context)
+        return render_to_string(self.template, context)
 
     def context(self, context):
         pass
@@ -485,6 +492,66 @@ class AddFormWidget(ModelBaseWidget, PartialBaseWidget):
         return self.add_view.media + self.add_view.form_obj.media + self.vendor('xadmin.plugin.quick-form.js')
 
 
+class LazyWidget(object):
+    """
+    Placeholder of a widget on the dashboard page, the widget itself is
+    loaded by ``xadmin.page.dashboard.js`` from ``?_widget=<id>``.
+    """
+    template = 'xadmin/widgets/lazy.html'
+
+    def __init__(self, dashboard, user_widget):
+        widget_class = widget_manager.get(user_widget.widget_type)
+        self.dashboard = dashboard
+        self.id = user_widget.id
+        self.widget_type = user_widget.widget_type
+        self.widget_icon = widget_class.widget_icon
+        self.title = user_widget.get_value().get('title') or widget_class.base_title or ''
+
+    @property
+    def widget(self):
+        request = self.dashboard.request
+        return render_to_string(self.template, {
+            'widget_id': self.id, 'widget_title': self.title, 'widget_icon': self.widget_icon,
+            'widget_type': self.widget_type, 'widget': self,
+            'widget_url': '%s?%s' % (request.path, urlencode({'_widget': self.id})),
+            'render_url': '%s?%s' % (request.path, urlencode({'_render': 1})),
+        })
+
+    def media(self):
+        return forms.Media()
+
+
+class RenderedWidget(object):
+    """
+    Html and media of a rendered widget, as stored in the widget cache. It is
+    used on the page in place of the widget instance.
+    """
+
+    def __init__(self, id, html, js=(), css=None):
+        self.id = id
+        self.html = html
+        self.js = list(js)
+        self.css = css or {}
+
+    @classmethod
+    def from_widget(cls, widget):
+        media = widget.media()
+        return cls(widget.id, widget.widget,
+                   [media.absolute_path(path) for path in media._js],
+                   dict((medium, [media.absolute_path(path) for path in paths])
+                        for medium, paths in media._css.items()))
+
+    @property
+    def widget(self):
+        return self.html
+
+    def media(self):
+        return forms.Media(js=self.js, css=self.css)
+
+    def as_dict(self):
+        return {'id': self.id, 'html': self.html, 'js': self.js, 'css': self.css}
+
+
 class Dashboard(CommAdminView):
 
     widget_customiz = True
@@ -492,6 +559,11 @@ class Dashboard(CommAdminView):
     title = _(u"Dashboard")
     icon = None
 
+    # render widgets as placeholders loaded over ajax.
+    widget_lazy = True
+    # seconds a rendered widget is cached for its user, 0 disables the cache.
+    widget_cache_timeout = 300
+
     def get_page_id(self):
         return self.request.path
 
@@ -534,9 +606,9 @@ class Dashboard(CommAdminView):
                     continue
             portal.append(portal_col)
 
-        UserSettings(
-            user=self.user, key="dashboard:%s:pos" % self.get_page_id(),
-            value='|'.join([','.join([str(w.id) for w in col]) for col in portal])).save()
+        get_user_settings(self.user).set(
+            "dashboard:%s:pos" % self.get_page_id(),
+            '|'.join([','.join([str(w.id) for w in col]) for col in portal]))
 
         return portal
 
@@ -544,10 +616,8 @@ class Dashboard(CommAdminView):
     def get_widgets(self):
 
         if self.widget_customiz:
-            portal_pos = UserSettings.objects.filter(
-                user=self.user, key=self.get_portal_key())
-            if len(portal_pos):
-                portal_pos = portal_pos[0].value
+            portal_pos = get_user_settings(self.user).get(self.get_portal_key())
+            if portal_pos is not None:
                 widgets = []
 
                 if portal_pos:
@@ -558,16 +628,92 @@ class Dashboard(CommAdminView):
                             try:
                                 widget = user_widgets.get(int(wid))
                                 if widget:
-                                    ws.append(self.get_widget(widget))
+                                    ws.append(widget)
                             except Exception as e:
-                                import logging
-                                logging.error(e, exc_info=True)
+                                logger.error(e, exc_info=True)
                         widgets.append(ws)
 
-                return widgets
+                if self.widget_lazy and not self.request.GET.get('_render'):
+                    return [self.get_lazy_widgets(ws) for ws in widgets]
+                return self.render_widgets(widgets)
 
         return self.get_init_widget()
 
+    def get_lazy_widgets(self, user_widgets):
+        widgets = []
+        for user_widget in user_widgets:
+            try:
+                if self.has_widget_perm(user_widget):
+                    widgets.append(LazyWidget(self, user_widget))
+            except Exception as e:
+                logger.error(e, exc_info=True)
+        return widgets
+
+    def has_widget_perm(self, user_widget):
+        """
+        The ``has_perm()`` of a user widget, asked on a bare instance of its
+        class: making the widget runs its ``setup()``, which builds the admin
+        view of list and form widgets.
+        """
+        if self.user.is_superuser:
+            return True
+        widget_class = widget_manager.get(user_widget.widget_type)
+        widget = widget_class.__new__(widget_class)
+        widget.dashboard, widget.admin_site = self, self.admin_site
+        widget.request, widget.user = self.request, self.user
+        if issubclass(widget_class, ModelBaseWidget):
+            widget.model = widget_class.base_fields['model'].to_python(user_widget.get_value().get('model'))
+        return bool(widget.has_perm())
+
+    def get_widget_cache_key(self, user_widget):
+        key = '%s|%s|%s|%s|%s' % (self.user.pk, user_widget.pk, user_widget.value,
+                                  translation.get_language(), self.request.session.session_key)
+        return 'xadmin.dashboard.widget.%s' % hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    @filter_hook
+    def render_widget(self, user_widget):
+        """
+        Render one widget, through the per user and widget cache. The cache key
+        covers the widget params, so a changed widget is never served stale.
+        """
+        # checked before the cache lookup, so a cached widget is only served
+        # while its user still has the permission of the widget.
+        if not self.has_widget_perm(user_widget):
+            raise PermissionDenied
+        cache_key = self.get_widget_cache_key(user_widget)
+        if self.widget_cache_timeout:
+            data = cache.get(cache_key)
+            if data is not None:
+                return RenderedWidget(**data)
+        rendered = RenderedWidget.from_widget(self.get_widget(user_widget))
+        if self.widget_cache_timeout:
+            cache.set(cache_key, rendered.as_dict(), self.widget_cache_timeout)
+        return rendered
+
+    def render_widgets(self, columns):
+        """
+        Render the widgets of all columns, a widget that fails is logged and
+        left out of the page.
+        """
+        widgets = []
+        for col in columns:
+            ws = []
+            for user_widget in col:
+                try:
+                    ws.append(self.render_widget(user_widget))
+                except Exception as e:
+                    logger.error(e, exc_info=True)
+            widgets.append(ws)
+        return widgets
+
+    def get_widget_response(self, widget_id):
+        try:
+            user_widget = UserWidget.objects.get(user=self.user, page_id=self.get_page_id(), id=int(widget_id))
+        except (ValueError, UserWidget.DoesNotExist):
+            raise Http404
+        return HttpResponse(json.dumps(self.render_widget(user_widget).as_dict()),
+                            content_type='application/json')
+
     @filter_hook
     def get_title(self):
         return self.title
@@ -589,6 +735,8 @@ class Dashboard(CommAdminView):
 
     @never_cache
     def get(self, request, *args, **kwargs):
+        if '_widget' in request.GET:
+            return self.get_widget_response(request.GET['_widget'])
         self.widgets = self.get_widgets()
         return self.template_response('xadmin/views/dashboard.html', self.get_context())
 
@@ -604,14 +752,13 @@ class Dashboard(CommAdminView):
                     widget = UserWidget.objects.get(
                         user=self.user, page_id=self.get_page_id(), id=widget_id)
                     widget.delete()
-                    try:
-                        portal_pos = UserSettings.objects.get(user=self.user, key="dashboard:%s:pos" % self.get_page_id())
+                    store = get_user_settings(self.user)
+                    key = "dashboard:%s:pos" % self.get_page_id()
+                    portal_pos = store.get(key)
+                    if portal_pos is not None:
                         pos = [[w for w in col.split(',') if w != str(
-                            widget_id)] for col in portal_pos.value.split('|')]
-                        portal_pos.value = '|'.join([','.join(col) for col in pos])
-                        portal_pos.save()
-                    except Exception:
-                        pass
+                            widget_id)] for col in portal_pos.split('|')]
+                        store.set(key, '|'.join([','.join(col) for col in pos]))
                 except UserWidget.DoesNotExist:
                     pass
 
@@ -663,5 +810,7 @@ class ModelDashboard(Dashboard, ModelAdminView):
 
     @never_cache
     def get(self, request, *args, **kwargs):
+        if '_widget' in request.GET:
+            return self.get_widget_response(request.GET['_widget'])
         self.widgets = self.get_widgets()
         return self.template_response(self.get_template_list('views/model_dashboard.html'), self.get_context())
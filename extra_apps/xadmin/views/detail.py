@@ -8,7 +8,6 @@ from django.core.exceptions import PermissionDenied, ObjectDoesNotExist
 from django.db import models
 from django.forms.models import modelform_factory
 from django.http import Http404
-from django.template import loader
 from django.template.response import TemplateResponse
 from django.utils import six
 from django.utils.encoding import force_text, smart_text
@@ -17,7 +16,7 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext as _
 from django.utils.html import conditional_escape
 from xadmin.layout import FormHelper, Layout, Fieldset, Container, Column, Field, Col, TabHolder
-from xadmin.util import unquote, lookup_field, display_for_field, boolean_icon, label_for_field
+from xadmin.util import unquote, lookup_field, display_for_field, boolean_icon, label_for_field, render_to_string
 
 from .base import ModelAdminView, filter_hook, csrf_protect_m
 
@@ -51,10 +50,10 @@ class ShowField(Field):
             if field in form.fields:
                 if form.fields[field].widget != forms.HiddenInput:
                     extra_context['field'] = form[field]
-                    html += loader.render_to_string(self.template, extra_context)
+                    html += render_to_string(self.template, extra_context)
             else:
                 extra_context['field'] = field
-                html += loader.render_to_string(self.template, extra_context)
+                html += render_to_string(self.template, extra_context)
         return html
 
 
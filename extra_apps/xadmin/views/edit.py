@@ -13,12 +13,11 @@ from django.utils import six
 from django.utils.encoding import force_text
 from django.utils.html import escape
 from django.utils.text import capfirst, get_text_list
-from django.template import loader
 from django.utils.translation import ugettext as _
 from django.forms.widgets import Media
 from xadmin import widgets
 from xadmin.layout import FormHelper, Layout, Fieldset, TabHolder, Container, Column, Col, Field
-from xadmin.util import unquote
+from xadmin.util import unquote, render_to_string, get_class_cache
 from xadmin.views.detail import DetailAdminUtil
 
 from .base import ModelAdminView, filter_hook, csrf_protect_m
@@ -57,7 +56,7 @@ class ReadOnlyField(Field):
         for field in self.fields:
             result = self.detail.get_field_result(field)
             field = {'auto_id': field}
-            html += loader.render_to_string(
+            html += render_to_string(
                 self.template, {'field': field, 'result': result})
         return html
 
@@ -78,6 +77,9 @@ class ModelFormAdminView(ModelAdminView):
 
     form_layout = None
 
+    # build the form classes once per merged view class, see ``get_model_form_cache_key``.
+    cache_model_form = True
+
     def __init__(self, request, *args, **kwargs):
         overrides = FORMFIELD_FOR_DBFIELD_DEFAULTS.copy()
         overrides.update(self.formfield_overrides)
@@ -182,14 +184,60 @@ class ModelFormAdminView(ModelAdminView):
         if defaults['fields'] is None and not modelform_defines_fields(defaults['form']):
             defaults['fields'] = forms.ALL_FIELDS
 
-        return modelform_factory(self.model, **defaults)
-
         try:
-            return modelform_factory(self.model, **defaults)
+            return self.model_form_factory(**defaults)
         except FieldError as e:
             raise FieldError('%s. Check fields/fieldsets/exclude attributes of class %s.'
                              % (e, self.__class__.__name__))
 
+    @filter_hook
+    def get_model_form_cache_key(self, callback_key, **defaults):
+        """
+        Key of the form class ``modelform_factory`` builds from ``defaults``,
+        or None to build it on every request. Plugins whose form fields
+        depend on the request (e.g. on the permissions of the user) add that
+        state to the key, or return None.
+        """
+        if not self.cache_model_form or callback_key is None:
+            return None
+        items = []
+        for name, value in sorted(defaults.items()):
+            if isinstance(value, list):
+                value = tuple(value)
+            items.append((name, value))
+        key = (callback_key, tuple(items), tuple(p.__class__ for p in self.plugins))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def model_form_factory(self, callback_key=None, **defaults):
+        """
+        ``modelform_factory(self.model, **defaults)``, cached per merged view
+        class. A ``formfield_callback`` other than a method of this view must
+        be described by ``callback_key`` for the form class to be cached.
+
+        The form fields are kept in the cached class, a form instance gets
+        copies of them, with fresh querysets.
+        """
+        callback = defaults.get('formfield_callback')
+        if callback_key is None:
+            if callback is None:
+                callback_key = ''
+            elif getattr(callback, '__self__', None) is self:
+                callback_key = callback.__name__
+        key = self.get_model_form_cache_key(
+            callback_key, **dict((k, v) for k, v in defaults.items() if k != 'formfield_callback'))
+        if key is None:
+            return modelform_factory(self.model, **defaults)
+
+        cache = get_class_cache(self.__class__, 'model_form')
+        form_class = cache.get(key)
+        if form_class is None:
+            form_class = cache[key] = modelform_factory(self.model, **defaults)
+        return form_class
+
     @filter_hook
     def get_form_layout(self):
         layout = copy.deepcopy(self.form_layout)
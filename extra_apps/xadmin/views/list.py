@@ -1,19 +1,20 @@
 from __future__ import absolute_import
 from collections import OrderedDict
-from django.core.exceptions import PermissionDenied, ObjectDoesNotExist
+from django.core.exceptions import PermissionDenied
 from django.core.paginator import InvalidPage, Paginator
-from django.urls.base import NoReverseMatch
 from django.db import models
 from django.http import HttpResponseRedirect
 from django.template.response import SimpleTemplateResponse, TemplateResponse
 from django.utils import six
-from django.utils.encoding import force_text, smart_text
+from django.utils.encoding import force_text
 from django.utils.html import escape, conditional_escape
 from django.utils.safestring import mark_safe
 from django.utils.text import capfirst
-from django.utils.translation import ugettext as _
+from django.utils.formats import localize
+from django.utils.translation import get_language, ugettext as _
 
-from xadmin.util import lookup_field, display_for_field, label_for_field, boolean_icon
+from xadmin.formatters import make_column_formatter
+from xadmin.util import get_class_cache, label_for_field
 
 from .base import ModelAdminView, filter_hook, inclusion_tag, csrf_protect_m
 
@@ -47,17 +48,49 @@ class ResultRow(dict):
     pass
 
 
+class LazyList(object):
+    """
+    List attribute of a result cell, allocated on first access. Most cells
+    never get classes, buttons or menus, so they are only stored in the
+    ``_<name>`` slot when somebody asks for them.
+    """
+
+    def __init__(self, name):
+        self.slot = '_' + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = []
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
 class ResultItem(object):
+    # '__dict__' keeps the attributes plugins add to the cells working.
+    __slots__ = ('_classes', 'text', '_wraps', 'tag', '_tag_attrs', 'allow_tags', '_btns', '_menus',
+                 'is_display_link', 'row', 'field_name', 'field', 'attr', 'value', '__dict__')
+
+    classes = LazyList('classes')
+    wraps = LazyList('wraps')
+    tag_attrs = LazyList('tag_attrs')
+    btns = LazyList('btns')
+    menus = LazyList('menus')
 
     def __init__(self, field_name, row):
-        self.classes = []
+        self._classes = None
         self.text = '&nbsp;'
-        self.wraps = []
+        self._wraps = None
         self.tag = 'td'
-        self.tag_attrs = []
+        self._tag_attrs = None
         self.allow_tags = False
-        self.btns = []
-        self.menus = []
+        self._btns = None
+        self._menus = None
         self.is_display_link = False
         self.row = row
         self.field_name = field_name
@@ -71,18 +104,27 @@ class ResultItem(object):
             self.text) if self.allow_tags else conditional_escape(self.text)
         if force_text(text) == '':
             text = mark_safe('&nbsp;')
-        for wrap in self.wraps:
+        for wrap in self._wraps or ():
             text = mark_safe(wrap % text)
         return text
 
     @property
     def tagattrs(self):
         return mark_safe(
-            '%s%s' % ((self.tag_attrs and ' '.join(self.tag_attrs) or ''),
-                      (self.classes and (' class="%s"' % ' '.join(self.classes)) or '')))
+            '%s%s' % ((self._tag_attrs and ' '.join(self._tag_attrs) or ''),
+                      (self._classes and (' class="%s"' % ' '.join(self._classes)) or '')))
+
+    @property
+    def has_btns(self):
+        return bool(self._btns)
+
+    @property
+    def has_menus(self):
+        return bool(self._menus)
 
 
 class ResultHeader(ResultItem):
+    __slots__ = ('sortable', 'sorted', 'ascending', 'sort_priority', 'url_primary', 'url_remove', 'url_toggle')
 
     def __init__(self, field_name, row):
         super(ResultHeader, self).__init__(field_name, row)
@@ -98,6 +140,61 @@ class ResultHeader(ResultItem):
         self.url_toggle = None
 
 
+def render_value(value):
+    """
+    A template variable as ``{{ value }}`` renders it with autoescaping on.
+    """
+    return conditional_escape(localize(value))
+
+
+def render_cell(item):
+    """
+    The ``<td>`` of a result cell, as rendered by ``views/model_list.html``
+    but without going through ``ResultItem.label``.
+    """
+    text = item.text
+    text = force_text(text) if item.allow_tags else conditional_escape(text)
+    if text == '':
+        text = '&nbsp;'
+    for wrap in item._wraps or ():
+        text = wrap % text
+
+    parts = ['<td ', item.tagattrs, '>']
+    if item._btns:
+        parts.append('<div class="btn-group pull-right">')
+        parts.extend(force_text(b) for b in item._btns)
+        parts.append('</div>')
+    if item._menus:
+        parts.extend(('<div class="dropdown"><a class="dropdown-toggle" data-toggle="dropdown" href="#">',
+                      text, '</a><ul class="dropdown-menu">'))
+        parts.extend(force_text(m) for m in item._menus)
+        parts.append('</ul></div>')
+    else:
+        parts.append(text)
+    parts.append('</td>')
+    return ''.join(parts)
+
+
+def render_result_rows(context, results, row_blocks=True):
+    """
+    The rows of the results table body, built from the row data directly.
+    The markup is the one of ``views/model_list.html`` up to whitespace,
+    with the same escaping.
+    """
+    if row_blocks:
+        from xadmin.templatetags.xadmin_tags import view_block
+    output = []
+    for row in results:
+        css_class = row.get('css_class')
+        output.append('<tr class="grid-item%s" %s>' % (
+            (' ' + render_value(css_class)) if css_class else '', render_value(row.get('tagattrs', ''))))
+        output.extend(render_cell(item) for item in row.cells)
+        output.append('</tr>\n')
+        if row_blocks:
+            output.append(view_block(context, 'result_row', row))
+    return ''.join(output)
+
+
 class ListAdminView(ModelAdminView):
     """
     Display models objects view. this class has ordering and simple filter features.
@@ -115,6 +212,8 @@ class ListAdminView(ModelAdminView):
 
     # Change list templates
     object_list_template = None
+    # build the results table body in python instead of the template
+    list_fast_renderer = False
 
     def init_request(self, *args, **kwargs):
 
@@ -347,19 +446,79 @@ class ListAdminView(ModelAdminView):
                 fields.append(f.name)
         return self.get_query_string({COL_LIST_VAR: '.'.join(fields)})
 
+    @classmethod
+    def get_class_method_fields(cls):
+        """
+        The ``is_column`` methods of the view class, found once per class.
+        """
+        cache = get_class_cache(cls, 'list')
+        if 'method_fields' not in cache:
+            methods = []
+            for name in dir(cls):
+                try:
+                    if getattr(getattr(cls, name), 'is_column', False):
+                        methods.append((name, getattr(cls, name)))
+                except:
+                    pass
+            cache['method_fields'] = dict(
+                (name, FakeMethodField(name, getattr(method, 'short_description', capfirst(name.replace('_', ' ')))))
+                for name, method in methods)
+        return cache['method_fields']
+
+    @classmethod
+    def get_class_model_fields(cls):
+        cache = get_class_cache(cls, 'list')
+        if 'model_fields' not in cache:
+            cache['model_fields'] = list(cls.model._meta.fields)
+        return cache['model_fields']
+
     def get_model_method_fields(self):
         """
         Return the fields info defined in model. use FakeMethodField class wrap method as a db field.
         """
-        methods = []
-        for name in dir(self):
+        fields = dict(self.get_class_method_fields())
+        # columns plugins set on the view for this request
+        for name, method in self.__dict__.items():
+            if getattr(method, 'is_column', False):
+                fields[name] = FakeMethodField(name, getattr(method, 'short_description', capfirst(name.replace('_', ' '))))
+        return [fields[name] for name in sorted(fields)]
+
+    @classmethod
+    def get_class_field_label(cls, field_name, model_admin=None):
+        """
+        ``(text, attr name, attr)`` of a column header, resolved once per
+        class and language, as ``label_for_field()`` translates some labels.
+        Methods of the view are kept by name, never bound.
+        """
+        cache = get_class_cache(cls, 'labels')
+        key = (field_name, get_language())
+        if key not in cache:
+            model_admin = model_admin or cls
+            text, attr = label_for_field(field_name, cls.model, model_admin=model_admin, return_attr=True)
+            if attr is not None and field_name != '__str__' and not callable(field_name) \
+                    and hasattr(model_admin, field_name):
+                cache[key] = (text, field_name, None)
+            else:
+                cache[key] = (text, None, attr)
+        return cache[key]
+
+    def get_field_label(self, field_name):
+        if not callable(field_name) and field_name in self.__dict__:
+            return label_for_field(field_name, self.model, model_admin=self, return_attr=True)
+        text, attr_name, attr = self.get_class_field_label(field_name, self)
+        if attr_name is not None:
+            attr = getattr(self, attr_name)
+        return text, attr
+
+    @classmethod
+    def warm_class_cache(cls):
+        cls.get_class_method_fields()
+        cls.get_class_model_fields()
+        for field_name in cls.list_display:
             try:
-                if getattr(getattr(self, name), 'is_column', False):
-                    methods.append((name, getattr(self, name)))
-            except:
+                cls.get_class_field_label(field_name)
+            except AttributeError:
                 pass
-        return [FakeMethodField(name, getattr(method, 'short_description', capfirst(name.replace('_', ' '))))
-                for name, method in methods]
 
     @filter_hook
     def get_context(self):
@@ -368,7 +527,8 @@ class ListAdminView(ModelAdminView):
         """
         self.title = _('%s List') % force_text(self.opts.verbose_name)
         model_fields = [(f, f.name in self.list_display, self.get_check_field_url(f))
-                        for f in (list(self.opts.fields) + self.get_model_method_fields()) if f.name not in self.list_exclude]
+                        for f in (self.get_class_model_fields() + self.get_model_method_fields())
+                        if f.name not in self.list_exclude]
 
         new_context = {
             'model_name': force_text(self.opts.verbose_name_plural),
@@ -436,10 +596,7 @@ class ListAdminView(ModelAdminView):
     def result_header(self, field_name, row):
         ordering_field_columns = self.ordering_field_columns
         item = ResultHeader(field_name, row)
-        text, attr = label_for_field(field_name, self.model,
-                                     model_admin=self,
-                                     return_attr=True
-                                     )
+        text, attr = self.get_field_label(field_name)
         item.text = text
         item.attr = attr
         if attr and not getattr(attr, "admin_order_field", None):
@@ -530,36 +687,14 @@ class ListAdminView(ModelAdminView):
         Generates the actual list of data.
         """
         item = ResultItem(field_name, row)
-        try:
-            f, attr, value = lookup_field(field_name, obj, self)
-        except (AttributeError, ObjectDoesNotExist, NoReverseMatch):
-            item.text = mark_safe("<span class='text-muted'>%s</span>" % EMPTY_CHANGELIST_VALUE)
-        else:
-            if f is None:
-                item.allow_tags = getattr(attr, 'allow_tags', False)
-                boolean = getattr(attr, 'boolean', False)
-                if boolean:
-                    item.allow_tags = True
-                    item.text = boolean_icon(value)
-                else:
-                    item.text = smart_text(value)
-            else:
-                if isinstance(f.remote_field, models.ManyToOneRel):
-                    field_val = getattr(obj, f.name)
-                    if field_val is None:
-                        item.text = mark_safe("<span class='text-muted'>%s</span>" % EMPTY_CHANGELIST_VALUE)
-                    else:
-                        item.text = field_val
-                else:
-                    item.text = display_for_field(value, f)
-                if isinstance(f, models.DateField)\
-                    or isinstance(f, models.TimeField)\
-                        or isinstance(f, models.ForeignKey):
-                    item.classes.append('nowrap')
-
-            item.field = f
-            item.attr = attr
-            item.value = value
+        cell = self.get_column_formatter(field_name).get(obj)
+        item.text = cell.text
+        item.allow_tags = cell.allow_tags
+        item.field = cell.field
+        item.attr = cell.attr
+        item.value = cell.value
+        if isinstance(cell.field, (models.DateField, models.TimeField, models.ForeignKey)):
+            item.classes.append('nowrap')
 
         # If list_display_links not defined, add the link tag to the first field
         if (item.row['is_display_first'] and not self.list_display_links) \
@@ -590,10 +725,25 @@ class ListAdminView(ModelAdminView):
             obj, field_name, row) for field_name in self.list_display]
         return row
 
+    @filter_hook
+    def get_column_formatter(self, field_name):
+        """
+        The ``xadmin.formatters`` formatter of a ``list_display`` column,
+        made once per column for the request.
+        """
+        if not hasattr(self, '_column_formatters'):
+            self._column_formatters = {}
+        if field_name not in self._column_formatters:
+            self._column_formatters[field_name] = make_column_formatter(self, field_name)
+        return self._column_formatters[field_name]
+
     @filter_hook
     def results(self):
+        result_list = list(self.result_list)
+        for field_name in self.list_display:
+            self.get_column_formatter(field_name).format_column(result_list)
         results = []
-        for obj in self.result_list:
+        for obj in result_list:
             results.append(self.result_row(obj))
         return results
 
@@ -610,6 +760,10 @@ class ListAdminView(ModelAdminView):
         return media
 
     # Blocks
+    def block_results_body(self, context, nodes):
+        row_blocks = bool(self.block_table.get('result_row'))
+        return render_result_rows(context, context['results'], row_blocks)
+
     @inclusion_tag('xadmin/includes/pagination.html')
     def block_pagination(self, context, nodes, page_type='normal'):
         """
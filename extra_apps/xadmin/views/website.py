@@ -9,7 +9,7 @@ from django.http import HttpResponse
 from .base import BaseAdminView, filter_hook
 from .dashboard import Dashboard
 from xadmin.forms import AdminAuthenticationForm
-from xadmin.models import UserSettings
+from xadmin.models import get_user_settings
 from xadmin.layout import FormHelper
 
 
@@ -27,10 +27,7 @@ class UserSettingView(BaseAdminView):
     def post(self, request):
         key = request.POST['key']
         val = request.POST['value']
-        us, created = UserSettings.objects.get_or_create(
-            user=self.user, key=key)
-        us.value = val
-        us.save()
+        get_user_settings(self.user).set(key, val)
         return HttpResponse('')
 
 
@@ -128,6 +128,5 @@ STATIC_URL = '/static/'
 AUTH_USER_MODEL = 'account.MyUser'
 APPEND_SLASH = True
 AUTHENTICATION_BACKENDS = (
-    'rules.permissions.ObjectPermissionBackend',
-    'account.mybackends.MyModelBackend',
+    'account.mybackends.MyModelBackend',  # 先查权限集合，有rules规则时才执行规则
 )
@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'piecework.settings')
 
 application = get_wsgi_application()
+
+# 预先生成 xadmin 视图类及其缓存, 只在服务进程中执行
+from xadmin import site
+site.warm_up()